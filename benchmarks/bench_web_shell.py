@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+# Part of Web Shell. See LICENSE file for full copyright and licensing details.
+# Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+
+"""
+Benchmarks for the server-side hot paths of web_shell.
+
+Runs against a local PostgreSQL database where web_shell is installed, on a
+generated dataset: synthetic Odoo-formatted log files in a temporary
+directory and a deep ir.ui.view inheritance chain created inside the
+benchmark transaction (rolled back at the end, nothing is left behind).
+
+    python benchmarks/bench_web_shell.py -c odoo.conf -d bench_db \\
+        --baseline benchmarks/bench_results.json
+
+Results are written as JSON, by default to benchmarks/bench_results.json
+(git-ignored). With --baseline, read before the results are written so it
+can be the previous run's output, every benchmark whose median
+is slower than the baseline by more than the threshold (--threshold 0.25 =
+25%, per benchmark with --threshold-for name=0.5) is reported and the
+script exits with status 1.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+_logger = logging.getLogger("web_shell.benchmarks")
+
+# Next to this script, not in the working directory (ignored by git)
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_results.json")
+
+LOG_LEVELS = ["INFO"] * 12 + ["DEBUG"] * 4 + ["WARNING"] * 2 + ["ERROR", "CRITICAL"]
+LOG_LOGGERS = [
+    "werkzeug",
+    "odoo.addons.base.models.ir_http",
+    "odoo.addons.sale.models.sale_order",
+    "odoo.models.unlink",
+    "odoo.sql_db",
+]
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+def measure(fn, runs, warmup=1, items=None):
+    """
+    Calls fn() warmup + runs times and returns timing statistics in ms.
+    `items` (units of work per call) adds a throughput figure.
+    """
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    result = {
+        "runs": runs,
+        "min_ms": round(samples[0], 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 4),
+        "mean_ms": round(statistics.fmean(samples), 4),
+    }
+    if items:
+        result["items"] = items
+        result["per_item_us"] = round(result["median_ms"] * 1000 / items, 4)
+        result["items_per_s"] = round(items / (result["median_ms"] / 1000)) if result["median_ms"] else None
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Dataset
+# ---------------------------------------------------------------------------
+
+
+def _log_block(rnd, lines):
+    """A block of Odoo-formatted log lines, some of them long (tracebacks, SQL)."""
+    out = []
+    for i in range(lines):
+        level = rnd.choice(LOG_LEVELS)
+        message = f"request {i} handled in {rnd.random():.3f}s"
+        if rnd.random() < 0.05:
+            message += " " + "SELECT id FROM res_partner WHERE active AND " * rnd.randint(5, 40)
+        out.append(
+            f"2025-12-21 02:{i // 60 % 60:02d}:{i % 60:02d},{i % 1000:03d} {1000 + i % 8} "
+            f"{level} bench {rnd.choice(LOG_LOGGERS)}: {message}\n"
+        )
+    return "".join(out)
+
+
+def generate_log_file(directory, size_mb, seed=42):
+    """Writes a synthetic log of ~size_mb MB by repeating a 1 MB block."""
+    rnd = random.Random(seed)
+    block = _log_block(rnd, 4000)
+    block = (block * (1024 * 1024 // len(block) + 1))[: 1024 * 1024]
+    block = block[: block.rindex("\n") + 1]
+    path = os.path.join(directory, "odoo-bench.log")
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(size_mb):
+            f.write(block)
+    return path
+
+
+def create_view_chain(env, depth, model="res.partner"):
+    """A form view and a chain of `depth` extensions, each inheriting the previous one."""
+    View = env["ir.ui.view"]
+    base = View.create(
+        {
+            "name": "web_shell.bench.base",
+            "model": model,
+            "type": "form",
+            "arch": "<form><group name='g0'><separator string='s0'/></group></form>",
+        }
+    )
+    parent = base
+    for i in range(1, depth + 1):
+        parent = View.create(
+            {
+                "name": f"web_shell.bench.ext{i}",
+                "model": model,
+                "inherit_id": parent.id,
+                "mode": "extension",
+                "arch": (
+                    f"<xpath expr=\"//group[@name='g{i - 1}']\" position=\"after\">"
+                    f"<group name='g{i}'><separator string='s{i}'/></group>"
+                    f"</xpath>"
+                ),
+            }
+        )
+    return base, parent
+
+
+def widest_model(env):
+    """The stored model with the most fields that has at least one record."""
+    for name in sorted(env.registry, key=lambda n: len(env.registry[n]._fields), reverse=True):
+        Model = env[name]
+        if Model._abstract or Model._transient or not Model._auto:
+            continue
+        record = Model.sudo().search([], limit=1)
+        if record:
+            return name, record.id
+    return "res.partner", env.user.partner_id.id
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+
+def bench_read_logs(ctx):
+    Console = ctx.console
+    size = os.path.getsize(ctx.log_file)
+    one_mb = 1024 * 1024
+    results = {
+        "read_logs.tail": measure(lambda: Console.read_logs(0, 1000), ctx.runs),
+        "read_logs.incremental_1mb": measure(
+            lambda: Console.read_logs(max(1, size - one_mb), 1000), ctx.runs
+        ),
+        # The whole file is behind the client's position: worst case of a stale panel
+        "read_logs.catch_up": measure(lambda: Console.read_logs(1, 1000), max(1, ctx.runs // 5), warmup=0),
+    }
+    results["read_logs.incremental_1mb"]["mb_per_s"] = round(
+        1 / (results["read_logs.incremental_1mb"]["median_ms"] / 1000), 2
+    )
+    results["read_logs.catch_up"]["file_mb"] = round(size / one_mb, 1)
+    return results
+
+
+def bench_parse_log_line(ctx):
+    lines = _log_block(random.Random(7), 100000).splitlines()
+    parse = ctx.console._parse_log_line
+
+    def run():
+        for line in lines:
+            parse(line)
+
+    return {"parse_log_line": measure(run, ctx.runs, items=len(lines))}
+
+
+def bench_execute_command(ctx):
+    Console = ctx.console
+    results = {
+        "execute_command.trivial": measure(lambda: Console.execute_command("1 + 1"), ctx.runs * 5),
+        "execute_command.trivial_safe_mode": measure(
+            lambda: Console.execute_command("1 + 1", safe_mode=True), ctx.runs * 5
+        ),
+    }
+    Console.clear_user_session(Console.env.uid)
+    return results
+
+
+def bench_get_cache_info(ctx):
+    from odoo.addons.web_shell.models.debug_tools import get_cache_info
+
+    model_name, record_id = widest_model(ctx.env)
+    result = measure(lambda: get_cache_info(ctx.env, model_name, record_id), ctx.runs)
+    result["model"] = model_name
+    result["fields"] = len(ctx.env[model_name]._fields)
+    return {"get_cache_info.widest_model": result}
+
+
+def bench_views(ctx):
+    from odoo.addons.web_shell.models.debug_tools import get_view_inheritance
+    from odoo.addons.web_shell.models.view_resolver import clear_resolved_archs
+
+    env = ctx.env
+    base, leaf = create_view_chain(env, ctx.view_depth)
+    Console = ctx.console
+
+    def diff_cold(mode):
+        clear_resolved_archs()
+        env.invalidate_all()
+        return Console.get_view_diff_rpc(leaf.id, mode=mode)
+
+    results = {
+        "get_view_inheritance.deep": measure(lambda: get_view_inheritance(env, base.id), ctx.runs),
+        "get_view_diff_rpc.cold": measure(lambda: diff_cold("unified"), ctx.runs),
+        "get_view_diff_rpc.warm": measure(lambda: Console.get_view_diff_rpc(leaf.id), ctx.runs),
+        "get_view_diff_rpc.tree_warm": measure(
+            lambda: Console.get_view_diff_rpc(leaf.id, mode="tree"), ctx.runs
+        ),
+    }
+    for result in results.values():
+        result["depth"] = ctx.view_depth
+    return results
+
+
+def bench_bus_log_handler(ctx):
+    from odoo.http import _request_stack
+    from odoo.addons.web_shell.models.log_handler import BusLogHandler
+
+    handler = BusLogHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    records = [
+        logging.LogRecord("odoo.bench", logging.INFO, __file__, i, "record %s", (i,), None)
+        for i in range(2000)
+    ]
+
+    def emit_all():
+        for record in records:
+            handler.emit(record)
+
+    # Outside a request the handler must bail out immediately (crons, workers)
+    results = {"bus_log_handler.no_request": measure(emit_all, ctx.runs, items=len(records))}
+
+    # Within a request every record becomes a bus message (rolled back with the transaction)
+    _request_stack.push(SimpleNamespace(env=ctx.console.env))
+    try:
+        results["bus_log_handler.in_request"] = measure(emit_all, ctx.runs, items=len(records))
+    finally:
+        _request_stack.pop()
+    return results
+
+
+BENCHMARKS = {
+    "read_logs": bench_read_logs,
+    "parse_log_line": bench_parse_log_line,
+    "execute_command": bench_execute_command,
+    "get_cache_info": bench_get_cache_info,
+    "views": bench_views,
+    "bus_log_handler": bench_bus_log_handler,
+}
+
+
+# ---------------------------------------------------------------------------
+# Regression check
+# ---------------------------------------------------------------------------
+
+
+def compare(results, baseline, default_threshold, thresholds, metric="median_ms"):
+    """Returns [(name, baseline, current, change, threshold)] for every regression."""
+    regressions = []
+    for name, current in sorted(results.items()):
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous.get(metric):
+            continue
+        change = current[metric] / previous[metric] - 1
+        threshold = thresholds.get(name, default_threshold)
+        if change > threshold:
+            regressions.append((name, previous[metric], current[metric], change, threshold))
+    return regressions
+
+
+def _parse_thresholds(values):
+    thresholds = {}
+    for value in values or ():
+        name, _, limit = value.partition("=")
+        thresholds[name.strip()] = float(limit)
+    return thresholds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-c", "--config", help="Odoo configuration file")
+    parser.add_argument("-d", "--database", required=True, help="Database with web_shell installed")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    parser.add_argument("--baseline", help="Previous results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown ratio (0.25 = 25%%)")
+    parser.add_argument("--threshold-for", action="append", metavar="NAME=RATIO", help="Per-benchmark threshold")
+    parser.add_argument("--only", help="Comma-separated benchmark groups: " + ", ".join(BENCHMARKS))
+    parser.add_argument("--runs", type=int, default=10, help="Measured runs per benchmark")
+    parser.add_argument("--log-size-mb", type=int, default=256, help="Size of the synthetic log file")
+    parser.add_argument("--view-depth", type=int, default=50, help="Length of the view inheritance chain")
+    args, odoo_args = parser.parse_known_args(argv)
+
+    # Read first: the baseline may be the file this run is about to overwrite
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    import odoo
+    from odoo.tools import config
+
+    config.parse_config((["-c", args.config] if args.config else []) + ["-d", args.database] + odoo_args)
+    groups = args.only.split(",") if args.only else list(BENCHMARKS)
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="web_shell_bench_") as tmp:
+        if "read_logs" in groups:
+            _logger.info("Generating a %d MB log file...", args.log_size_mb)
+            log_file = generate_log_file(tmp, args.log_size_mb)
+            config["logfile"] = log_file
+
+        registry = odoo.modules.registry.Registry(args.database)
+        with registry.cursor() as cr:
+            env = odoo.api.Environment(cr, odoo.SUPERUSER_ID, {})
+            admin = env.ref("base.user_admin")
+            ctx = SimpleNamespace(
+                env=env,
+                console=env["web.shell.console"].with_user(admin),
+                log_file=config.get("logfile"),
+                runs=args.runs,
+                view_depth=args.view_depth,
+            )
+            try:
+                for group in groups:
+                    _logger.info("Running %s...", group)
+                    results.update(BENCHMARKS[group](ctx))
+            finally:
+                cr.rollback()
+
+    report = {
+        "meta": {
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "odoo_version": odoo.release.version,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "database": args.database,
+            "runs": args.runs,
+            "log_size_mb": args.log_size_mb,
+            "view_depth": args.view_depth,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+    for name, result in sorted(results.items()):
+        print(f"{name:40} {result['median_ms']:>12.3f} ms  (p95 {result['p95_ms']:.3f} ms)")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold, _parse_thresholds(args.threshold_for))
+        for name, previous, current, change, threshold in regressions:
+            print(
+                f"REGRESSION {name}: {previous:.3f} ms -> {current:.3f} ms "
+                f"(+{change:.0%}, threshold {threshold:.0%})"
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    sys.exit(main())
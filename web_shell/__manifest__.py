@@ -24,12 +24,23 @@ Solo usuarios con grupo 'Administration / Settings' pueden usar el shell.
         "views/console_view.xml",
     ],
     "assets": {
+        # Only the systray button and the lazy-loading stubs ship on every page
         "web.assets_backend": [
-            "https://cdn.jsdelivr.net/npm/ace-builds@1.32.2/src-min-noconflict/ace.js",
+            "web_shell/static/src/components/log_viewer/log_systray.*",
+            "web_shell/static/src/components/loader/*",
+        ],
+        # Loaded on demand when an admin opens the console or the log panel
+        "web_shell.assets_devtools": [
             "web_shell/static/src/components/console/*",
             "web_shell/static/src/components/log_viewer/*",
+            ("remove", "web_shell/static/src/components/log_viewer/log_systray.*"),
             "web_shell/static/src/components/debug_tools/*",
         ],
+        # Loaded by the console after web's own Ace (web.ace_lib): what web does not ship
+        "web_shell.ace_lib": [
+            "web_shell/static/lib/ace/mode-sql.js",
+            "web_shell/static/lib/ace/ext-language_tools.js",
+        ],
     },
     "license": "LGPL-3",
 }
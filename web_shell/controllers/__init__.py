@@ -1,2 +1,3 @@
 from . import log_controller
 from . import debug_controller
+from . import metrics_controller
@@ -7,6 +7,8 @@ import json
 from odoo import http
 from odoo.http import request
 
+from ..models import metrics
+
 
 class LogViewerController(http.Controller):
     LOG_FILE_PATHS = [
@@ -63,12 +65,14 @@ class LogViewerController(http.Controller):
                     # First request: get last N lines
                     # Read from end backwards
                     read_size = min(50000, file_size)  # Read up to 50KB from end
-                    f.seek(max(0, file_size - read_size))
+                    read_from = max(0, file_size - read_size)
+                    f.seek(read_from)
                     content = f.read()
                     lines = content.strip().split("\n")[-max_lines:]
                     new_position = file_size
                 elif last_position < file_size:
                     # Read new content since last position
+                    read_from = last_position
                     f.seek(last_position)
                     content = f.read()
                     lines = content.strip().split("\n") if content.strip() else []
@@ -77,6 +81,7 @@ class LogViewerController(http.Controller):
                     new_position = file_size
                 else:
                     # No new content (or file was rotated)
+                    read_from = file_size
                     lines = []
                     new_position = file_size
 
@@ -87,6 +92,9 @@ class LogViewerController(http.Controller):
                         parsed = self._parse_log_line(line)
                         parsed_lines.append(parsed)
 
+                metrics.READ_LOGS_BYTES.inc(file_size - read_from)
+                metrics.READ_LOGS_LINES.inc(len(parsed_lines))
+
                 return {
                     "lines": parsed_lines,
                     "position": new_position,
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# Part of Web Shell. See LICENSE file for full copyright and licensing details.
+# Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+
+import hmac
+
+from odoo import http
+from odoo.http import request
+from odoo.tools import config
+
+from ..models import metrics
+
+
+class MetricsController(http.Controller):
+    @http.route("/web_shell/metrics", type="http", auth="none", methods=["GET"], save_session=False)
+    def metrics(self, token=None):
+        """
+        Prometheus text format metrics of the worker serving the request.
+        Disabled unless `web_shell_metrics_token` is set in the server configuration;
+        the token is passed as `Authorization: Bearer <token>` or `?token=`.
+        """
+        expected = config.get("web_shell_metrics_token")
+        if not expected:
+            return request.not_found()
+
+        header = request.httprequest.headers.get("Authorization", "")
+        provided = header[7:] if header.startswith("Bearer ") else (token or "")
+        if not hmac.compare_digest(provided.encode(), str(expected).encode()):
+            return request.make_response("Forbidden", status=403)
+
+        return request.make_response(
+            metrics.render(),
+            headers=[("Content-Type", "text/plain; version=0.0.4; charset=utf-8")],
+        )
@@ -1,4 +1,6 @@
 from . import console
+from . import bulk_run
+from . import ir_http
 from . import log_handler
 from . import debug_tools
 
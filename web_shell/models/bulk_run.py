@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+# Part of Web Shell. See LICENSE file for full copyright and licensing details.
+# Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+
+import json
+import logging
+import time
+import traceback
+
+from psycopg2 import errors
+
+from odoo import models, api, fields
+from odoo.tools.safe_eval import safe_eval
+
+_logger = logging.getLogger(__name__)
+
+# Per-chunk timings kept on the run (the most recent ones)
+MAX_CHUNK_LOG = 200
+
+# pg advisory lock keys of the runs: base + run id
+ADVISORY_LOCK_BASE = 0x5745420000
+
+
+class WebShellBulkRun(models.Model):
+    """
+    A data fix applied to the records of a domain in chunks of ids.
+
+    Chunks are walked by increasing id (keyset pagination, no id list kept in
+    memory). Chunks run on a cursor of their own, each committed together
+    with the run's checkpoint (last_id), then the environment cache is
+    cleared: a chunk is either fully applied and recorded, or not at all, so
+    an interrupted or failed run resumes exactly after the last committed
+    chunk.
+    """
+
+    _name = "web.shell.bulk.run"
+    _description = "Web Shell Bulk Run"
+    _order = "id desc"
+
+    name = fields.Char(required=True)
+    user_id = fields.Many2one("res.users", default=lambda self: self.env.user, readonly=True)
+    model_name = fields.Char(string="Model", required=True)
+    domain = fields.Text(default="[]", required=True)
+    code = fields.Text(required=True, help="Python snippet run once per chunk, with the chunk as `records`.")
+    chunk_size = fields.Integer(default=1000, required=True)
+    rate_limit = fields.Float(help="Maximum records per second, 0 for no limit.")
+    state = fields.Selection(
+        [
+            ("draft", "Draft"),
+            ("running", "Running"),
+            ("paused", "Paused"),
+            ("done", "Done"),
+            ("failed", "Failed"),
+            ("cancelled", "Cancelled"),
+        ],
+        default="draft",
+        required=True,
+    )
+    total = fields.Integer(help="Records matching the domain when the run started.")
+    processed = fields.Integer()
+    chunks = fields.Integer()
+    last_id = fields.Integer(help="Checkpoint: highest id of the last committed chunk.")
+    elapsed = fields.Float(help="Seconds spent running chunks.")
+    chunk_log = fields.Text(default="[]")
+    error = fields.Text()
+    started_at = fields.Datetime()
+    finished_at = fields.Datetime()
+
+    def _get_domain(self):
+        return safe_eval(self.domain or "[]")
+
+    def _progress(self):
+        self.ensure_one()
+        return {
+            "id": self.id,
+            "name": self.name,
+            "model": self.model_name,
+            "domain": self.domain,
+            "state": self.state,
+            "total": self.total,
+            "processed": self.processed,
+            "chunks": self.chunks,
+            "last_id": self.last_id,
+            "elapsed": round(self.elapsed, 3),
+            "chunk_size": self.chunk_size,
+            "rate_limit": self.rate_limit,
+            "chunk_log": json.loads(self.chunk_log or "[]")[-20:],
+            "error": self.error,
+            "user": self.user_id.login,
+            "started_at": self.started_at and fields.Datetime.to_string(self.started_at),
+            "finished_at": self.finished_at and fields.Datetime.to_string(self.finished_at),
+        }
+
+    @api.model
+    def run_chunks(self, run_id, max_seconds=20.0):
+        """
+        Runs chunks of run_id until the run is finished or max_seconds is spent,
+        on its own cursor, committing after every chunk. Call again to resume.
+        """
+        deadline = time.time() + max_seconds
+        with self.pool.cursor() as cr:
+            env = api.Environment(cr, self.env.uid, self.env.context)
+            run = env[self._name].browse(int(run_id))
+            if not run.exists():
+                return {"error": f"Bulk run {run_id} not found"}
+            # One runner per run: a second client gets an error instead of double-applying
+            # chunks. Session-level advisory lock, so it survives the per-chunk commits.
+            lock_key = ADVISORY_LOCK_BASE + run.id
+            cr.execute("SELECT pg_try_advisory_lock(%s)", [lock_key])
+            if not cr.fetchone()[0]:
+                return {"error": "This run is already being executed by another request."}
+            try:
+                return run._run_chunks(deadline)
+            finally:
+                cr.rollback()
+                cr.execute("SELECT pg_advisory_unlock(%s)", [lock_key])
+                cr.commit()
+
+    def _run_chunks(self, deadline):
+        run = self
+        cr, env = run.env.cr, run.env
+        if run.state in ("done", "cancelled"):
+            return run._progress()
+        Model = env[run.model_name]
+        domain = run._get_domain()
+        if run.state == "draft":
+            run.write(
+                {
+                    "total": Model.search_count(domain),
+                    "started_at": fields.Datetime.now(),
+                }
+            )
+        run.write({"state": "running", "error": False})
+        cr.commit()
+
+        ran_chunk = False
+        while time.time() < deadline:
+            # Cancelled from another request since the last chunk?
+            run.invalidate_recordset(["state"])
+            if run.state == "cancelled":
+                return run._progress()
+            records = Model.search(domain + [("id", ">", run.last_id)], order="id", limit=run.chunk_size)
+            if not records:
+                run._leave_running("done")
+                break
+
+            # No statement of the chunk may run past the deadline (SET LOCAL: until the commit)
+            cr.execute(f"SET LOCAL statement_timeout = {max(1, int((deadline - time.time()) * 1000))}")
+            start_queries = cr.sql_log_count
+            start = time.time()
+            try:
+                exec(
+                    run.code,
+                    {"env": env, "records": records, "models": models, "fields": fields, "api": api},
+                )
+                env.flush_all()
+            except errors.QueryCanceled:
+                cr.rollback()
+                env.invalidate_all(flush=False)
+                if ran_chunk:
+                    # Out of time: the chunk is retried by the next call
+                    run._leave_running("paused")
+                else:
+                    run._leave_running(
+                        "failed",
+                        error="A chunk did not finish within the time budget of a call; reduce chunk_size.",
+                    )
+                break
+            except Exception:
+                cr.rollback()
+                env.invalidate_all(flush=False)
+                run._leave_running("failed", error=traceback.format_exc())
+                _logger.warning(
+                    "WebShell: Bulk run %s failed after id %s", run.id, run.last_id
+                )
+                break
+            duration = time.time() - start
+            cr.execute("SET LOCAL statement_timeout TO DEFAULT")
+
+            chunk_log = json.loads(run.chunk_log or "[]")
+            chunk_log.append(
+                {
+                    "first_id": records[0].id,
+                    "last_id": records[-1].id,
+                    "records": len(records),
+                    "time_ms": round(duration * 1000, 1),
+                    "queries": cr.sql_log_count - start_queries,
+                }
+            )
+            try:
+                run.write(
+                    {
+                        "last_id": records[-1].id,
+                        "processed": run.processed + len(records),
+                        "chunks": run.chunks + 1,
+                        "elapsed": run.elapsed + duration,
+                        "chunk_log": json.dumps(chunk_log[-MAX_CHUNK_LOG:]),
+                    }
+                )
+                # The chunk's changes and its checkpoint are committed together
+                cr.commit()
+            except errors.SerializationFailure:
+                # The run was updated concurrently (cancelled): drop the chunk with its checkpoint
+                cr.rollback()
+                env.invalidate_all(flush=False)
+                run._leave_running("paused")
+                break
+            ran_chunk = True
+            # Drop the chunk's records from the cache so it does not grow with the run
+            env.invalidate_all()
+
+            if run.rate_limit > 0:
+                pause = len(records) / run.rate_limit - duration
+                if pause > 0:
+                    time.sleep(min(pause, max(0.0, deadline - time.time())))
+        else:
+            run._leave_running("paused")
+
+        return run._progress()
+
+    def _leave_running(self, state, error=None):
+        """
+        Moves the run from "running" to `state` (recording `error` if given)
+        and commits, unless it was cancelled from another request in the
+        meantime: a single conditional UPDATE, so a committed cancellation is
+        never overwritten.
+        """
+        self.ensure_one()
+        assignments = ["state = %s", "write_date = now() at time zone 'UTC'"]
+        params = [state]
+        if state == "done":
+            assignments.append("finished_at = now() at time zone 'UTC'")
+        if error is not None:
+            assignments.append("error = %s")
+            params.append(error)
+        self.env.cr.execute(
+            f"UPDATE {self._table} SET {', '.join(assignments)} WHERE id = %s AND state = 'running'",
+            params + [self.id],
+        )
+        self.env.cr.commit()
+        self.invalidate_recordset(["state", "finished_at", "error", "write_date"])
@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+# Part of Web Shell. See LICENSE file for full copyright and licensing details.
+# Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+
+"""
+Console autocompletion resolved by introspection, without running user code.
+
+The text before the cursor is scanned (strings and brackets) to find the
+expression being completed, e.g. `env['sale.order'].partner_id.na` or
+`orders.mapped('partner_id.`. The expression is resolved statically against
+the user's session variables and the registry: subscripts of env give
+models, relational fields give their comodel, recordset methods known to
+return records keep the model. Attributes of session values are looked up
+with inspect.getattr_static, so no property, descriptor or __getattr__ is
+ever evaluated.
+
+Registry symbol tables (model names, fields with types, methods with their
+signatures) are built lazily per model and cached per registry signature.
+"""
+
+import ast
+import builtins
+import datetime
+import inspect
+import keyword
+import logging
+import time
+import types
+
+from odoo import api, fields, models
+
+from .debug_tools import registry_signature
+
+_logger = logging.getLogger(__name__)
+
+# {dbname: (signature, SymbolTable)}
+SYMBOL_TABLES = {}
+
+MAX_ITEMS = 200
+
+# Names available in every execute_command run besides the session variables
+NAMESPACE = ("env", "self", "models", "fields", "api")
+NAMESPACE_MODULES = {"models": models, "fields": fields, "api": api}
+
+# Recordset methods whose result is a recordset of the same model
+RETURNS_RECORDS = {
+    "browse", "search", "sudo", "with_user", "with_context", "with_company", "with_env",
+    "with_prefetch", "exists", "filtered", "filtered_domain", "sorted", "create", "copy",
+    "new", "ensure_one", "union", "concat",
+}
+
+# Environment attributes holding records
+ENV_MODELS = {"user": "res.users", "company": "res.company", "companies": "res.company"}
+ENV_ATTRIBUTES = ("cr", "uid", "context", "su", "registry", "transaction")
+
+FIELD_PYTHON_TYPES = {
+    "char": str, "text": str, "html": str, "selection": str,
+    "integer": int, "float": float, "monetary": float, "boolean": bool,
+    "date": datetime.date, "datetime": datetime.datetime,
+}
+
+KIND_ORDER = {
+    "field": 0, "model": 0, "variable": 1, "method": 2, "function": 2,
+    "class": 3, "module": 3, "attribute": 4, "keyword": 5,
+}
+
+_FUNCTION_TYPES = (
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodDescriptorType,
+    types.WrapperDescriptorType,
+)
+
+_IDENTIFIER_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
+
+
+def _first_line(doc):
+    return doc.strip().split("\n", 1)[0][:200] if doc else ""
+
+
+def _signature(function, bound=True):
+    try:
+        signature = inspect.signature(function)
+    except (TypeError, ValueError):
+        return "(...)"
+    parameters = list(signature.parameters.values())
+    if bound and parameters and parameters[0].name in ("self", "cls"):
+        parameters = parameters[1:]
+    return str(signature.replace(parameters=parameters))
+
+
+def _member(name, value):
+    """Completion item for an attribute found with getattr_static."""
+    if isinstance(value, (staticmethod, classmethod)):
+        function = value.__func__
+        detail = _signature(function, bound=isinstance(value, classmethod))
+        return {"name": name, "kind": "method", "detail": detail, "doc": _first_line(function.__doc__)}
+    if isinstance(value, _FUNCTION_TYPES):
+        return {"name": name, "kind": "method", "detail": _signature(value), "doc": _first_line(value.__doc__)}
+    if isinstance(value, type):
+        return {"name": name, "kind": "class", "detail": "class", "doc": _first_line(value.__doc__)}
+    if isinstance(value, types.ModuleType):
+        return {"name": name, "kind": "module", "detail": "module", "doc": ""}
+    if isinstance(value, models.BaseModel):
+        return {"name": name, "kind": "attribute", "detail": value._name, "doc": ""}
+    return {"name": name, "kind": "attribute", "detail": type(value).__name__, "doc": ""}
+
+
+class SymbolTable:
+    """Model names and, built on first use, the fields and methods of each model."""
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.models = [
+            {"name": name, "kind": "model", "detail": registry[name]._description or "", "doc": ""}
+            for name in sorted(registry)
+        ]
+        self.members = {}
+
+    def model_members(self, model_name):
+        members = self.members.get(model_name)
+        if members is None:
+            members = self.members[model_name] = self._build_members(self.registry[model_name])
+        return members
+
+    def _build_members(self, Model):
+        members = []
+        for name, field in Model._fields.items():
+            detail = field.type
+            if field.relational:
+                detail = f"{field.type} → {field.comodel_name}"
+            members.append({"name": name, "kind": "field", "detail": detail, "doc": field.string or ""})
+        for name in dir(Model):
+            if name in Model._fields or name.startswith("__"):
+                continue
+            try:
+                value = inspect.getattr_static(Model, name)
+            except AttributeError:
+                continue
+            if callable(value) or isinstance(value, (staticmethod, classmethod)):
+                members.append(_member(name, value))
+            elif isinstance(value, property):
+                doc = _first_line(value.__doc__)
+                members.append({"name": name, "kind": "attribute", "detail": "property", "doc": doc})
+        return members
+
+
+def get_symbol_table(env):
+    """Returns the symbol table of env's registry, building it on first use."""
+    dbname = env.cr.dbname
+    signature = registry_signature(env)
+    cached = SYMBOL_TABLES.get(dbname)
+    if cached and cached[0] == signature:
+        return cached[1]
+    start = time.time()
+    table = SymbolTable(env.registry)
+    SYMBOL_TABLES[dbname] = (signature, table)
+    _logger.info(
+        "WebShell: Completion symbol table built for %s (%d models) in %.0fms",
+        dbname,
+        len(table.models),
+        (time.time() - start) * 1000,
+    )
+    return table
+
+
+def _scan(text):
+    """
+    Scans code up to the cursor. Returns (string, stack, matches): the open
+    string as (start, quote) or None, the unclosed brackets as [(char, pos)],
+    and {closing pos: opening pos} of the matched ones.
+    """
+    stack, matches = [], {}
+    string = None
+    i, length = 0, len(text)
+    while i < length:
+        char = text[i]
+        if string:
+            start, quote = string
+            if char == "\\":
+                i += 2
+                continue
+            if text.startswith(quote, i):
+                string = None
+                i += len(quote)
+                continue
+            if char == "\n" and len(quote) == 1:
+                string = None
+        elif char == "#":
+            newline = text.find("\n", i)
+            i = length if newline == -1 else newline
+            continue
+        elif char in "'\"":
+            quote = text[i : i + 3] if text[i : i + 3] in ("'''", '"""') else char
+            string = (i, quote)
+            i += len(quote)
+            continue
+        elif char in "([{":
+            stack.append((char, i))
+        elif char in ")]}":
+            if stack:
+                matches[i] = stack.pop()[1]
+        i += 1
+    return string, stack, matches
+
+
+def _chain_start(text, end, matches):
+    """Start of the dotted/subscripted/called expression ending at `end`."""
+    i = end
+    while i > 0:
+        char = text[i - 1]
+        if char in _IDENTIFIER_CHARS or char == ".":
+            i -= 1
+        elif char in ")]" and (i - 1) in matches:
+            i = matches[i - 1]
+        else:
+            break
+    return i
+
+
+def _parse_chain(text, start, end, matches):
+    """Splits text[start:end] into a root name and [("attr"|"item"|"call", value)] steps."""
+    i = start
+    while i < end and text[i] in _IDENTIFIER_CHARS:
+        i += 1
+    root = text[start:i]
+    if not root.isidentifier():
+        return None, []
+    closes = {opening: closing for closing, opening in matches.items()}
+    steps = []
+    while i < end:
+        char = text[i]
+        if char == ".":
+            j = i + 1
+            while j < end and text[j] in _IDENTIFIER_CHARS:
+                j += 1
+            steps.append(("attr", text[i + 1 : j]))
+            i = j
+        elif char in "([":
+            close = closes.get(i)
+            if close is None or close >= end:
+                return None, []
+            steps.append(("call" if char == "(" else "item", text[i + 1 : close]))
+            i = close + 1
+        else:
+            return None, []
+    return root, steps
+
+
+def _literal(source):
+    try:
+        return ast.literal_eval(source.strip())
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        return None
+
+
+class Resolver:
+    """Resolves an expression statically to ("env"|"model"|"value"|"type", payload)."""
+
+    def __init__(self, env, variables, table):
+        self.env = env
+        self.variables = variables
+        self.table = table
+
+    def resolve(self, root, steps):
+        target = self._root(root)
+        for step in steps:
+            if target is None:
+                return None
+            target = self._step(target, step)
+        return target
+
+    def _root(self, name):
+        if name == "env":
+            return ("env", None)
+        if name == "self":
+            return ("model", "web.shell.console")
+        if name in self.variables:
+            return self._value(self.variables[name])
+        if name in NAMESPACE_MODULES:
+            return ("value", NAMESPACE_MODULES[name])
+        value = getattr(builtins, name, None)
+        return ("value", value) if value is not None else None
+
+    def _value(self, value):
+        if isinstance(value, models.BaseModel):
+            return ("model", type(value)._name)
+        if isinstance(value, type(self.env)):
+            return ("env", None)
+        return ("value", value)
+
+    def _field_target(self, model_name, path):
+        """Target reached by following a dotted field path from model_name."""
+        for name in path.split("."):
+            field = self.env[model_name]._fields.get(name)
+            if field is None:
+                return None
+            if not field.relational:
+                python_type = FIELD_PYTHON_TYPES.get(field.type)
+                return ("type", python_type) if python_type else None
+            model_name = field.comodel_name
+        return ("model", model_name)
+
+    def _step(self, target, step):
+        kind, payload = target
+        step_kind, value = step
+        if kind == "env":
+            if step_kind == "item":
+                name = _literal(value)
+                return ("model", name) if isinstance(name, str) and name in self.env.registry else None
+            if step_kind == "attr":
+                if value in ENV_MODELS:
+                    return ("model", ENV_MODELS[value])
+                if value in ENV_ATTRIBUTES:
+                    return self._value(getattr(self.env, value))
+            return None
+
+        if kind == "model":
+            if step_kind == "item":
+                return target
+            if step_kind == "attr":
+                if value == "env":
+                    return ("env", None)
+                if value in self.env[payload]._fields:
+                    return self._field_target(payload, value)
+                return ("method", (payload, value))
+            return None
+
+        if kind == "method":
+            model_name, method = payload
+            if step_kind != "call":
+                return None
+            if method in RETURNS_RECORDS:
+                return ("model", model_name)
+            if method == "mapped":
+                path = _literal(value)
+                return self._field_target(model_name, path) if isinstance(path, str) else None
+            return None
+
+        if kind == "value":
+            if step_kind == "attr":
+                try:
+                    attribute = inspect.getattr_static(payload, value)
+                except AttributeError:
+                    return None
+                if isinstance(attribute, (property, types.GetSetDescriptorType, types.MemberDescriptorType)):
+                    # Evaluating it could run code: only its existence is known
+                    return None
+                return self._value(attribute)
+            if step_kind == "item" and type(payload) in (dict, list, tuple):
+                key = _literal(value)
+                try:
+                    return self._value(payload[key])
+                except (KeyError, IndexError, TypeError):
+                    return None
+            return None
+
+        return None
+
+    def members(self, target):
+        kind, payload = target
+        if kind == "model":
+            return self.table.model_members(payload) if payload in self.env.registry else []
+        if kind == "env":
+            items = [
+                {"name": name, "kind": "field", "detail": model, "doc": ""}
+                for name, model in ENV_MODELS.items()
+            ]
+            items += [{"name": name, "kind": "attribute", "detail": "", "doc": ""} for name in ENV_ATTRIBUTES]
+            return items + self._object_members(type(self.env))
+        if kind == "type":
+            return self._object_members(payload)
+        if kind == "value":
+            return self._object_members(payload)
+        return []
+
+    def _object_members(self, obj):
+        # Class dicts along the MRO instead of dir(), which could call a custom __dir__
+        names = set()
+        for klass in inspect.getmro(obj if isinstance(obj, type) else type(obj)):
+            names.update(klass.__dict__)
+        try:
+            names.update(object.__getattribute__(obj, "__dict__"))
+        except (AttributeError, TypeError):
+            pass
+        items = []
+        for name in names:
+            if not isinstance(name, str) or name.startswith("__"):
+                continue
+            try:
+                items.append(_member(name, inspect.getattr_static(obj, name)))
+            except AttributeError:
+                continue
+        return items
+
+    def root_names(self):
+        items = [{"name": name, "kind": "variable", "detail": "", "doc": ""} for name in NAMESPACE]
+        for name, value in self.variables.items():
+            if name not in NAMESPACE and not name.startswith("__"):
+                item = _member(name, value)
+                item["kind"] = "variable"
+                items.append(item)
+        items += [
+            {
+                "name": name,
+                "kind": "function" if callable(getattr(builtins, name)) else "attribute",
+                "detail": "builtin",
+                "doc": "",
+            }
+            for name in dir(builtins)
+            if not name.startswith("_")
+        ]
+        items += [{"name": name, "kind": "keyword", "detail": "keyword", "doc": ""} for name in keyword.kwlist]
+        return items
+
+    def field_paths(self, model_name, partial):
+        """Fields completing a dotted path such as 'partner_id.coun'."""
+        head, _sep, _last = partial.rpartition(".")
+        if head:
+            target = self._field_target(model_name, head)
+            if not target or target[0] != "model":
+                return []
+            model_name = target[1]
+        prefix = head + "." if head else ""
+        return [
+            dict(item, name=prefix + item["name"])
+            for item in self.table.model_members(model_name)
+            if item["kind"] == "field"
+        ]
+
+
+def _string_completions(resolver, text, string, stack, matches):
+    """Completions inside a string literal: model names in env['...'], field paths in recordset calls."""
+    string_start, quote = string
+    partial = text[string_start + len(quote) :]
+    before = text[:string_start].rstrip()
+    if not stack:
+        return partial, []
+    char, position = stack[-1]
+    if char == "[" and before.endswith("["):
+        root, steps = _parse_chain(text, _chain_start(text, position, matches), position, matches)
+        target = resolver.resolve(root, steps) if root else None
+        if target and target[0] == "env":
+            return partial, resolver.table.models
+    # A tuple inside the call (domain leaf): only its first element is a field
+    is_call = position and text[position - 1] in _IDENTIFIER_CHARS
+    if char == "(" and not is_call and text[position + 1 : string_start].strip():
+        return partial, []
+    for char, position in reversed(stack):
+        if char == "(" and position and text[position - 1] in _IDENTIFIER_CHARS:
+            root, steps = _parse_chain(text, _chain_start(text, position, matches), position, matches)
+            if not root or not steps or steps[-1][0] != "attr":
+                return partial, []
+            target = resolver.resolve(root, steps[:-1])
+            if target and target[0] == "model":
+                return partial, resolver.field_paths(target[1], partial)
+            return partial, []
+    return partial, []
+
+
+def complete(env, variables, code, limit=MAX_ITEMS):
+    """
+    Completions for the end of `code` (the text up to the cursor), as
+    {"prefix": text being completed, "items": [{name, kind, detail, doc}]}.
+    """
+    start = time.perf_counter()
+    table = get_symbol_table(env)
+    resolver = Resolver(env, variables, table)
+    string, stack, matches = _scan(code)
+
+    if string:
+        partial, items = _string_completions(resolver, code, string, stack, matches)
+    else:
+        end = len(code)
+        chain_start = _chain_start(code, end, matches)
+        chain = code[chain_start:end]
+        head, dot, partial = chain.rpartition(".")
+        if not partial.isidentifier() and partial:
+            items = []
+        elif not dot:
+            items = resolver.root_names()
+        else:
+            root, steps = _parse_chain(code, chain_start, chain_start + len(head), matches)
+            target = resolver.resolve(root, steps) if root else None
+            items = resolver.members(target) if target and target[0] != "method" else []
+
+    show_private = partial.rsplit(".", 1)[-1].startswith("_")
+    seen = set()
+    result = []
+    for item in items:
+        name = item["name"]
+        if not name.startswith(partial) or name in seen:
+            continue
+        if not show_private and name.rsplit(".", 1)[-1].startswith("_"):
+            continue
+        seen.add(name)
+        result.append(item)
+    result.sort(key=lambda item: (KIND_ORDER.get(item["kind"], 9), item["name"]))
+    return {
+        "prefix": partial,
+        "items": result[:limit],
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+    }
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+# Part of Web Shell. See LICENSE file for full copyright and licensing details.
+# Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+
+"""
+Static compute-dependency graph, derived from the registry's field triggers.
+
+registry.field_triggers maps every field to a trigger tree: the fields to
+recompute when it is modified, plus sub-trees keyed by the relational field
+to follow (backwards) to reach the records holding them. Flattening those
+trees gives direct edges "modifying A recomputes B through path P"; walking
+them answers "what recomputes if I write this?" and, in reverse, "what does
+this compute depend on?". The graph is built once per registry signature.
+"""
+
+import logging
+import time
+from collections import defaultdict, deque
+
+from .debug_tools import registry_signature
+
+_logger = logging.getLogger(__name__)
+
+# {dbname: (signature, ComputeGraph)}
+COMPUTE_GRAPHS = {}
+
+
+def field_key(field):
+    return f"{field.model_name}.{field.name}"
+
+
+def _flatten_tree(tree, path=()):
+    """Yields (field, path) for every field to recompute in a trigger tree."""
+    # Odoo 17 uses a TriggerTree (dict with a .root), older versions a dict with a None key
+    root = tree.root if hasattr(tree, "root") else tree.get(None, ())
+    for field in root or ():
+        yield field, path
+    for key, subtree in tree.items():
+        if key is not None:
+            yield from _flatten_tree(subtree, path + (key,))
+
+
+class ComputeGraph:
+    def __init__(self, registry):
+        # {source_key: [(target_key, path_keys, path_fields)]}
+        self.triggers = defaultdict(list)
+        # {target_key: [(source_key, path_keys, path_fields)]}
+        self.dependencies = defaultdict(list)
+        self.fields = {}
+
+        for field, tree in registry.field_triggers.items():
+            source = field_key(field)
+            self.fields[source] = field
+            for target, path in _flatten_tree(tree):
+                target_key = field_key(target)
+                self.fields[target_key] = target
+                path_keys = tuple(field_key(f) for f in path)
+                self.triggers[source].append((target_key, path_keys, path))
+                self.dependencies[target_key].append((source, path_keys, path))
+
+        self.field_depends = getattr(registry, "field_depends", {})
+        self.edge_count = sum(len(edges) for edges in self.triggers.values())
+
+    def _walk(self, start, edges, max_depth):
+        """BFS over edges, returning {key: (depth, parent_key, path_keys, path_fields)}."""
+        seen = {start: (0, None, (), ())}
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            depth = seen[node][0]
+            if depth >= max_depth:
+                continue
+            for other, path_keys, path in edges.get(node, ()):
+                if other not in seen:
+                    seen[other] = (depth + 1, node, path_keys, path)
+                    queue.append(other)
+        seen.pop(start)
+        return seen
+
+    def recomputed_by(self, key, max_depth=10):
+        """Fields recomputed (transitively) when `key` is written."""
+        return self._walk(key, self.triggers, max_depth)
+
+    def depends_on(self, key, max_depth=10):
+        """Fields `key` depends on (transitively)."""
+        return self._walk(key, self.dependencies, max_depth)
+
+
+def get_compute_graph(env):
+    """Returns the compute-dependency graph of env's registry, building it on first use."""
+    dbname = env.cr.dbname
+    signature = registry_signature(env)
+    cached = COMPUTE_GRAPHS.get(dbname)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    start = time.time()
+    graph = ComputeGraph(env.registry)
+    COMPUTE_GRAPHS[dbname] = (signature, graph)
+    _logger.info(
+        "WebShell: Compute graph built for %s (%d trigger edges) in %.0fms",
+        dbname,
+        graph.edge_count,
+        (time.time() - start) * 1000,
+    )
+    return graph
+
+
+def _table_rows(env, model_names):
+    """Estimated row count per model, from pg_class statistics (single query)."""
+    tables = {}
+    for model_name in model_names:
+        Model = env.registry.get(model_name)
+        if Model is not None and not Model._abstract and Model._auto:
+            tables[Model._table] = model_name
+    if not tables:
+        return {}
+    env.cr.execute(
+        "SELECT relname, reltuples FROM pg_class WHERE relkind = 'r' AND relname IN %s",
+        [tuple(tables)],
+    )
+    return {tables[relname]: max(0, int(rows)) for relname, rows in env.cr.fetchall()}
+
+
+def _step_fanout(rows, from_model, via_field):
+    """
+    Average number of via_field.model_name records reached from one from_model
+    record by following via_field backwards.
+    """
+    if via_field.type == "one2many":
+        # The target holds a many2one-like inverse: at most one record
+        return 1.0
+    source_rows = rows.get(from_model) or 0
+    target_rows = rows.get(via_field.model_name) or 0
+    if not source_rows:
+        return float(target_rows and 1)
+    return max(1.0, target_rows / source_rows)
+
+
+def get_compute_dependencies(env, model_name, field_name, max_depth=10):
+    """
+    Transitive "recomputed if written" and "depends on" sets for model.field,
+    with a fan-out estimate (records recomputed per written record).
+    """
+    if model_name not in env:
+        return {"error": f"Model '{model_name}' not found."}
+    if field_name not in env[model_name]._fields:
+        return {"error": f"Field '{field_name}' not found on {model_name}."}
+
+    graph = get_compute_graph(env)
+    field = env[model_name]._fields[field_name]
+    key = field_key(field)
+
+    recomputed = graph.recomputed_by(key, max_depth=max_depth)
+    depends = graph.depends_on(key, max_depth=max_depth)
+
+    involved = {model_name}
+    for target_key, (depth, parent, path_keys, path) in recomputed.items():
+        involved.add(graph.fields[target_key].model_name)
+        involved.update(via.model_name for via in path)
+    rows = _table_rows(env, involved)
+
+    # Fan-out of a field = fan-out of the field triggering it * fan-out of the path between them
+    fanout = {key: 1.0}
+    triggered = []
+    for target_key, (depth, parent, path_keys, path) in sorted(
+        recomputed.items(), key=lambda item: item[1][0]
+    ):
+        estimate = fanout[parent]
+        current_model = graph.fields[parent].model_name
+        for via in path:
+            estimate *= _step_fanout(rows, current_model, via)
+            current_model = via.model_name
+        fanout[target_key] = estimate
+
+        target = graph.fields[target_key]
+        triggered.append(
+            {
+                "field": target_key,
+                "model": target.model_name,
+                "type": target.type,
+                "store": bool(target.store),
+                "depth": depth,
+                "via": parent,
+                "path": list(path_keys),
+                "estimated_records": round(estimate, 2),
+                "table_rows": rows.get(target.model_name),
+            }
+        )
+
+    triggered.sort(key=lambda t: (-t["estimated_records"], t["depth"]))
+    return {
+        "field": key,
+        "compute": field.compute if isinstance(field.compute, str) else bool(field.compute),
+        "store": bool(field.store),
+        "depends": list(graph.field_depends.get(field, ())),
+        "triggers": triggered,
+        "depends_on": [
+            {"field": dep_key, "depth": depth, "path": list(path_keys)}
+            for dep_key, (depth, parent, path_keys, path) in sorted(
+                depends.items(), key=lambda item: item[1][0]
+            )
+        ],
+        "table_rows": rows.get(model_name),
+    }
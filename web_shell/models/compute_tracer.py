@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# Part of Web Shell. See LICENSE file for full copyright and licensing details.
+# Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+
+"""
+Runtime recompute tracer.
+
+While at least one ComputeTrace is active in the worker,
+BaseModel._compute_field_value is wrapped by a pass-through that looks up
+the trace of the current thread: every compute batch run there on the
+traced cursor is recorded: field, records in the batch and time spent
+(inclusive, and exclusive of nested computes). The wrapper is installed by
+the first active trace and removed by the last one, so the ORM is left
+untouched whenever nobody is tracing; concurrent requests of other threads
+only pay for the thread-local lookup meanwhile.
+"""
+
+import threading
+import time
+
+from odoo import models
+
+# Trace of the current thread, if any
+_ACTIVE_TRACES = threading.local()
+
+# Number of active traces in the worker, and the unwrapped method while > 0
+_INSTALL_LOCK = threading.Lock()
+_INSTALLED = {"count": 0, "original": None}
+
+
+def _install_wrapper():
+    with _INSTALL_LOCK:
+        _INSTALLED["count"] += 1
+        if _INSTALLED["count"] > 1:
+            return
+        # Looked up in the class dict so a wrapper is never wrapped twice
+        original = models.BaseModel.__dict__["_compute_field_value"]
+
+        def _compute_field_value(self, field):
+            trace = getattr(_ACTIVE_TRACES, "trace", None)
+            if trace is None or trace.cr is not self.env.cr:
+                return original(self, field)
+            return trace.run(original, self, field)
+
+        _INSTALLED["original"] = original
+        models.BaseModel._compute_field_value = _compute_field_value
+
+
+def _uninstall_wrapper():
+    with _INSTALL_LOCK:
+        _INSTALLED["count"] -= 1
+        if _INSTALLED["count"] > 0:
+            return
+        models.BaseModel._compute_field_value = _INSTALLED["original"]
+        _INSTALLED["original"] = None
+
+
+class ComputeTrace:
+    """Context manager recording the compute batches run on one cursor by the current thread."""
+
+    def __init__(self, cr):
+        self.cr = cr
+        self.stats = {}
+        self._stack = []
+        self._previous = None
+
+    def __enter__(self):
+        _install_wrapper()
+        self._previous = getattr(_ACTIVE_TRACES, "trace", None)
+        _ACTIVE_TRACES.trace = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        _ACTIVE_TRACES.trace = self._previous
+        _uninstall_wrapper()
+
+    def run(self, compute_field_value, records, field):
+        # Time spent in nested computes is subtracted from the parent's self time
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return compute_field_value(records, field)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            self._record(records, field, elapsed, elapsed - nested)
+
+    def _record(self, records, field, elapsed, self_time):
+        key = f"{records._name}.{field.name}"
+        stat = self.stats.get(key)
+        if stat is None:
+            stat = self.stats[key] = {
+                "field": key,
+                "method": field.compute if isinstance(field.compute, str) else getattr(field.compute, "__name__", ""),
+                "batches": 0,
+                "records": 0,
+                "max_batch": 0,
+                "time_ms": 0.0,
+                "self_ms": 0.0,
+            }
+        stat["batches"] += 1
+        stat["records"] += len(records)
+        stat["max_batch"] = max(stat["max_batch"], len(records))
+        stat["time_ms"] += elapsed * 1000
+        stat["self_ms"] += self_time * 1000
+
+    def report(self, limit=50):
+        """Computes ranked by self time, flagging record-by-record execution."""
+        rows = []
+        for stat in self.stats.values():
+            row = dict(stat)
+            row["avg_batch"] = round(stat["records"] / stat["batches"], 2)
+            row["per_record"] = stat["batches"] > 1 and stat["max_batch"] == 1
+            row["time_ms"] = round(stat["time_ms"], 3)
+            row["self_ms"] = round(stat["self_ms"], 3)
+            rows.append(row)
+        rows.sort(key=lambda row: row["self_ms"], reverse=True)
+        return rows[:limit]
@@ -9,12 +9,43 @@ import logging
 import difflib
 from lxml import etree
 
-from odoo import models, api, fields
+from odoo import models, api, fields, release
 from odoo.http import request
+from odoo.tools import config
 from odoo.tools.profiler import Profiler
 import time
 import contextlib
-from .debug_tools import get_cache_info
+from .debug_tools import (
+    get_cache_info,
+    get_env_cache_stats,
+    diff_env_cache_stats,
+    get_xml_ids,
+    registry_signature,
+)
+from .view_resolver import (
+    ViewInheritanceResolver,
+    clear_resolved_archs,
+    get_resolved_archs_stats,
+    parse_arch,
+    primary_root,
+)
+from .xml_diff import diff_xml_trees
+from .search_index import omni_search
+from .relation_graph import get_relation_graph
+from .compute_graph import get_compute_dependencies
+from .compute_tracer import ComputeTrace
+from .db_health import get_db_health
+from .completion import complete
+from .ormcache_stats import (
+    REGISTRY_LOADED_AT,
+    get_ormcache_stats,
+    observe_invalidations,
+    reset_ormcache_stats,
+    stop_ormcache_stats,
+)
+from . import metrics
+from . import query_sampler
+from . import sql_console
 
 _logger = logging.getLogger(__name__)
 
@@ -32,6 +63,13 @@ SESSION_MAX_AGE = 3600
 # Maximum number of sessions before auto-cleanup
 MAX_SESSIONS = 100
 
+# Log files tried by read_logs, after the server's configured --logfile
+LOG_FILE_PATHS = [
+    "/var/log/odoo/odoo-server.log",
+    "/var/log/odoo/odoo.log",
+    "/proc/1/fd/1",  # Docker stdout
+]
+
 
 class WebShellConsole(models.Model):
     _name = "web.shell.console"
@@ -46,6 +84,32 @@ class WebShellConsole(models.Model):
         "__import__",
     ]
 
+    def _register_hook(self):
+        # Registry (re)load time of this worker, reported with the ormcache statistics
+        REGISTRY_LOADED_AT[self.env.cr.dbname] = time.time()
+        observe_invalidations(self.env.registry, self.env.cr.dbname, reset=True)
+        self._configure_query_sampler()
+        return super()._register_hook()
+
+    def _configure_query_sampler(self):
+        """Loads the slow query sampler settings of this worker from ir.config_parameter."""
+        ICP = self.env["ir.config_parameter"].sudo()
+        query_sampler.LOADED[self.env.cr.dbname] = registry_signature(self.env, "default")
+        try:
+            query_sampler.configure(
+                threshold_ms=ICP.get_param("web_shell.slow_query_ms", "500"),
+                sample_rate=ICP.get_param("web_shell.query_sample_rate", "0"),
+                max_entries=ICP.get_param("web_shell.query_sample_size", "2000"),
+            )
+        except ValueError:
+            _logger.warning("WebShell: Invalid slow query sampler settings, keeping defaults")
+
+    @api.model
+    def _refresh_query_sampler(self):
+        """Reloads the sampler settings if ir.config_parameter may have changed since they were loaded."""
+        if query_sampler.LOADED.get(self.env.cr.dbname) != registry_signature(self.env, "default"):
+            self._configure_query_sampler()
+
     def _get_blocked_patterns(self):
         """Get blocked patterns from config or use defaults."""
         ICP = self.env["ir.config_parameter"].sudo()
@@ -120,7 +184,7 @@ class WebShellConsole(models.Model):
                 )
 
     @api.model
-    def execute_command(self, code, safe_mode=False):
+    def execute_command(self, code, safe_mode=False, cache_diff=False, trace_computes=False):
         """
         Executes python code and returns the output.
         Security features:
@@ -128,6 +192,8 @@ class WebShellConsole(models.Model):
         - Configurable timeout (web_shell.timeout, default 30s)
         - Configurable blocked patterns (web_shell.blocked_patterns)
         - Safe Mode: automatic rollback of database changes
+        - Cache diff: snapshot env.cache before/after and report its growth in the audit
+        - Compute trace: record every compute batch (records, time) and rank them in the audit
         """
         import signal
 
@@ -160,6 +226,7 @@ class WebShellConsole(models.Model):
         # Performance Audit Initialization
         start_queries = self.env.cr.sql_log_count
         start_time = time.time()
+        cache_before = get_env_cache_stats(self.env) if cache_diff else None
 
         # Initialize user session if needed (only user variables, no env/self!)
         if user_id not in SESSION_LOCALS:
@@ -198,6 +265,10 @@ class WebShellConsole(models.Model):
         class SafeModeRollback(Exception):
             pass
 
+        compute_trace = (
+            ComputeTrace(self.env.cr) if trace_computes else contextlib.nullcontext()
+        )
+
         timeout_enabled = False
         try:
             # Set timeout (only works on Unix)
@@ -226,22 +297,31 @@ class WebShellConsole(models.Model):
                         # If it's not an expression, exec it
                         exec(code, execution_context)
 
-                if safe_mode:
-                    try:
-                        with self.env.cr.savepoint():
-                            try:
-                                _run_code()
-                                raise SafeModeRollback()
-                            finally:
-                                pass
-                    except SafeModeRollback:
-                        print("\n SAFE MODE: Transaction rolled back automatically.")
-                else:
-                    _run_code()
+                with compute_trace:
+                    if safe_mode:
+                        try:
+                            with self.env.cr.savepoint():
+                                try:
+                                    _run_code()
+                                    if trace_computes:
+                                        # Rolled back below without flushing: run stored computes first
+                                        self.env.flush_all()
+                                    raise SafeModeRollback()
+                                finally:
+                                    pass
+                        except SafeModeRollback:
+                            print("\n SAFE MODE: Transaction rolled back automatically.")
+                    else:
+                        _run_code()
+                        if trace_computes:
+                            # Run pending stored computes now so they are part of the trace
+                            self.env.flush_all()
 
             except TimeoutError:
+                metrics.EXECUTE_ERRORS.inc()
                 raise
             except Exception:
+                metrics.EXECUTE_ERRORS.inc()
                 traceback.print_exc()
         finally:
             # Cancel timeout
@@ -273,13 +353,23 @@ class WebShellConsole(models.Model):
         except Exception:
             pass
 
+        audit = {
+            "queries": end_queries - start_queries,
+            "time_ms": (end_time - start_time) * 1000,
+            "todo_fields": list(set(todo_fields)),
+        }
+        metrics.EXECUTE_SECONDS.observe(end_time - start_time, safe_mode=str(bool(safe_mode)).lower())
+        metrics.EXECUTE_QUERIES.observe(audit["queries"], safe_mode=str(bool(safe_mode)).lower())
+        if trace_computes:
+            audit["computes"] = compute_trace.report()
+        if cache_before is not None and "error" not in cache_before:
+            audit["cache"] = diff_env_cache_stats(
+                cache_before, get_env_cache_stats(self.env)
+            )
+
         return {
             "output": output,
-            "audit": {
-                "queries": end_queries - start_queries,
-                "time_ms": (end_time - start_time) * 1000,
-                "todo_fields": list(set(todo_fields)),
-            },
+            "audit": audit,
         }
 
     @api.model
@@ -297,25 +387,14 @@ class WebShellConsole(models.Model):
         Returns: { 'lines': [...], 'position': new_pos, 'error': ... }
         """
         # Skip logging this request to avoid noise in debug console
-        request.httprequest.nolog = True
+        if request:
+            request.httprequest.nolog = True
 
         if not self.env.user.has_group("base.group_system"):
             raise Exception("Access Denied")
 
-        import os
-
-        LOG_FILE_PATHS = [
-            "/var/log/odoo/odoo-server.log",
-            "/var/log/odoo/odoo.log",
-            "/proc/1/fd/1",
-        ]
-
-        log_file = None
-        for path in LOG_FILE_PATHS:
-            if os.path.exists(path) and os.access(path, os.R_OK):
-                log_file = path
-                break
-
+        start_time = time.time()
+        log_file = self._find_log_file()
         if not log_file:
             # Fallback if no log file found (dev environment)
             return {"lines": [], "position": 0, "error": "Log file not found"}
@@ -327,17 +406,20 @@ class WebShellConsole(models.Model):
 
                 if last_position == 0:
                     read_size = min(50000, file_size)
-                    f.seek(max(0, file_size - read_size))
+                    read_from = max(0, file_size - read_size)
+                    f.seek(read_from)
                     content = f.read()
                     lines = content.strip().split("\n")[-max_lines:]
                     new_position = file_size
                 elif last_position < file_size:
+                    read_from = last_position
                     f.seek(last_position)
                     content = f.read()
                     lines = content.strip().split("\n") if content.strip() else []
                     lines = lines[-max_lines:] if len(lines) > max_lines else lines
                     new_position = file_size
                 else:
+                    read_from = file_size
                     lines = []
                     new_position = file_size
 
@@ -346,6 +428,10 @@ class WebShellConsole(models.Model):
                     if line.strip():
                         parsed_lines.append(self._parse_log_line(line))
 
+                metrics.READ_LOGS_BYTES.inc(file_size - read_from)
+                metrics.READ_LOGS_LINES.inc(len(parsed_lines))
+                metrics.READ_LOGS_SECONDS.observe(time.time() - start_time)
+
                 return {
                     "lines": parsed_lines,
                     "position": new_position,
@@ -354,6 +440,16 @@ class WebShellConsole(models.Model):
         except Exception as e:
             return {"error": str(e), "lines": [], "position": last_position}
 
+    def _find_log_file(self):
+        """The server's --logfile if set and readable, else the first readable known path."""
+        import os
+
+        candidates = [config.get("logfile")] + LOG_FILE_PATHS
+        for path in candidates:
+            if path and os.path.exists(path) and os.access(path, os.R_OK):
+                return path
+        return None
+
     def _parse_log_line(self, line):
         result = {"time": "", "level": "INFO", "name": "", "message": line}
         parts = line.split(" ", 5)
@@ -403,9 +499,39 @@ class WebShellConsole(models.Model):
             "allowed_companies": allowed_companies,
             "context": ctx,
             "registry_size": len(self.env.registry) if self.env.registry else 0,
-            "odoo_version": "17.0",
+            "odoo_version": release.version,
         }
 
+    @api.model
+    def get_ormcache_stats_rpc(self, window=False, top_keys=10):
+        """
+        Returns this worker's ormcache statistics: hit/miss/eviction counts per
+        decorated method, cache sizes against capacity, hottest keys and time
+        since the last invalidation. window=True returns deltas since the last reset.
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        return get_ormcache_stats(self.env, window=window, top_keys=int(top_keys))
+
+    @api.model
+    def reset_ormcache_stats_rpc(self, track_keys=True):
+        """
+        Starts a new measurement window (baseline snapshot) for ormcache statistics.
+        Evictions and hot keys are only recorded while a window is open.
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        return reset_ormcache_stats(self.env, track_keys=track_keys)
+
+    @api.model
+    def stop_ormcache_stats_rpc(self):
+        """
+        Ends the measurement window and switches this worker's caches back to the plain LRU.
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        return stop_ormcache_stats(self.env)
+
     @api.model
     def get_cache_info_rpc(self, model, record_id):
         """
@@ -415,6 +541,15 @@ class WebShellConsole(models.Model):
             raise Exception("Access Denied")
         return get_cache_info(self.env, model, record_id)
 
+    @api.model
+    def get_env_cache_stats_rpc(self):
+        """
+        Returns aggregated per-model and per-field statistics of the whole env.cache.
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        return get_env_cache_stats(self.env)
+
     @api.model
     def get_view_inheritance_rpc(self, view_id):
         """
@@ -426,6 +561,17 @@ class WebShellConsole(models.Model):
 
         return get_view_inheritance(self.env, view_id)
 
+    @api.model
+    def get_view_arch_rpc(self, view_id):
+        """
+        Returns the arch of a single view (lazy loaded from the inheritance graph).
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        from .debug_tools import get_view_arch
+
+        return get_view_arch(self.env, view_id)
+
     @api.model
     def search_views_rpc(self, query):
         """
@@ -435,27 +581,47 @@ class WebShellConsole(models.Model):
         if not self.env.user.has_group("base.group_system"):
             raise Exception("Access Denied")
 
-        domain = ["|", ("name", "ilike", query), ("model", "ilike", query)]
-        # Try to search by ID if query is numeric
-        if query.isdigit():
-            domain = ["|"] + domain + [("id", "=", int(query))]
+        results = omni_search(self.env, query, kinds=["view"], limit=20)["results"]
+        return [
+            {key: r[key] for key in ("id", "name", "model", "xml_id", "priority", "type")}
+            for r in results
+        ]
 
-        views = self.env["ir.ui.view"].search_read(
-            domain, ["id", "name", "model", "xml_id", "priority", "type"], limit=20
-        )
-        return views
+    @api.model
+    def omni_search_rpc(self, query, kinds=None, limit=20):
+        """
+        Ranked search over views, xml ids, models and fields, served from an
+        in-memory index built once per registry.
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        return omni_search(self.env, query, kinds=kinds, limit=limit)
 
     @api.model
-    def get_view_diff_rpc(self, view_id):
+    def complete_rpc(self, code, limit=200):
         """
-        Returns a unified diff between the view's resolved arch and its parent's resolved arch.
+        Completions for the end of `code` (the editor text up to the cursor),
+        resolved statically against the user's session variables and the
+        registry. Nothing is executed.
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        variables = SESSION_LOCALS.get(self.env.user.id, {})
+        return complete(self.env, variables, code, limit=int(limit))
+
+    @api.model
+    def get_view_diff_rpc(self, view_id, mode="unified"):
+        """
+        Returns the diff between the view's resolved arch and its parent's resolved arch.
+        mode="unified": list of unified diff lines (difflib).
+        mode="tree": structural diff {"changes": [...], "stats": {...}} with XPaths.
         """
         if not self.env.user.has_group("base.group_system"):
             raise Exception("Access Denied")
 
         view = self.env["ir.ui.view"].browse(int(view_id))
         if not view.exists():
-            return ["View not found"]
+            return {"error": "View not found"} if mode == "tree" else ["View not found"]
 
         def get_arch_string(xml):
             if not isinstance(xml, str):
@@ -471,103 +637,27 @@ class WebShellConsole(models.Model):
             arch_after_xml = view._get_combined_arch()
             arch_after = get_arch_string(arch_after_xml)
         except Exception as e:
+            if mode == "tree":
+                return {"error": f"Error resolving view: {e}"}
             return [f"Error resolving view: {e}"]
 
-        # Get 'Before' state: The parent's resolved architecture WITHOUT this view.
-        # If we just ask parent._get_combined_arch(), it MIGHT include this view if Odoo has already cached/applied it!
-        # To be safe, we must manually apply inheritance up to the parent.
-
+        # Get 'Before' state: The root's resolved architecture WITHOUT this view
+        # (and without the views inheriting from it). The resolver memoizes
+        # intermediate archs at checkpoints, so consecutive diffs on the same model
+        # only re-apply the extensions after the last checkpoint their chains share.
+        combined_arch = resolve_info = None
         if view.inherit_id:
             try:
-                # 1. Get Base Arch (Root Parent)
-                # We traverse up to find the root
-                root = view.inherit_id
-                while root.inherit_id:
-                    root = root.inherit_id
-
-                # 2. Collect all views in the inheritance chain of the PARENT
-                # (excluding the current view 'view')
-                # Odoo's _get_combined_arch internal logic is complex.
-                # Let's try a simpler approach:
-                # Parent's combined arch usually includes all children.
-                # We need to SUBTRACT 'view' from 'parent'. Impossible.
-                # We must REBUILD 'parent' without 'view'.
-
-                # Retrieve all views that contribute to Parent, excluding 'view' and its children.
-                # Actually, simpler:
-                # arch_before = parent._get_combined_arch()
-                # If this returns identical to arch_after, it means parent ALREADY merged 'view'.
-                # In that case, we are Doomed unless we rebuild.
-
-                # Rebuild Strategy:
-                # Start with Root Arch.
-                # Iterate all children of Root that are part of parent's hierarchy OR are siblings,
-                # BUT SKIP 'view'.
-
-                # This is too complex for this context.
-                # Let's try relying on Odoo's `read_combined` behavior.
-                # If they are identical, it means implicit merge.
-
-                # HACK: If they are identical, assume 'Before' is simply 'After' minus the 'arch' of the current view applied?
-                # No, xpath removal is hard.
-
-                # Let's try to fetch parent arch ignoring the current view ID if possible? No API for that.
-
-                # Manual Rebuild (simplified):
-                # 1. Base Arch
-                base_arch = etree.fromstring(root.arch)
-                # 2. Get all inheriting views for Root
-                # active_model check?
-                all_inheriting = self.env["ir.ui.view"].search(
-                    [
-                        ("id", "!=", view.id),  # EXCLUDE SELF
-                        ("mode", "=", "extension"),
-                        ("inherit_id", "child_of", root.id),
-                        ("model", "=", root.model),  # Ensure same model
-                    ],
-                    order="priority, id",
-                )
-
-                # Filter out 'view' and any of its descendents if necessary?
-                # For now just exclude self.
-
-                # Filter: We only want views that are "ancestors" of our conceptual "Before" state?
-                # No, we want "System State if this view didn't exist".
-                # So we apply ALL other views.
-
-                combined_arch = base_arch
-                for extension in all_inheriting:
-                    # Skip if extension depends on 'view' (descendant)
-                    # Checking if 'view' is an ancestor of 'extension'
-                    # Traversing up extension.inherit_id...
-                    is_descendant = False
-                    curr = extension.inherit_id
-                    while curr:
-                        if curr.id == view.id:
-                            is_descendant = True
-                            break
-                        curr = curr.inherit_id
-
-                    if is_descendant:
-                        continue
-
-                    # Apply
-                    try:
-                        ext_arch = (
-                            etree.fromstring(extension.arch_db)
-                            if isinstance(extension.arch_db, str)
-                            else extension.arch_db
-                        )
-                        combined_arch = self.env["ir.ui.view"].apply_inheritance_specs(
-                            combined_arch, ext_arch, extension.id
-                        )
-                    except Exception:
-                        pass  # Skip views that fail to apply
+                root = primary_root(view.inherit_id)
+                resolver = ViewInheritanceResolver(self.env, root)
+                combined_arch, resolve_info = resolver.resolve(resolver.chain(exclude_id=view.id))
 
                 arch_before = get_arch_string(combined_arch)
                 from_name = f"{view.inherit_id.name or 'Parent'} (Reconstructed)"
 
             except Exception as e:
+                if mode == "tree":
+                    return {"error": f"Error reconstructing parent: {e}"}
                 arch_before = str(e)
                 from_name = "Parent (Error)"
         else:
@@ -576,6 +666,15 @@ class WebShellConsole(models.Model):
 
         to_name = f"{view.name or 'View'} (Resolved)"
 
+        if mode == "tree":
+            return {
+                "from": from_name,
+                "to": to_name,
+                **diff_xml_trees(combined_arch, parse_arch(arch_after_xml)),
+                # How the parent was rebuilt (steps reused from the memo) and the memo's state
+                "resolver": resolve_info and {**resolve_info, "memo": get_resolved_archs_stats()},
+            }
+
         # Generate Diff
         # splitlines(keepends=True) is important for unified_diff
         diff = list(
@@ -595,71 +694,250 @@ class WebShellConsole(models.Model):
 
         return diff
 
+    @api.model
+    def get_view_resolver_stats_rpc(self):
+        """Entries, size and hit/miss counts of this worker's memo of resolved archs."""
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        return get_resolved_archs_stats()
+
+    @api.model
+    def clear_view_resolver_cache_rpc(self):
+        """Drops this worker's memo of resolved archs. Returns the number of entries removed."""
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        return clear_resolved_archs()
+
+    @api.model
+    def get_view_contributions_rpc(self, model=None, view_id=None, max_diff_lines=200):
+        """
+        Returns, for every extension of a root view (or of every root view of a model),
+        what it contributes to the combined arch, whether it failed and its apply time.
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+
+        View = self.env["ir.ui.view"]
+        if view_id:
+            root = View.browse(int(view_id))
+            if not root.exists():
+                return {"error": f"View {view_id} not found"}
+            roots = primary_root(root)
+        elif model:
+            roots = View.search(
+                [("model", "=", model), ("mode", "=", "primary")],
+                order="type, priority, id",
+            )
+        else:
+            return {"error": "Provide a model or a view_id"}
+
+        reports = []
+        for root in roots:
+            report = ViewInheritanceResolver(self.env, root).contributions(
+                max_diff_lines=max_diff_lines
+            )
+            xml_ids = get_xml_ids(self.env, "ir.ui.view", [s["id"] for s in report["steps"]])
+            for step in report["steps"]:
+                step["xml_id"] = xml_ids.get(step["id"], f"__export__.{step['id']}")
+            reports.append(report)
+
+        return {
+            "reports": reports,
+            "total_ms": sum(r["total_ms"] for r in reports),
+        }
+
     @api.model
     def get_model_relations_rpc(self, model_name):
         """
         Returns info about ALL fields for a given model, grouped by type.
+        Grouped from the registry-wide relation graph (built once per registry),
+        labels from fields_get in the user's language.
         """
         if not self.env.user.has_group("base.group_system"):
             raise Exception("Access Denied")
 
-        if model_name not in self.env:
+        graph = get_relation_graph(self.env)
+        if model_name not in graph.field_groups:
             return {"error": f"Model '{model_name}' not found."}
+        return graph.model_metadata(self.env, model_name)
 
-        Model = self.env[model_name]
-        # Use fields_get for standard metadata
-        fields_info = Model.fields_get(
-            attributes=[
-                "string",
-                "help",
-                "type",
-                "relation",
-                "required",
-                "readonly",
-                "selection",
-            ]
-        )
+    @api.model
+    def get_model_neighborhood_rpc(self, model_name, depth=1, direction="both", limit=500):
+        """
+        Returns the models within `depth` relation hops of model_name and the edges between them.
+        direction: 'out' (fields of the model), 'in' (fields pointing to it) or 'both'.
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+
+        graph = get_relation_graph(self.env)
+        if model_name not in graph.index:
+            return {"error": f"Model '{model_name}' not found."}
+        return graph.neighborhood(model_name, depth=int(depth), direction=direction, limit=int(limit))
+
+    @api.model
+    def get_model_path_rpc(self, source, target, max_depth=6, direction="out"):
+        """
+        Returns the shortest chain of relational fields leading from source to target,
+        e.g. stock.move -> account.move.
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+
+        graph = get_relation_graph(self.env)
+        for model_name in (source, target):
+            if model_name not in graph.index:
+                return {"error": f"Model '{model_name}' not found."}
+
+        path = graph.shortest_path(source, target, max_depth=int(max_depth), direction=direction)
+        if path is None:
+            return {"error": f"No relation path from {source} to {target} within {max_depth} hops."}
+        return {"source": source, "target": target, "path": path}
+
+    @api.model
+    def get_compute_dependencies_rpc(self, model_name, field_name, max_depth=10):
+        """
+        Returns what recomputes (transitively) when model_name.field_name is written,
+        what that field depends on, and an estimated fan-out from table row counts.
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        return get_compute_dependencies(self.env, model_name, field_name, max_depth=int(max_depth))
+
+    @api.model
+    def get_query_samples_rpc(self, group=True, limit=100):
+        """
+        Slow and sampled queries recorded by this worker, aggregated by fingerprint.
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        result = query_sampler.get_query_samples(self.env.cr.dbname, limit=int(limit), group=group)
+        uids = {uid for g in result.get("groups", ()) for uid in g["users"]}
+        logins = {user.id: user.login for user in self.env["res.users"].sudo().browse(uids).exists()}
+        for g in result.get("groups", ()):
+            g["users"] = [logins.get(uid, str(uid)) for uid in g["users"]]
+        return result
+
+    @api.model
+    def set_query_sampler_rpc(self, threshold_ms=None, sample_rate=None, max_entries=None):
+        """
+        Stores the sampler settings and applies them to this worker; other workers
+        reload them on their next request (set_param signals the cache clear).
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        ICP = self.env["ir.config_parameter"].sudo()
+        for key, value in (
+            ("web_shell.slow_query_ms", threshold_ms),
+            ("web_shell.query_sample_rate", sample_rate),
+            ("web_shell.query_sample_size", max_entries),
+        ):
+            if value is not None:
+                ICP.set_param(key, str(value))
+        return query_sampler.configure(threshold_ms, sample_rate, max_entries)
+
+    @api.model
+    def clear_query_samples_rpc(self):
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        query_sampler.clear_query_samples()
+        return True
+
+    @api.model
+    def get_db_health_rpc(self, limit=100):
+        """
+        Table sizes, bloat estimates, dead tuples and seq/index scan ratios per
+        model, unused indexes and index=False fields filtered on by sampled
+        queries against mostly seq-scanned tables.
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        return get_db_health(self.env, limit=int(limit))
 
-        relations = []
-        basic_fields = []
-        computed_fields = []
-
-        # Iterate over _fields to get the actual field objects for accurate property access
-        for field_name, field in Model._fields.items():
-            if field_name not in fields_info:
-                continue
-
-            info = fields_info[field_name]
-
-            field_data = {
-                "name": field_name,
-                "string": info.get("string", field.string or field_name),
-                "type": info["type"],
-                "required": field.required,
-                "readonly": field.readonly,
-                "store": field.store,
-                "help": info.get("help", field.help or ""),
+    @api.model
+    def create_bulk_run_rpc(self, model, domain, code, chunk_size=1000, rate_limit=0, name=None):
+        """
+        Creates a chunked, resumable bulk run applying `code` (with the chunk as
+        `records`) to the records of `domain`. Run it with run_bulk_rpc.
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        if model not in self.env:
+            return {"error": f"Model '{model}' not found."}
+        self._check_blocked_patterns(code)
+        _logger.warning(
+            "WEB_SHELL AUDIT - User: %s (ID: %d) creating bulk run on %s %s: %s",
+            self.env.user.login,
+            self.env.user.id,
+            model,
+            domain,
+            code[:500],
+        )
+        run = self.env["web.shell.bulk.run"].create(
+            {
+                "name": name or f"{model} {domain}",
+                "model_name": model,
+                "domain": domain if isinstance(domain, str) else repr(domain),
+                "code": code,
+                "chunk_size": max(1, int(chunk_size)),
+                "rate_limit": max(0.0, float(rate_limit or 0)),
             }
+        )
+        run._get_domain()  # Fail now on an invalid domain
+        return run._progress()
 
-            # Check if field is relational
-            if field.type in ("many2one", "one2many", "many2many"):
-                field_data["relation"] = field.comodel_name
-                relations.append(field_data)
-            # Check if field is computed (and not stored, or stored but computed)
-            elif field.compute:
-                field_data["compute"] = True
-                computed_fields.append(field_data)
-            else:
-                basic_fields.append(field_data)
+    @api.model
+    def run_bulk_rpc(self, run_id, max_seconds=20):
+        """
+        Runs (or resumes) a bulk run for up to max_seconds, committing every chunk.
+        The client calls it again while the returned state is "paused".
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        return self.env["web.shell.bulk.run"].run_chunks(run_id, max_seconds=min(float(max_seconds), 60))
 
-        return {
-            "model": model_name,
-            "description": Model._description,
-            "relations": relations,
-            "basic_fields": basic_fields,
-            "computed_fields": computed_fields,
-            "total_fields": len(fields_info),
-        }
+    @api.model
+    def get_bulk_runs_rpc(self, limit=20):
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        runs = self.env["web.shell.bulk.run"].search([], limit=int(limit))
+        return [run._progress() for run in runs]
+
+    @api.model
+    def cancel_bulk_run_rpc(self, run_id):
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        run = self.env["web.shell.bulk.run"].browse(int(run_id)).exists()
+        if run and run.state not in ("done", "cancelled"):
+            run.write({"state": "cancelled", "finished_at": fields.Datetime.now()})
+        return run._progress() if run else {"error": f"Bulk run {run_id} not found"}
+
+    @api.model
+    def sql_query_rpc(self, query, offset=0, page_size=200):
+        """
+        Runs a single SELECT in a read-only transaction (statement timeout:
+        web_shell.timeout) and returns the page of rows starting at `offset`,
+        with column types. Nothing is kept open between pages.
+        """
+        if not self.env.user.has_group("base.group_system"):
+            raise Exception("Access Denied")
+        _logger.warning(
+            "WEB_SHELL AUDIT - User: %s (ID: %d) executing SQL (offset %s): %s",
+            self.env.user.login,
+            self.env.user.id,
+            offset,
+            query[:500],
+        )
+        try:
+            return sql_console.run_query(
+                self.env.cr.dbname,
+                query,
+                offset=offset,
+                page_size=page_size,
+                timeout_ms=self._get_timeout() * 1000,
+            )
+        except Exception as e:
+            return {"error": str(e)}
 
     @api.model
     def profile_rpc(self, code):
@@ -710,6 +988,7 @@ class WebShellConsole(models.Model):
             new_cr.close()
 
         end_time = time.time()
+        metrics.PROFILER_SECONDS.observe(end_time - start_time)
 
         # Process profiler data
         total_queries = 0
@@ -733,6 +1012,7 @@ class WebShellConsole(models.Model):
                     }
                 )
 
+        metrics.PROFILER_QUERIES.observe(total_queries)
         return {
             "total_time": (end_time - start_time) * 1000,  # ms
             "total_queries": total_queries,
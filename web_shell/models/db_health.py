@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+# Part of Web Shell. See LICENSE file for full copyright and licensing details.
+# Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+
+"""
+PostgreSQL table and index health, mapped back to the registry.
+
+Sizes, scan counts and dead tuples come from pg_stat_user_tables,
+pg_stat_user_indexes and pg_class (a handful of catalog queries, no table
+is read). Bloat is the usual statistics-based estimate: the pages the live
+rows should need, from reltuples and the average row width in pg_stats,
+against the pages the table actually has.
+
+Indexing opportunities are columns filtered on in the executed queries, on
+large tables that are mostly sequentially scanned, whose field is stored
+with index=False and that do not lead any existing index. Queries come from
+pg_stat_statements when the extension is available (every connection to the
+database since its statistics were reset), otherwise from the slow query
+sampler of the worker serving the request only, which the result says.
+Filters are read from WHERE clauses: "table"."column" and alias-qualified
+columns everywhere, unqualified columns only in single-table queries.
+"""
+
+import math
+import os
+import re
+
+import psycopg2
+
+from . import query_sampler
+
+# Below this many rows sequential scans are normal and not reported
+MIN_ROWS = 1000
+DEAD_RATIO = 0.2
+BLOAT_RATIO = 0.3
+SEQ_RATIO = 0.5
+
+# Per-tuple overhead used by the bloat estimate: header (23, aligned to 24) + item pointer
+TUPLE_OVERHEAD = 28
+PAGE_HEADER = 24
+
+_WHERE = re.compile(
+    r"\bWHERE\b(.*?)(?:\bGROUP BY\b|\bORDER BY\b|\bLIMIT\b|\bOFFSET\b|\bFOR UPDATE\b|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+_QUALIFIED = re.compile(r'"?(\w+)"?\s*\.\s*"?(\w+)"?')
+# A column right before a comparison, not part of a qualified name or a $n parameter
+_UNQUALIFIED = re.compile(
+    r'(?<![\w."$])"?([A-Za-z_]\w*)"?(?=\s*(?:=|<>|!=|<|>|\bIN\b|\bIS\b|\bNOT\b|\bI?LIKE\b|\bBETWEEN\b))',
+    re.IGNORECASE,
+)
+_RELATION = re.compile(r'\b(?:FROM|JOIN)\s+"?(\w+)"?(?:\s+(?:AS\s+)?"?(\w+)"?)?', re.IGNORECASE)
+# FROM a, b: unqualified columns can't be attributed
+_COMMA_JOIN = re.compile(r"\bFROM\b(?:(?!\bWHERE\b)[^(])*,", re.IGNORECASE)
+_KEYWORDS = {"and", "or", "not", "is", "null", "true", "false", "exists"}
+_NOT_ALIASES = {
+    "where", "join", "left", "right", "inner", "full", "cross", "natural", "on", "using",
+    "group", "order", "limit", "offset", "for", "union", "window", "having", "as",
+}
+
+# Most expensive statements read from pg_stat_statements
+MAX_STATEMENTS = 1000
+
+
+def _isoformat(value):
+    return value.isoformat() if value else None
+
+
+def _table_owners(registry):
+    """{table: [owner]}: the models stored in it, or the many2many fields using it."""
+    owners = {}
+    for model_name, Model in registry.items():
+        if Model._abstract or not Model._auto:
+            continue
+        owners.setdefault(Model._table, []).append(model_name)
+        for field in Model._fields.values():
+            if field.type == "many2many" and field.store and field.relation:
+                owners.setdefault(field.relation, []).append(f"{model_name}.{field.name} (m2m)")
+    return {table: sorted(set(names)) for table, names in owners.items()}
+
+
+def _table_stats(cr):
+    cr.execute("SELECT current_setting('block_size')::int")
+    block_size = cr.fetchone()[0]
+    cr.execute(
+        """
+        SELECT tablename, SUM(avg_width)
+          FROM pg_stats
+         WHERE schemaname = current_schema()
+      GROUP BY tablename
+        """
+    )
+    row_widths = dict(cr.fetchall())
+    cr.execute(
+        """
+        SELECT s.relname, s.seq_scan, s.seq_tup_read, COALESCE(s.idx_scan, 0),
+               s.n_live_tup, s.n_dead_tup,
+               GREATEST(s.last_vacuum, s.last_autovacuum),
+               GREATEST(s.last_analyze, s.last_autoanalyze),
+               pg_total_relation_size(s.relid), pg_relation_size(s.relid), pg_indexes_size(s.relid),
+               c.relpages, c.reltuples
+          FROM pg_stat_user_tables s
+          JOIN pg_class c ON c.oid = s.relid
+         WHERE s.schemaname = current_schema()
+        """
+    )
+    tables = {}
+    for (
+        table, seq_scan, seq_tup_read, idx_scan, live, dead, vacuumed, analyzed,
+        total_bytes, table_bytes, index_bytes, relpages, reltuples,
+    ) in cr.fetchall():
+        scans = seq_scan + idx_scan
+        bloat_bytes = bloat_ratio = None
+        width = row_widths.get(table)
+        if width is not None and relpages:
+            tuples_per_page = max(1, (block_size - PAGE_HEADER) // (width + TUPLE_OVERHEAD))
+            expected_pages = math.ceil(max(0, reltuples) / tuples_per_page)
+            bloat_bytes = max(0, relpages - expected_pages) * block_size
+            bloat_ratio = round(bloat_bytes / (relpages * block_size), 3)
+        dead_ratio = round(dead / (live + dead), 3) if live + dead else 0.0
+        seq_ratio = round(seq_scan / scans, 3) if scans else None
+
+        flags = []
+        if live >= MIN_ROWS and seq_ratio is not None and seq_ratio >= SEQ_RATIO:
+            flags.append("seq_scans")
+        if live + dead >= MIN_ROWS and dead_ratio >= DEAD_RATIO:
+            flags.append("dead_tuples")
+        if bloat_ratio is not None and relpages * block_size >= 8 * 1024 * 1024 and bloat_ratio >= BLOAT_RATIO:
+            flags.append("bloat")
+
+        tables[table] = {
+            "table": table,
+            "size": total_bytes,
+            "table_bytes": table_bytes,
+            "index_bytes": index_bytes,
+            "rows": live,
+            "dead": dead,
+            "dead_ratio": dead_ratio,
+            "seq_scan": seq_scan,
+            "seq_tup_read": seq_tup_read,
+            "idx_scan": idx_scan,
+            "seq_ratio": seq_ratio,
+            "avg_seq_rows": round(seq_tup_read / seq_scan) if seq_scan else 0,
+            "bloat_bytes": bloat_bytes,
+            "bloat_ratio": bloat_ratio,
+            "last_vacuum": _isoformat(vacuumed),
+            "last_analyze": _isoformat(analyzed),
+            "flags": flags,
+        }
+    return tables
+
+
+def _index_stats(cr):
+    cr.execute(
+        """
+        SELECT s.relname, s.indexrelname, s.idx_scan, pg_relation_size(s.indexrelid),
+               i.indisunique, i.indisprimary, a.attname, pg_get_indexdef(s.indexrelid)
+          FROM pg_stat_user_indexes s
+          JOIN pg_index i ON i.indexrelid = s.indexrelid
+     LEFT JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = i.indkey[0]
+         WHERE s.schemaname = current_schema()
+        """
+    )
+    return [
+        {
+            "table": table,
+            "index": index,
+            "scans": scans,
+            "size": size,
+            "unique": unique,
+            "primary": primary,
+            "leading_column": column,
+            "definition": definition,
+        }
+        for table, index, scans, size, unique, primary, column, definition in cr.fetchall()
+    ]
+
+
+def _query_filters(query):
+    """{(table, column)} filtered on in the WHERE clauses of query."""
+    aliases = {}
+    for table, alias in _RELATION.findall(query):
+        aliases[table] = table
+        if alias and alias.lower() not in _NOT_ALIASES:
+            aliases[alias] = table
+    tables = set(aliases.values())
+    single = next(iter(tables)) if len(tables) == 1 and not _COMMA_JOIN.search(query) else None
+
+    columns = set()
+    for match in _WHERE.finditer(query):
+        clause = match.group(1)
+        for alias, column in _QUALIFIED.findall(clause):
+            if alias in aliases:
+                columns.add((aliases[alias], column))
+        if single:
+            columns.update(
+                (single, column) for column in _UNQUALIFIED.findall(clause) if column.lower() not in _KEYWORDS
+            )
+    return columns
+
+
+def _add_filters(filters, query, count, total_ms):
+    for key in _query_filters(query):
+        data = filters.get(key)
+        if data is None:
+            data = filters[key] = {"queries": 0, "total_ms": 0.0, "example": query}
+        data["queries"] += count
+        data["total_ms"] += total_ms
+
+
+def _statement_filters(cr):
+    """
+    (filters, statements) from pg_stat_statements for the current database,
+    or None when the extension is not installed or readable.
+    """
+    cr.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_stat_statements'")
+    if not cr.fetchone():
+        return None
+    total_column = "total_exec_time" if cr._cnx.server_version >= 130000 else "total_time"
+    try:
+        with cr.savepoint(flush=False):
+            cr.execute(
+                f"""
+                SELECT query, calls, {total_column}
+                  FROM pg_stat_statements
+                 WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+              ORDER BY {total_column} DESC
+                 LIMIT %s
+                """,
+                [MAX_STATEMENTS],
+                log_exceptions=False,
+            )
+            rows = cr.fetchall()
+    except psycopg2.Error:
+        # Installed but not in shared_preload_libraries
+        return None
+    filters = {}
+    for query, calls, total_ms in rows:
+        _add_filters(filters, query, calls, total_ms)
+    return filters, len(rows)
+
+
+def _sampled_filters(dbname):
+    """(filters, entries) from the slow query sampler of this worker."""
+    filters = {}
+    entries = [entry for entry in list(query_sampler.ENTRIES) if entry["db"] == dbname]
+    for entry in entries:
+        _add_filters(filters, entry["fingerprint"], 1, entry["duration_ms"])
+    return filters, len(entries)
+
+
+def _index_candidates(env, tables, indexes, filters):
+    registry = env.registry
+    models_by_table = {}
+    for model_name, Model in registry.items():
+        if not Model._abstract and Model._auto:
+            models_by_table.setdefault(Model._table, []).append(Model)
+    leading = {(index["table"], index["leading_column"]) for index in indexes}
+
+    candidates = []
+    for (table, column), data in filters.items():
+        stats = tables.get(table)
+        if not stats or "seq_scans" not in stats["flags"]:
+            continue
+        if column == "id" or (table, column) in leading:
+            continue
+        for Model in models_by_table.get(table, ()):
+            field = Model._fields.get(column)
+            if field is None or not field.store or not field.column_type or field.index:
+                continue
+            candidates.append(
+                {
+                    "model": Model._name,
+                    "field": column,
+                    "type": field.type,
+                    "table": table,
+                    "rows": stats["rows"],
+                    "seq_scan": stats["seq_scan"],
+                    "seq_ratio": stats["seq_ratio"],
+                    "queries": data["queries"],
+                    "total_ms": round(data["total_ms"], 3),
+                    "example": data["example"],
+                }
+            )
+            break
+    if candidates:
+        env.cr.execute(
+            """
+            SELECT tablename, attname, n_distinct
+              FROM pg_stats
+             WHERE schemaname = current_schema() AND tablename IN %s
+            """,
+            [tuple({c["table"] for c in candidates})],
+        )
+        distinct = {(table, column): n for table, column, n in env.cr.fetchall()}
+        for candidate in candidates:
+            # Negative: a fraction of the rows (-1 = unique), positive: an absolute count
+            n_distinct = distinct.get((candidate["table"], candidate["field"]))
+            if n_distinct is not None and n_distinct < 0:
+                n_distinct = round(-n_distinct * candidate["rows"])
+            candidate["distinct"] = n_distinct
+    candidates.sort(key=lambda c: c["total_ms"], reverse=True)
+    return candidates
+
+
+def get_db_health(env, limit=100):
+    """
+    Per-table size, bloat estimate, dead tuples and scan ratios with the models
+    stored in each table, unused indexes, and index=False fields that are
+    filtered on by sampled queries against mostly seq-scanned tables.
+    """
+    cr = env.cr
+    tables = _table_stats(cr)
+    indexes = _index_stats(cr)
+    owners = _table_owners(env.registry)
+    for table, stats in tables.items():
+        stats["models"] = owners.get(table, [])
+
+    unused = [
+        dict(index, models=owners.get(index["table"], []))
+        for index in indexes
+        if not index["scans"] and not index["unique"] and not index["primary"]
+    ]
+    unused.sort(key=lambda index: index["size"], reverse=True)
+
+    cr.execute("SELECT stats_reset FROM pg_stat_database WHERE datname = current_database()")
+    row = cr.fetchone()
+
+    statements = _statement_filters(cr)
+    if statements is not None:
+        filters, queries = statements
+        source = {"source": "pg_stat_statements", "queries": queries, "worker_pid": None}
+    else:
+        filters, queries = _sampled_filters(cr.dbname)
+        source = {"source": "sampler", "queries": queries, "worker_pid": os.getpid()}
+
+    return {
+        "tables": sorted(tables.values(), key=lambda t: t["size"], reverse=True)[:limit],
+        "unused_indexes": unused[:limit],
+        "candidates": _index_candidates(env, tables, indexes, filters)[:limit],
+        # Where the candidates' filters come from: the sampler is per worker
+        "candidates_source": source,
+        "totals": {
+            "tables": len(tables),
+            "size": sum(t["size"] for t in tables.values()),
+            "unused_index_bytes": sum(index["size"] for index in unused),
+        },
+        "stats_reset": _isoformat(row and row[0]),
+    }
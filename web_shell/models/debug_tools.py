@@ -1,11 +1,28 @@
 # -*- coding: utf-8 -*-
 import logging
+import sys
 import odoo
 from odoo import models
 
 _logger = logging.getLogger(__name__)
 
 
+def registry_signature(env, cache_name=None):
+    """
+    Identifies the current state of env's registry in this worker: it changes on
+    registry reload and, when cache_name is given, whenever that ormcache is cleared.
+    """
+    registry = env.registry
+    signature = (id(registry), getattr(registry, "registry_sequence", None))
+    if cache_name:
+        cache_sequences = getattr(registry, "cache_sequences", None)
+        if cache_sequences is not None:
+            signature += (cache_sequences.get(cache_name),)
+        else:
+            signature += (getattr(registry, "cache_sequence", None),)
+    return signature
+
+
 # Cache Inspection Tools
 def get_cache_info(env, model_name, record_id):
     """
@@ -79,23 +96,166 @@ def get_cache_info(env, model_name, record_id):
         return {"error": str(e)}
 
 
+def _estimate_size(value):
+    """Rough memory footprint of a cached value (shallow, plus x2many id tuples)."""
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list, frozenset, set)):
+        size += sum(sys.getsizeof(item) for item in value)
+    return size
+
+
+def get_env_cache_stats(env):
+    """
+    Walks the whole environment cache once and aggregates it per model and per field.
+    Odoo 17 stores it as {field: {record_id: value}}, or {field: {context_key: {record_id: value}}}
+    for fields that depend on the context.
+    """
+    data = getattr(env.cache, "_data", None)
+    if data is None:
+        return {"error": "Environment cache layout not supported by this Odoo version"}
+    dirty = getattr(env.cache, "_dirty", {})
+
+    stats = {}
+    model_ids = {}
+    for field, field_cache in list(data.items()):
+        if field.depends_context:
+            caches = list(field_cache.values())
+        else:
+            caches = [field_cache]
+
+        ids = set()
+        values = 0
+        size = sys.getsizeof(field_cache)
+        for cache in caches:
+            ids.update(cache)
+            values += len(cache)
+            size += sum(_estimate_size(v) for v in cache.values())
+        if not values:
+            continue
+
+        model_stats = stats.setdefault(
+            field.model_name,
+            {"records": 0, "values": 0, "bytes": 0, "dirty": 0, "fields": {}},
+        )
+        model_stats["fields"][field.name] = {
+            "records": len(ids),
+            "values": values,
+            "bytes": size,
+            "dirty": len(dirty.get(field, ())),
+        }
+        model_stats["values"] += values
+        model_stats["bytes"] += size
+        model_stats["dirty"] += len(dirty.get(field, ()))
+        model_ids.setdefault(field.model_name, set()).update(ids)
+
+    for model_name, ids in model_ids.items():
+        stats[model_name]["records"] = len(ids)
+
+    return {
+        "models": stats,
+        "totals": {
+            "models": len(stats),
+            "records": sum(m["records"] for m in stats.values()),
+            "values": sum(m["values"] for m in stats.values()),
+            "bytes": sum(m["bytes"] for m in stats.values()),
+        },
+    }
+
+
+def diff_env_cache_stats(before, after):
+    """Returns the per-model/per-field growth between two get_env_cache_stats() snapshots."""
+    keys = ("records", "values", "bytes", "dirty")
+    empty = dict.fromkeys(keys, 0)
+    before_models = before.get("models", {})
+    after_models = after.get("models", {})
+
+    models_diff = []
+    for model_name in set(before_models) | set(after_models):
+        old = before_models.get(model_name, {"fields": {}, **empty})
+        new = after_models.get(model_name, {"fields": {}, **empty})
+        delta = {key: new[key] - old[key] for key in keys}
+
+        fields_diff = []
+        for field_name in set(old["fields"]) | set(new["fields"]):
+            old_field = old["fields"].get(field_name, empty)
+            new_field = new["fields"].get(field_name, empty)
+            field_delta = {key: new_field[key] - old_field[key] for key in keys}
+            if any(field_delta.values()):
+                fields_diff.append({"field": field_name, **field_delta})
+
+        if any(delta.values()) or fields_diff:
+            fields_diff.sort(key=lambda f: f["values"], reverse=True)
+            models_diff.append({"model": model_name, **delta, "fields": fields_diff})
+
+    models_diff.sort(key=lambda m: m["values"], reverse=True)
+    before_totals = before.get("totals", {})
+    after_totals = after.get("totals", {})
+    return {
+        "models": models_diff,
+        "totals": {
+            key: after_totals.get(key, 0) - before_totals.get(key, 0)
+            for key in ("models", "records", "values", "bytes")
+        },
+    }
+
+
+def get_xml_ids(env, model_name, ids):
+    """Returns {res_id: 'module.name'} for the given records in a single query."""
+    xml_ids = {}
+    for data in env["ir.model.data"].sudo().search_read(
+        [("model", "=", model_name), ("res_id", "in", list(ids))],
+        ["module", "name", "res_id"],
+    ):
+        xml_ids.setdefault(data["res_id"], f"{data['module']}.{data['name']}")
+    return xml_ids
+
+
 def get_view_inheritance(env, view_id):
-    """Returns a recursive tree of views inheriting from the given view_id."""
-    view = env["ir.ui.view"].browse(int(view_id))
+    """
+    Returns the tree of views inheriting from the given view_id.
+    All descendants are fetched with a single child_of search and one batched
+    ir.model.data read; the tree is then assembled in memory. Only metadata is
+    returned, archs are loaded on demand through get_view_arch().
+    """
+    View = env["ir.ui.view"]
+    view = View.browse(int(view_id))
     if not view.exists():
         return {}
 
-    def get_children(v):
-        # Search for views that inherit from v
-        # We use [('inherit_id', '=', v.id)] to find direct children
-        children = env["ir.ui.view"].search([("inherit_id", "=", v.id)])
-        return {
-            "id": v.id,
-            "name": v.name,
-            "xml_id": v.xml_id or f"__export__.{v.id}",
-            "model": v.model,
-            "arch_db": v.arch_db,
-            "children": [get_children(child) for child in children],
+    view_fields = ["name", "model", "inherit_id", "priority", "mode", "type"]
+    rows = view.read(view_fields) + View.search_read(
+        [("inherit_id", "child_of", view.id)],
+        view_fields,
+        order="priority, id",
+    )
+    ids = [row["id"] for row in rows]
+
+    xml_ids = get_xml_ids(env, "ir.ui.view", ids)
+
+    nodes = {}
+    for row in rows:
+        nodes[row["id"]] = {
+            "id": row["id"],
+            "name": row["name"],
+            "xml_id": xml_ids.get(row["id"], f"__export__.{row['id']}"),
+            "model": row["model"],
+            "priority": row["priority"],
+            "mode": row["mode"],
+            "type": row["type"],
+            "children": [],
         }
 
-    return get_children(view)
+    for row in rows:
+        parent_id = row["inherit_id"] and row["inherit_id"][0]
+        if row["id"] != view.id and parent_id in nodes:
+            nodes[parent_id]["children"].append(nodes[row["id"]])
+
+    return nodes[view.id]
+
+
+def get_view_arch(env, view_id):
+    """Returns the raw arch of a single view, loaded when a node is opened."""
+    view = env["ir.ui.view"].browse(int(view_id))
+    if not view.exists():
+        return {"error": f"View {view_id} not found"}
+    return {"id": view.id, "name": view.name, "arch": view.arch_db or ""}
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Part of Web Shell. See LICENSE file for full copyright and licensing details.
+# Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+
+from odoo import models
+from odoo.http import request
+
+from .ormcache_stats import observe_invalidations
+
+
+class IrHttp(models.AbstractModel):
+    _inherit = "ir.http"
+
+    @classmethod
+    def _pre_dispatch(cls, rule, args):
+        super()._pre_dispatch(rule, args)
+        # Settings changed from another worker (a signalled ormcache clear)
+        request.env["web.shell.console"]._refresh_query_sampler()
+        # Invalidations signalled by other workers were applied before dispatching
+        observe_invalidations(request.env.registry, request.env.cr.dbname)
@@ -6,6 +6,8 @@ import logging
 import odoo
 from odoo.http import request
 
+from .metrics import BUS_MESSAGES
+
 _logger = logging.getLogger(__name__)
 
 
@@ -39,6 +41,7 @@ class BusLogHandler(logging.Handler):
                     "time": getattr(record, "asctime", str(record.created)),
                 },
             )
+            BUS_MESSAGES.inc(level=record.levelname)
         except (RuntimeError, AttributeError, KeyError, TypeError):
             # Context unavailable
             pass
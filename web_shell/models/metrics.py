@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+# Part of Web Shell. See LICENSE file for full copyright and licensing details.
+# Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+
+"""
+Per-worker metrics of the DevTools themselves, rendered in the Prometheus
+text exposition format by the /web_shell/metrics controller.
+
+Counters and histograms are plain dicts updated in place (a few dict
+operations per observation, no locks: each worker has its own copy and
+CPython makes the increments atomic enough for monitoring). Every sample is
+labelled with the worker pid; sum over pid in the queries.
+"""
+
+import os
+import sys
+import time
+from bisect import bisect_left
+
+# Default buckets, in seconds and in queries
+TIME_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+QUERY_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+METRICS = []
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        METRICS.append(self)
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _labels(self, key, extra=()):
+        pairs = [("pid", str(os.getpid()))] + list(zip(self.labelnames, key)) + list(extra)
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def render(self):
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self.samples()
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self.values = {}
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def samples(self):
+        for key, value in list(self.values.items()):
+            yield f"{self.name}{self._labels(key)} {value}"
+
+
+class Gauge(_Metric):
+    """Gauge whose value is computed at scrape time by `function`."""
+
+    kind = "gauge"
+
+    def __init__(self, name, documentation, function):
+        super().__init__(name, documentation)
+        self.function = function
+
+    def samples(self):
+        yield f"{self.name}{self._labels(())} {self.function()}"
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=TIME_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        # {label key: [count per bucket (+Inf last), sum]}
+        self.values = {}
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        data = self.values.get(key)
+        if data is None:
+            data = self.values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+        data[0][bisect_left(self.buckets, value)] += 1
+        data[1] += value
+
+    def samples(self):
+        for key, (counts, total) in list(self.values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += count
+                yield f"{self.name}_bucket{self._labels(key, [('le', bound)])} {cumulative}"
+            yield f"{self.name}_sum{self._labels(key)} {total}"
+            yield f"{self.name}_count{self._labels(key)} {cumulative}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render():
+    """All metrics of this worker in the Prometheus text format."""
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def _session_count():
+    from .console import SESSION_LOCALS
+
+    return len(SESSION_LOCALS)
+
+
+def _session_bytes():
+    from .console import SESSION_LOCALS
+
+    # Shallow estimate: the variables and their direct content, not the objects they reference
+    total = 0
+    for variables in list(SESSION_LOCALS.values()):
+        total += sys.getsizeof(variables)
+        for value in list(variables.values()):
+            total += sys.getsizeof(value)
+            if isinstance(value, (tuple, list, set, frozenset, dict)):
+                total += sum(sys.getsizeof(item) for item in value)
+    return total
+
+
+PROCESS_STARTED = time.time()
+
+EXECUTE_SECONDS = Histogram(
+    "web_shell_execute_command_seconds",
+    "Wall time of execute_command calls.",
+    ["safe_mode"],
+)
+EXECUTE_QUERIES = Histogram(
+    "web_shell_execute_command_queries",
+    "SQL queries run by execute_command calls.",
+    ["safe_mode"],
+    buckets=QUERY_BUCKETS,
+)
+EXECUTE_ERRORS = Counter(
+    "web_shell_execute_command_errors_total",
+    "execute_command calls that raised or printed a traceback.",
+)
+READ_LOGS_SECONDS = Histogram(
+    "web_shell_read_logs_seconds",
+    "Wall time of read_logs calls.",
+)
+READ_LOGS_BYTES = Counter(
+    "web_shell_read_logs_bytes_total",
+    "Bytes read from the log file by read_logs.",
+)
+READ_LOGS_LINES = Counter(
+    "web_shell_read_logs_lines_total",
+    "Log lines parsed by read_logs.",
+)
+BUS_MESSAGES = Counter(
+    "web_shell_bus_log_messages_total",
+    "Log records sent on the bus by BusLogHandler.",
+    ["level"],
+)
+PROFILER_SECONDS = Histogram(
+    "web_shell_profiler_seconds",
+    "Duration of profile_rpc runs.",
+)
+PROFILER_QUERIES = Histogram(
+    "web_shell_profiler_queries",
+    "SQL queries recorded by profile_rpc runs.",
+    buckets=QUERY_BUCKETS,
+)
+SESSIONS = Gauge(
+    "web_shell_sessions",
+    "Live shell sessions (users with persisted variables) in this worker.",
+    _session_count,
+)
+SESSION_BYTES = Gauge(
+    "web_shell_session_bytes",
+    "Estimated memory held by the persisted shell variables of this worker.",
+    _session_bytes,
+)
+UPTIME = Gauge(
+    "web_shell_worker_uptime_seconds",
+    "Seconds since web_shell was loaded in this worker.",
+    lambda: round(time.time() - PROCESS_STARTED, 1),
+)
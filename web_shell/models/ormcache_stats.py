@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+# Part of Web Shell. See LICENSE file for full copyright and licensing details.
+# Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+
+"""
+Per-worker ormcache statistics.
+
+Hit/miss counts come from Odoo's own odoo.tools.cache.STAT. The LRU used by
+the registry caches knows neither evictions nor which keys are hot, so while
+a measurement window is open the caches of the measured database switch
+their class to a subclass counting them: reset_ormcache_stats() switches
+them and stop_ormcache_stats() switches them back. The shared LRU class is
+never patched, and caches of other databases, or created by a registry
+reload, are left alone. A "window" is a baseline snapshot: stats read with
+window=True are the deltas since the last reset.
+
+Invalidations are always recorded, from the cache sequences of the registry:
+observe_invalidations() runs at the start of every request (after Odoo
+applied the changes signalled by other workers) and notes when each
+sequence changed.
+"""
+
+import threading
+import time
+from collections import Counter
+
+from odoo.tools import lru
+from odoo.tools.cache import STAT
+
+# {(id(lru), model, method): evicted entries}
+EVICTIONS = Counter()
+
+# {(dbname, cache_name): (cache sequence, timestamp it was first seen changed, or None)}
+CACHE_SEQUENCES = {}
+
+# {dbname: timestamp of the last registry load in this worker}
+REGISTRY_LOADED_AT = {}
+
+# Measurement window: baseline counters, and per-key hits while track_keys is on
+WINDOW = {"started": None, "baseline": {}, "evictions": {}, "track_keys": False}
+HOT_KEYS = Counter()
+# HOT_KEYS is shared by the caches of every database: one lock for all of them
+_HOT_KEYS_LOCK = threading.Lock()
+
+# Bound of the hot keys counter, pruned to its most common half when exceeded
+HOT_KEYS_MAX = 5000
+
+# {dbname: [LRU]} caches whose class is switched to _MeasuredLRU
+_MEASURED = {}
+_INSTALL_LOCK = threading.Lock()
+
+
+class _MeasuredLRU(lru.LRU):
+    """LRU counting hot keys and evictions, set as __class__ of measured caches."""
+
+    # Same layout as LRU, so __class__ can be switched both ways
+    __slots__ = ()
+
+    def __getitem__(self, obj):
+        value = super().__getitem__(obj)
+        if WINDOW["track_keys"]:
+            with _HOT_KEYS_LOCK:
+                HOT_KEYS[(id(self), obj)] += 1
+                if len(HOT_KEYS) > HOT_KEYS_MAX:
+                    kept = HOT_KEYS.most_common(HOT_KEYS_MAX // 2)
+                    HOT_KEYS.clear()
+                    HOT_KEYS.update(dict(kept))
+        return value
+
+    def __setitem__(self, obj, val):
+        # Under the LRU's own reentrant lock, so the evicted end is the one we looked at
+        with self._lock:
+            d = self.d
+            if obj in d or len(d) < self.count:
+                return super().__setitem__(obj, val)
+            # Full: one of the two ends is about to be evicted
+            ends = (next(iter(d)), next(reversed(d)))
+            super().__setitem__(obj, val)
+            for key in ends:
+                if key not in d and isinstance(key, tuple) and len(key) >= 2:
+                    EVICTIONS[(id(self), key[0], getattr(key[1], "__name__", str(key[1])))] += 1
+
+
+def _install_measurement(registry, dbname):
+    with _INSTALL_LOCK:
+        _uninstall_measurement(dbname)
+        caches = [cache for cache in _registry_caches(registry).values() if type(cache) is lru.LRU]
+        for cache in caches:
+            cache.__class__ = _MeasuredLRU
+        _MEASURED[dbname] = caches
+
+
+def _uninstall_measurement(dbname):
+    for cache in _MEASURED.pop(dbname, ()):
+        if type(cache) is _MeasuredLRU:
+            cache.__class__ = lru.LRU
+
+
+def _is_measured(caches):
+    return any(type(cache) is _MeasuredLRU for cache in caches.values())
+
+
+def _cache_sequences(registry):
+    sequences = getattr(registry, "cache_sequences", None)
+    if sequences is not None:
+        return dict(sequences)
+    return {"default": getattr(registry, "cache_sequence", None)}
+
+
+def observe_invalidations(registry, dbname, reset=False):
+    """
+    Notes the time at which a change of each cache sequence of registry is
+    first seen; reset=True (registry load) forgets what was seen before.
+    """
+    now = time.time()
+    if reset:
+        for key in [key for key in CACHE_SEQUENCES if key[0] == dbname]:
+            del CACHE_SEQUENCES[key]
+    for name, sequence in _cache_sequences(registry).items():
+        key = (dbname, name)
+        seen = CACHE_SEQUENCES.get(key)
+        if seen is None:
+            # First look (registry load): nothing known about earlier invalidations
+            CACHE_SEQUENCES[key] = (sequence, None)
+        elif seen[0] != sequence:
+            CACHE_SEQUENCES[key] = (sequence, now)
+
+
+def _registry_caches(registry):
+    """{cache_name: LRU} for Odoo 17 (several named caches) and older (single cache)."""
+    caches = getattr(registry, "_Registry__caches", None)
+    if caches is not None:
+        return dict(caches)
+    cache = getattr(registry, "_Registry__cache", None)
+    return {"default": cache} if cache is not None else {}
+
+
+def _method_name(method):
+    return getattr(method, "__name__", str(method))
+
+
+def _counters(dbname):
+    counters = {}
+    for key, stat in list(STAT.items()):
+        if key[0] != dbname:
+            continue
+        counters[f"{key[1]}.{_method_name(key[2])}"] = {
+            "hit": stat.hit,
+            "miss": stat.miss,
+            "err": getattr(stat, "err", 0),
+            "gen_time": getattr(stat, "gen_time", 0.0),
+        }
+    return counters
+
+
+def _evictions(cache_ids):
+    evictions = Counter()
+    for (cache_id, model, method), count in EVICTIONS.items():
+        if cache_id in cache_ids:
+            evictions[f"{model}.{method}"] += count
+    return evictions
+
+
+def get_ormcache_stats(env, window=False, top_keys=10):
+    """
+    Returns per-method hit/miss/eviction counts, per-cache size against capacity,
+    the hottest keys and the time since the last invalidation, for this worker.
+    """
+    registry = env.registry
+    dbname = env.cr.dbname
+    observe_invalidations(registry, dbname)
+    now = time.time()
+    caches = _registry_caches(registry)
+    cache_ids = {id(cache): name for name, cache in caches.items()}
+
+    counters = _counters(dbname)
+    evictions = _evictions(cache_ids)
+    if window and WINDOW["started"]:
+        for name, base in WINDOW["baseline"].get(dbname, {}).items():
+            if name in counters:
+                for field in ("hit", "miss", "err", "gen_time"):
+                    counters[name][field] -= base[field]
+        evictions.subtract(WINDOW["evictions"].get(dbname, Counter()))
+
+    entries = Counter()
+    cache_info = []
+    for name, cache in caches.items():
+        keys = list(cache.d)
+        for key in keys:
+            if isinstance(key, tuple) and len(key) >= 2:
+                entries[f"{key[0]}.{_method_name(key[1])}"] += 1
+        cleared_at = CACHE_SEQUENCES.get((dbname, name), (None, None))[1]
+        cache_info.append(
+            {
+                "name": name,
+                "size": len(keys),
+                "capacity": getattr(cache, "count", None),
+                "since_clear_s": round(now - cleared_at, 1) if cleared_at else None,
+            }
+        )
+
+    methods = []
+    for name in set(counters) | set(entries) | set(evictions):
+        stat = counters.get(name, {"hit": 0, "miss": 0, "err": 0, "gen_time": 0.0})
+        lookups = stat["hit"] + stat["miss"]
+        methods.append(
+            {
+                "method": name,
+                "hit": stat["hit"],
+                "miss": stat["miss"],
+                "err": stat["err"],
+                "evictions": max(0, evictions.get(name, 0)),
+                "entries": entries.get(name, 0),
+                "hit_ratio": round(stat["hit"] / lookups, 4) if lookups else None,
+                "gen_time_ms": round(stat["gen_time"] * 1000, 2),
+            }
+        )
+    methods.sort(key=lambda m: m["hit"] + m["miss"], reverse=True)
+
+    with _HOT_KEYS_LOCK:
+        counted = HOT_KEYS.most_common()
+    hot_keys = [
+        {"cache": cache_ids[cache_id], "key": repr(key)[:200], "hits": hits}
+        for (cache_id, key), hits in counted
+        if cache_id in cache_ids
+    ][:top_keys]
+
+    loaded_at = REGISTRY_LOADED_AT.get(dbname)
+    return {
+        "methods": methods,
+        "caches": cache_info,
+        "hot_keys": hot_keys,
+        "tracking_keys": WINDOW["track_keys"],
+        "measuring": _is_measured(caches),
+        "window_s": round(now - WINDOW["started"], 1) if window and WINDOW["started"] else None,
+        "since_registry_load_s": round(now - loaded_at, 1) if loaded_at else None,
+    }
+
+
+def reset_ormcache_stats(env, track_keys=True):
+    """
+    Starts a new measurement window: switches the caches of env's registry to
+    the measuring LRU, takes a baseline snapshot and clears the hot key counts.
+    """
+    dbname = env.cr.dbname
+    _install_measurement(env.registry, dbname)
+    WINDOW["started"] = time.time()
+    WINDOW["baseline"][dbname] = _counters(dbname)
+    WINDOW["evictions"][dbname] = _evictions(
+        {id(cache) for cache in _registry_caches(env.registry).values()}
+    )
+    WINDOW["track_keys"] = bool(track_keys)
+    with _HOT_KEYS_LOCK:
+        HOT_KEYS.clear()
+    return {"started": WINDOW["started"], "tracking_keys": WINDOW["track_keys"]}
+
+
+def stop_ormcache_stats(env):
+    """Closes the measurement window and switches env's caches back to the plain LRU."""
+    with _INSTALL_LOCK:
+        _uninstall_measurement(env.cr.dbname)
+    WINDOW["started"] = None
+    WINDOW["track_keys"] = False
+    with _HOT_KEYS_LOCK:
+        HOT_KEYS.clear()
+    return {"started": None, "tracking_keys": False}
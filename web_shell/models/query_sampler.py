@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# Part of Web Shell. See LICENSE file for full copyright and licensing details.
+# Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+
+"""
+Always-on slow query sampler.
+
+sql_db.Cursor.execute is wrapped once per worker: every query is timed
+(two perf_counter calls and a comparison), and only the ones slower than
+the threshold, or a random sampled fraction of all of them, are recorded in
+a bounded ring buffer together with their fingerprint, the route/RPC method
+and user of the current request and a short Python stack.
+
+Settings come from ir.config_parameter (web_shell.slow_query_ms,
+web_shell.query_sample_rate, web_shell.query_sample_size). Every worker
+loads them at registry load and reloads them at the start of an HTTP
+request whenever the default ormcache was cleared since (set_param clears
+it and signals the other workers), so a change applies everywhere.
+"""
+
+import random
+import re
+import threading
+import time
+import traceback
+from collections import deque
+
+from odoo import sql_db
+
+SETTINGS = {
+    "threshold": 0.5,  # seconds, 0 disables
+    "sample_rate": 0.0,  # fraction of all queries, 0 disables
+    "max_entries": 2000,
+}
+# Always the same object: it is trimmed to max_entries in place, never rebound
+ENTRIES = deque()
+
+# {dbname: registry_signature(env, "default")} the settings were last loaded at
+LOADED = {}
+
+# Set while recording, so queries triggered by the recording itself are ignored
+_LOCAL = threading.local()
+
+_STACK_SKIP = ("/odoo/sql_db.py", "/web_shell/models/query_sampler.py")
+
+_FINGERPRINT_RULES = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"\bIN\s*\((?:\s*(?:\?|%s)\s*,?)+\)", re.IGNORECASE), "IN (...)"),
+    (re.compile(r"\s+"), " "),
+]
+
+
+def fingerprint(query):
+    """Query text with literals and IN lists collapsed, so repeated shapes group together."""
+    for pattern, replacement in _FINGERPRINT_RULES:
+        query = pattern.sub(replacement, query)
+    return query.strip()
+
+
+def _trim():
+    for _ in range(len(ENTRIES) - SETTINGS["max_entries"]):
+        try:
+            ENTRIES.popleft()
+        except IndexError:
+            break
+
+
+def configure(threshold_ms=None, sample_rate=None, max_entries=None):
+    if threshold_ms is not None:
+        SETTINGS["threshold"] = max(0.0, float(threshold_ms)) / 1000
+    if sample_rate is not None:
+        SETTINGS["sample_rate"] = min(1.0, max(0.0, float(sample_rate)))
+    if max_entries is not None:
+        SETTINGS["max_entries"] = max(1, int(max_entries))
+        _trim()
+    return get_settings()
+
+
+def get_settings():
+    return {
+        "threshold_ms": SETTINGS["threshold"] * 1000,
+        "sample_rate": SETTINGS["sample_rate"],
+        "max_entries": SETTINGS["max_entries"],
+    }
+
+
+def _request_context():
+    """Route, RPC method and user of the current HTTP request, if any."""
+    from odoo.http import request
+
+    context = {"route": None, "method": None, "uid": None}
+    try:
+        if not request:
+            return context
+        context["route"] = request.httprequest.path
+        params = getattr(request, "params", None) or {}
+        if params.get("model") and params.get("method"):
+            context["method"] = f"{params['model']}.{params['method']}"
+        session = getattr(request, "session", None)
+        context["uid"] = session.uid if session else None
+    except (RuntimeError, AttributeError):
+        pass
+    return context
+
+
+def _short_stack(limit=8):
+    frames = [
+        f"{frame.filename.rsplit('/odoo/', 1)[-1]}:{frame.lineno} {frame.name}"
+        for frame in traceback.extract_stack()
+        if not frame.filename.endswith(_STACK_SKIP)
+    ]
+    return frames[-limit:]
+
+
+def _record(cursor, query, duration, slow):
+    _LOCAL.recording = True
+    try:
+        text = query if isinstance(query, str) else str(getattr(query, "code", query))
+        ENTRIES.append(
+            {
+                "fingerprint": fingerprint(text)[:2000],
+                "query": text[:2000],
+                "duration_ms": round(duration * 1000, 3),
+                "slow": slow,
+                "db": cursor.dbname,
+                "time": time.time(),
+                "stack": _short_stack(),
+                **_request_context(),
+            }
+        )
+        _trim()
+    except Exception:
+        # Never let the sampler break a query
+        pass
+    finally:
+        _LOCAL.recording = False
+
+
+def _wrap_execute():
+    if getattr(sql_db.Cursor, "_web_shell_sampled", False):
+        return
+    original_execute = sql_db.Cursor.execute
+
+    def execute(self, query, params=None, log_exceptions=True):
+        start = time.perf_counter()
+        try:
+            return original_execute(self, query, params, log_exceptions)
+        finally:
+            duration = time.perf_counter() - start
+            threshold = SETTINGS["threshold"]
+            slow = bool(threshold) and duration >= threshold
+            sample_rate = SETTINGS["sample_rate"]
+            if (slow or (sample_rate and random.random() < sample_rate)) and not getattr(
+                _LOCAL, "recording", False
+            ):
+                _record(self, query, duration, slow)
+
+    sql_db.Cursor.execute = execute
+    sql_db.Cursor._web_shell_sampled = True
+
+
+_wrap_execute()
+
+
+def get_query_samples(dbname, limit=100, group=True):
+    """
+    Recorded queries of this worker for dbname, aggregated by fingerprint
+    (count, total/avg/max duration, routes, users, slowest example with its stack).
+    """
+    entries = [entry for entry in list(ENTRIES) if entry["db"] == dbname]
+    if not group:
+        return {
+            "entries": sorted(entries, key=lambda e: e["time"], reverse=True)[:limit],
+            "settings": get_settings(),
+        }
+
+    groups = {}
+    for entry in entries:
+        data = groups.get(entry["fingerprint"])
+        if data is None:
+            data = groups[entry["fingerprint"]] = {
+                "fingerprint": entry["fingerprint"],
+                "count": 0,
+                "slow": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "last_seen": 0,
+                "routes": {},
+                "users": set(),
+                "example": entry,
+            }
+        data["count"] += 1
+        data["slow"] += entry["slow"]
+        data["total_ms"] += entry["duration_ms"]
+        data["last_seen"] = max(data["last_seen"], entry["time"])
+        route = entry["method"] or entry["route"] or "(no request)"
+        data["routes"][route] = data["routes"].get(route, 0) + 1
+        if entry["uid"]:
+            data["users"].add(entry["uid"])
+        if entry["duration_ms"] >= data["max_ms"]:
+            data["max_ms"] = entry["duration_ms"]
+            data["example"] = entry
+
+    result = []
+    for data in groups.values():
+        data["avg_ms"] = round(data["total_ms"] / data["count"], 3)
+        data["total_ms"] = round(data["total_ms"], 3)
+        data["routes"] = sorted(data["routes"].items(), key=lambda r: r[1], reverse=True)[:5]
+        data["users"] = sorted(data["users"])
+        result.append(data)
+    result.sort(key=lambda g: g["total_ms"], reverse=True)
+    return {
+        "groups": result[:limit],
+        "entries": len(entries),
+        "settings": get_settings(),
+    }
+
+
+def clear_query_samples():
+    ENTRIES.clear()
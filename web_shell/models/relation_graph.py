@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+# Part of Web Shell. See LICENSE file for full copyright and licensing details.
+# Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+
+"""
+Registry-wide model relationship graph.
+
+Built once per registry signature from the field objects of the registry
+(no fields_get, no queries) and kept per worker. Models are numbered and
+edges stored as adjacency lists of (target, field, kind) so neighborhoods
+and shortest relation paths are plain BFS walks. Only field names are kept
+per model; labels are read with fields_get the first time a model is
+requested in a language and kept on the graph, i.e. per (registry
+signature, language).
+"""
+
+import logging
+import time
+from collections import deque
+
+from .debug_tools import registry_signature
+
+_logger = logging.getLogger(__name__)
+
+# {dbname: (signature, RelationGraph)}
+RELATION_GRAPHS = {}
+
+RELATIONAL_TYPES = ("many2one", "one2many", "many2many")
+
+FIELD_ATTRIBUTES = ["string", "type", "required", "readonly", "store", "help", "relation"]
+
+
+def _field_metadata(name, description, compute=False):
+    data = {
+        "name": name,
+        "string": description.get("string") or name,
+        "type": description["type"],
+        "required": bool(description.get("required")),
+        "readonly": bool(description.get("readonly")),
+        "store": bool(description.get("store")),
+        "help": description.get("help") or "",
+    }
+    if description["type"] in RELATIONAL_TYPES:
+        data["relation"] = description.get("relation")
+    elif compute:
+        data["compute"] = True
+    return data
+
+
+class RelationGraph:
+    def __init__(self, registry):
+        self.models = sorted(registry)
+        self.index = {name: i for i, name in enumerate(self.models)}
+        self.out_edges = [[] for _ in self.models]
+        self.in_edges = [[] for _ in self.models]
+        # {model: {"relations": [field], "basic_fields": [...], "computed_fields": [...]}}
+        self.field_groups = {}
+        # {(lang, model): metadata with translated labels}
+        self.labelled = {}
+
+        for name in self.models:
+            Model = registry[name]
+            source = self.index[name]
+
+            relations, basic_fields, computed_fields = [], [], []
+            for field in Model._fields.values():
+                if field.type in RELATIONAL_TYPES:
+                    relations.append(field.name)
+                    target = self.index.get(field.comodel_name)
+                    if target is not None:
+                        # delegate=True fields are exactly the _inherits ones
+                        kind = "inherits" if field.name in Model._inherits.values() else field.type
+                        self._add_edge(source, target, field.name, kind)
+                elif field.compute:
+                    computed_fields.append(field.name)
+                else:
+                    basic_fields.append(field.name)
+
+            # Prototype inheritance (_inherit with a new _name) has no field to follow
+            for child in getattr(Model, "_inherit_children", None) or ():
+                if child != name and child in self.index:
+                    self._add_edge(self.index[child], source, "_inherit", "inherit")
+
+            self.field_groups[name] = {
+                "relations": relations,
+                "basic_fields": basic_fields,
+                "computed_fields": computed_fields,
+            }
+
+        self.edge_count = sum(len(edges) for edges in self.out_edges)
+
+    def model_metadata(self, env, model):
+        """Fields of `model` grouped by kind, with labels translated in env's language."""
+        key = (env.lang, model)
+        result = self.labelled.get(key)
+        if result is not None:
+            return result
+        # sudo: every field is listed, whatever the groups of the admin asking
+        Model = env[model].sudo()
+        descriptions = Model.fields_get(attributes=FIELD_ATTRIBUTES)
+        result = {"model": model, "description": Model._description, "total_fields": len(Model._fields)}
+        for group, names in self.field_groups[model].items():
+            result[group] = [
+                _field_metadata(name, descriptions[name], compute=group == "computed_fields")
+                for name in names
+                if name in descriptions
+            ]
+        self.labelled[key] = result
+        return result
+
+    def _add_edge(self, source, target, field_name, kind):
+        self.out_edges[source].append((target, field_name, kind))
+        self.in_edges[target].append((source, field_name, kind))
+
+    def _edges(self, node, direction):
+        if direction in ("out", "both"):
+            for target, field_name, kind in self.out_edges[node]:
+                yield target, field_name, kind, "out"
+        if direction in ("in", "both"):
+            for source, field_name, kind in self.in_edges[node]:
+                yield source, field_name, kind, "in"
+
+    def _edge_dict(self, node, other, field_name, kind, way):
+        source, target = (node, other) if way == "out" else (other, node)
+        return {
+            "from": self.models[source],
+            "to": self.models[target],
+            "field": field_name,
+            "type": kind,
+        }
+
+    def neighborhood(self, model, depth=1, direction="both", limit=500):
+        """Models within `depth` relation hops of `model`, with the edges between them."""
+        start = self.index[model]
+        distances = {start: 0}
+        edges = {}
+        queue = deque([start])
+        # Only set when a model within depth had to be left out
+        truncated = False
+        while queue and not truncated:
+            node = queue.popleft()
+            if distances[node] >= depth:
+                continue
+            for other, field_name, kind, way in self._edges(node, direction):
+                if other not in distances:
+                    if len(distances) >= limit:
+                        truncated = True
+                        break
+                    distances[other] = distances[node] + 1
+                    queue.append(other)
+                edge = self._edge_dict(node, other, field_name, kind, way)
+                edges[(edge["from"], edge["to"], field_name)] = edge
+
+        return {
+            "model": model,
+            "nodes": [
+                {"model": self.models[node], "distance": distance}
+                for node, distance in sorted(distances.items(), key=lambda x: x[1])
+            ],
+            "edges": list(edges.values()),
+            "truncated": truncated,
+        }
+
+    def shortest_path(self, source, target, max_depth=6, direction="out"):
+        """Shortest chain of relational fields from source to target (BFS)."""
+        start, goal = self.index[source], self.index[target]
+        previous = {start: None}
+        queue = deque([(start, 0)])
+        while queue and goal not in previous:
+            node, distance = queue.popleft()
+            if distance >= max_depth:
+                continue
+            for other, field_name, kind, way in self._edges(node, direction):
+                if other not in previous:
+                    previous[other] = (node, field_name, kind, way)
+                    queue.append((other, distance + 1))
+
+        if goal not in previous:
+            return None
+        path = []
+        node = goal
+        while previous[node] is not None:
+            parent, field_name, kind, way = previous[node]
+            step = self._edge_dict(parent, node, field_name, kind, way)
+            step["reverse"] = way == "in"
+            path.append(step)
+            node = parent
+        path.reverse()
+        return path
+
+
+def get_relation_graph(env):
+    """Returns the relation graph of env's registry, building it on first use."""
+    dbname = env.cr.dbname
+    signature = registry_signature(env)
+    cached = RELATION_GRAPHS.get(dbname)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    start = time.time()
+    graph = RelationGraph(env.registry)
+    RELATION_GRAPHS[dbname] = (signature, graph)
+    _logger.info(
+        "WebShell: Relation graph built for %s (%d models, %d edges) in %.0fms",
+        dbname,
+        len(graph.models),
+        graph.edge_count,
+        (time.time() - start) * 1000,
+    )
+    return graph
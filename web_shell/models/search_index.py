@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+# Part of Web Shell. See LICENSE file for full copyright and licensing details.
+# Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+
+"""
+In-memory "omni-search" index over views, xml ids, models and fields.
+
+The index is built lazily, once per registry, and kept per worker. It is
+rebuilt when the registry is reloaded or when views are written (Odoo
+clears the 'templates' cache on every ir.ui.view write, which bumps the
+registry cache sequence and is signaled to the other workers).
+"""
+
+import bisect
+import heapq
+import logging
+import time
+from array import array
+from collections import defaultdict
+
+from .debug_tools import registry_signature
+
+_logger = logging.getLogger(__name__)
+
+# {dbname: (signature, SearchIndex)}
+SEARCH_INDEXES = {}
+
+KINDS = ("view", "model", "field")
+
+
+def _trigrams(text):
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """
+    Trigram index for substring/fuzzy matches plus a sorted key list for
+    prefix matches on queries shorter than a trigram.
+    """
+
+    def __init__(self, entries):
+        # entries: [{"kind": ..., "key": ..., "terms": (lowercase strings,), ...payload}]
+        self.entries = entries
+        self.terms = [entry.pop("terms") for entry in entries]
+        self.keys = {(entry["kind"], entry["key"]): idx for idx, entry in enumerate(entries)}
+        self.postings = defaultdict(lambda: array("I"))
+        self.prefixes = []
+        for idx, terms in enumerate(self.terms):
+            grams = set()
+            for term in terms:
+                grams |= _trigrams(term)
+                self.prefixes.append((term, idx))
+            for gram in grams:
+                self.postings[gram].append(idx)
+        self.postings = dict(self.postings)
+        self.prefixes.sort()
+
+    def _prefix_candidates(self, query, kinds, limit):
+        found = {}
+        start = bisect.bisect_left(self.prefixes, (query,))
+        for term, idx in self.prefixes[start:]:
+            if not term.startswith(query) or len(found) >= limit:
+                break
+            if not kinds or self.entries[idx]["kind"] in kinds:
+                found[idx] = 1
+        return found
+
+    def _trigram_candidates(self, query):
+        grams = _trigrams(query)
+        hits = defaultdict(int)
+        for gram in grams:
+            for idx in self.postings.get(gram, ()):
+                hits[idx] += 1
+        # Tolerate a couple of typos: half of the trigrams must match
+        needed = max(1, (len(grams) + 1) // 2)
+        return {idx: count / len(grams) for idx, count in hits.items() if count >= needed}
+
+    def _score(self, query, idx, fuzzy):
+        best = 0
+        for term in self.terms[idx]:
+            if term == query:
+                score = 100
+            elif term.startswith(query):
+                score = 80
+            elif f".{query}" in term or f"_{query}" in term or f" {query}" in term:
+                score = 60
+            elif query in term:
+                score = 40
+            else:
+                score = 20 * fuzzy
+            best = max(best, score - len(term) / 100)
+        return best
+
+    def search(self, query, kinds=None, limit=20):
+        query = (query or "").strip().lower()
+        if not query:
+            return []
+
+        if len(query) < 3:
+            candidates = self._prefix_candidates(query, kinds, limit * 20)
+        else:
+            candidates = self._trigram_candidates(query)
+
+        scored = (
+            (self._score(query, idx, fuzzy), idx)
+            for idx, fuzzy in candidates.items()
+            if not kinds or self.entries[idx]["kind"] in kinds
+        )
+        return [
+            dict(self.entries[idx], score=round(score, 2))
+            for score, idx in heapq.nlargest(limit, scored)
+        ]
+
+
+def _build_entries(env):
+    entries = []
+
+    View = env["ir.ui.view"].sudo()
+    views = View.search_read([], ["name", "model", "type", "priority"])
+    xml_ids = {}
+    for data in env["ir.model.data"].sudo().search_read(
+        [("model", "=", "ir.ui.view")], ["module", "name", "res_id"]
+    ):
+        xml_ids.setdefault(data["res_id"], f"{data['module']}.{data['name']}")
+
+    for view in views:
+        xml_id = xml_ids.get(view["id"], "")
+        entries.append(
+            {
+                "kind": "view",
+                "key": str(view["id"]),
+                "id": view["id"],
+                "name": view["name"],
+                "model": view["model"],
+                "xml_id": xml_id,
+                "type": view["type"],
+                "priority": view["priority"],
+                "terms": tuple(
+                    term.lower() for term in (view["name"], xml_id, view["model"]) if term
+                ),
+            }
+        )
+
+    # Models and fields come straight from the registry, no query needed
+    for model_name in env.registry:
+        Model = env.registry[model_name]
+        entries.append(
+            {
+                "kind": "model",
+                "key": model_name,
+                "model": model_name,
+                "name": Model._description or model_name,
+                "terms": (model_name.lower(), (Model._description or "").lower()),
+            }
+        )
+        for field_name, field in Model._fields.items():
+            entries.append(
+                {
+                    "kind": "field",
+                    "key": f"{model_name}.{field_name}",
+                    "model": model_name,
+                    "name": field_name,
+                    "string": field.string or "",
+                    "type": field.type,
+                    "terms": (field_name.lower(), (field.string or "").lower()),
+                }
+            )
+
+    return entries
+
+
+def get_search_index(env):
+    """Returns the search index of env's registry, building it on first use."""
+    dbname = env.cr.dbname
+    signature = registry_signature(env, "templates")
+    cached = SEARCH_INDEXES.get(dbname)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    start = time.time()
+    index = SearchIndex(_build_entries(env))
+    SEARCH_INDEXES[dbname] = (signature, index)
+    _logger.info(
+        "WebShell: Search index built for %s (%d entries) in %.0fms",
+        dbname,
+        len(index.entries),
+        (time.time() - start) * 1000,
+    )
+    return index
+
+
+def omni_search(env, query, kinds=None, limit=20):
+    """Ranked matches for query across views, xml ids, models and fields."""
+    start = time.perf_counter()
+    index = get_search_index(env)
+    kinds = [kind for kind in (kinds or KINDS) if kind in KINDS]
+    results = index.search(query, kinds=kinds, limit=limit)
+
+    query = (query or "").strip()
+    idx = index.keys.get(("view", query)) if "view" in kinds else None
+    if idx is not None:
+        # Exact view id lookups always come first
+        results = [dict(index.entries[idx], score=1000)] + [
+            r for r in results if not (r["kind"] == "view" and r["key"] == query)
+        ]
+
+    return {
+        "results": results[:limit],
+        "elapsed_ms": (time.perf_counter() - start) * 1000,
+    }
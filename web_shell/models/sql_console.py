@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# Part of Web Shell. See LICENSE file for full copyright and licensing details.
+# Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+
+"""
+Read-only SQL console with stateless paging.
+
+Every page runs in its own short READ ONLY transaction with a statement
+timeout, on a dedicated connection released at the end of the request: the
+query is DECLAREd as a server-side cursor, MOVEd to the requested offset
+and a single page is FETCHed, so only the rows on screen are transferred to
+the worker and nothing is kept open between requests (any worker can serve
+any page). Each page re-runs the query: pages are only stable when the
+query has an ORDER BY on unique columns and the data does not change.
+"""
+
+import datetime
+import logging
+import re
+import time
+from decimal import Decimal
+
+from odoo import sql_db
+
+_logger = logging.getLogger(__name__)
+
+MAX_PAGE_SIZE = 1000
+MAX_CELL_LENGTH = 2000
+
+_DOLLAR_TAG = re.compile(r"\$(?:[A-Za-z_][A-Za-z_0-9]*)?\$")
+
+
+def _json_value(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        if isinstance(value, str) and len(value) > MAX_CELL_LENGTH:
+            return value[:MAX_CELL_LENGTH] + "…"
+        return value
+    if isinstance(value, (datetime.date, datetime.datetime, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (bytes, memoryview)):
+        return f"<{len(value)} bytes>"
+    if isinstance(value, (dict, list)):
+        return value
+    return str(value)
+
+
+def _is_word_char(char):
+    return char.isalnum() or char in "_$"
+
+
+def _statement_end(query):
+    """
+    Index of the first ';' outside string literals, quoted identifiers,
+    dollar quotes and comments, or None.
+    """
+    i, length = 0, len(query)
+    while i < length:
+        char = query[i]
+        if char == "'":
+            # E'...' strings accept backslash escapes
+            escapes = i > 0 and query[i - 1] in "eE" and (i < 2 or not _is_word_char(query[i - 2]))
+            i += 1
+            while i < length:
+                if escapes and query[i] == "\\":
+                    i += 2
+                elif query[i] == "'" and query[i + 1:i + 2] == "'":
+                    i += 2
+                elif query[i] == "'":
+                    break
+                else:
+                    i += 1
+            i += 1
+        elif char == '"':
+            end = query.find('"', i + 1)
+            i = length if end < 0 else end + 1
+        elif query.startswith("--", i):
+            end = query.find("\n", i)
+            i = length if end < 0 else end + 1
+        elif query.startswith("/*", i):
+            depth, i = 1, i + 2
+            while i < length and depth:
+                if query.startswith("/*", i):
+                    depth, i = depth + 1, i + 2
+                elif query.startswith("*/", i):
+                    depth, i = depth - 1, i + 2
+                else:
+                    i += 1
+        elif char == "$" and not (i and _is_word_char(query[i - 1])):
+            match = _DOLLAR_TAG.match(query, i)
+            if match:
+                end = query.find(match.group(), match.end())
+                i = length if end < 0 else end + len(match.group())
+            else:
+                i += 1
+        elif char == ";":
+            return i
+        else:
+            i += 1
+    return None
+
+
+def _check_query(query):
+    end = _statement_end(query)
+    if end is not None:
+        if query[end:].strip(" \t\r\n;"):
+            raise ValueError("Only a single statement is allowed")
+        query = query[:end]
+    query = query.strip()
+    if not query:
+        raise ValueError("Empty query")
+    return query
+
+
+def _columns(cr, description):
+    type_oids = tuple({column.type_code for column in description})
+    names = {}
+    if type_oids:
+        cr.execute("SELECT oid, typname FROM pg_type WHERE oid IN %s", [type_oids])
+        names = dict(cr.fetchall())
+    return [{"name": column.name, "type": names.get(column.type_code, str(column.type_code))} for column in description]
+
+
+def run_query(dbname, query, offset=0, page_size=200, timeout_ms=30000):
+    """Rows [offset, offset + page_size) of `query`, with column types."""
+    query = _check_query(query)
+    offset = max(0, int(offset))
+    page_size = max(1, min(int(page_size), MAX_PAGE_SIZE))
+    start = time.time()
+    cr = sql_db.db_connect(dbname).cursor()
+    try:
+        cr.execute("SET TRANSACTION READ ONLY")
+        cr.execute(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+        cr.execute(f"DECLARE web_shell_query NO SCROLL CURSOR FOR {query}")
+        if offset:
+            # Skipped rows are computed by the server but never sent to the worker
+            cr.execute(f"MOVE FORWARD {offset} FROM web_shell_query")
+        # One extra row tells whether there is a next page
+        cr.execute(f"FETCH FORWARD {page_size + 1} FROM web_shell_query")
+        description = cr.description
+        rows = [[_json_value(value) for value in row] for row in cr.fetchall()]
+        columns = _columns(cr, description)
+    finally:
+        try:
+            cr.rollback()
+            cr.close()
+        except Exception:
+            _logger.debug("WebShell: Error closing SQL console cursor", exc_info=True)
+    return {
+        "columns": columns,
+        "rows": rows[:page_size],
+        "offset": offset,
+        "page_size": page_size,
+        "has_more": len(rows) > page_size,
+        "elapsed_ms": round((time.time() - start) * 1000, 2),
+    }
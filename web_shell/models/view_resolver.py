@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+# Part of Web Shell. See LICENSE file for full copyright and licensing details.
+# Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+
+import copy
+import difflib
+import hashlib
+import logging
+import time
+from collections import OrderedDict, defaultdict
+
+from lxml import etree
+
+_logger = logging.getLogger(__name__)
+
+# Per-worker memo of intermediate combined archs: {prefix_digest: serialized arch}
+# A prefix digest identifies "root arch + these extensions applied in this order",
+# each extension being keyed by (id, write_date) so edited views invalidate themselves.
+RESOLVED_ARCHS = OrderedDict()
+RESOLVED_ARCHS_STATS = {"bytes": 0, "hits": 0, "misses": 0}
+
+# Upper bound for the memo (serialized bytes), oldest entries are evicted first
+RESOLVED_ARCHS_MAX_BYTES = 32 * 1024 * 1024
+
+# Only every Nth prefix of a chain (and the full chain) is memoized, so a long
+# chain costs len/N entries and does not evict the early prefixes other chains reuse
+CHECKPOINT_EVERY = 8
+
+
+def _cache_get(key):
+    arch = RESOLVED_ARCHS.get(key)
+    if arch is not None:
+        RESOLVED_ARCHS.move_to_end(key)
+    return arch
+
+
+def _cache_put(key, arch):
+    if key in RESOLVED_ARCHS:
+        RESOLVED_ARCHS.move_to_end(key)
+        return
+    RESOLVED_ARCHS[key] = arch
+    RESOLVED_ARCHS_STATS["bytes"] += len(arch)
+    while RESOLVED_ARCHS_STATS["bytes"] > RESOLVED_ARCHS_MAX_BYTES and RESOLVED_ARCHS:
+        _, evicted = RESOLVED_ARCHS.popitem(last=False)
+        RESOLVED_ARCHS_STATS["bytes"] -= len(evicted)
+
+
+def clear_resolved_archs():
+    """Drops every memoized arch of this worker. Returns the number of entries removed."""
+    count = len(RESOLVED_ARCHS)
+    RESOLVED_ARCHS.clear()
+    RESOLVED_ARCHS_STATS.update(bytes=0, hits=0, misses=0)
+    return count
+
+
+def get_resolved_archs_stats():
+    """Size and hit/miss counts of this worker's memo of intermediate archs."""
+    lookups = RESOLVED_ARCHS_STATS["hits"] + RESOLVED_ARCHS_STATS["misses"]
+    return {
+        "entries": len(RESOLVED_ARCHS),
+        "bytes": RESOLVED_ARCHS_STATS["bytes"],
+        "max_bytes": RESOLVED_ARCHS_MAX_BYTES,
+        "hits": RESOLVED_ARCHS_STATS["hits"],
+        "misses": RESOLVED_ARCHS_STATS["misses"],
+        "hit_ratio": round(RESOLVED_ARCHS_STATS["hits"] / lookups, 4) if lookups else None,
+    }
+
+
+def _is_checkpoint(index, length):
+    """Whether the arch after step `index` of a chain of `length` steps is memoized."""
+    return (index + 1) % CHECKPOINT_EVERY == 0 or index == length - 1
+
+
+def primary_root(view):
+    """Nearest primary view at or above `view`: the view whose combined arch it belongs to."""
+    while view.mode != "primary" and view.inherit_id:
+        view = view.inherit_id
+    return view
+
+
+def parse_arch(arch):
+    if isinstance(arch, str):
+        return etree.fromstring(arch)
+    return arch
+
+
+def arch_lines(arch):
+    """Pretty-printed arch split in lines, as fed to difflib."""
+    return etree.tostring(arch, encoding="unicode", pretty_print=True).splitlines(
+        keepends=True
+    )
+
+
+class ViewInheritanceResolver:
+    """
+    Rebuilds combined archs of a root view by applying its extensions in the
+    order of ir.ui.view._combine(), memoizing the arch at regular checkpoints.
+
+    Two chains sharing their first k extensions share the cached checkpoints
+    among those k, so resolving a second chain only re-applies the suffix
+    after the last shared checkpoint.
+    """
+
+    def __init__(self, env, root):
+        self.env = env
+        self.View = env["ir.ui.view"]
+        self.root = root
+        # Active extensions of the same model, walked down from the root one level
+        # per query, like _get_inheriting_views(): derived primary views and their
+        # own extensions are not part of the root's combined arch
+        self._children = defaultdict(list)
+        by_id = {}
+        parent_ids = [root.id]
+        while parent_ids:
+            level = self.View.search_read(
+                [
+                    ("inherit_id", "in", parent_ids),
+                    ("mode", "=", "extension"),
+                    ("model", "=", root.model),
+                ],
+                ["name", "inherit_id", "write_date"],
+                order="priority, id",
+            )
+            level = [ext for ext in level if ext["id"] not in by_id]
+            for ext in level:
+                by_id[ext["id"]] = ext
+                self._children[ext["inherit_id"][0]].append(ext["id"])
+            parent_ids = [ext["id"] for ext in level]
+        # _combine() order: prefix walk, each view followed by its own extensions
+        # (sorted by priority, id) before its next sibling
+        self.extensions = []
+        stack = list(reversed(self._children[root.id]))
+        while stack:
+            view_id = stack.pop()
+            self.extensions.append(by_id[view_id])
+            stack.extend(reversed(self._children[view_id]))
+        # A derived primary view starts from its parent's combined arch
+        self.parent = None
+        parent_key = env.cr.dbname.encode()
+        if root.inherit_id:
+            self.parent = ViewInheritanceResolver(env, primary_root(root.inherit_id))
+            parent_chain = self.parent.chain()
+            parent_key = (
+                self.parent._prefix_keys(parent_chain)[-1] if parent_chain else self.parent._base_key
+            )
+        self._base_key = hashlib.sha1(
+            parent_key + f":{root.id}:{root.write_date}".encode()
+        ).digest()
+
+    def _root_arch(self):
+        """The arch the extensions apply to: the root's own, or its parent's combined arch plus its spec."""
+        if self.parent is None:
+            return etree.fromstring(self.root.arch)
+        arch, _info = self.parent.resolve(self.parent.chain())
+        return self.apply(arch, self.root.arch)
+
+    def descendants(self, view_id):
+        """Ids of view_id and every view inheriting from it, from the in-memory parent map."""
+        found = {view_id}
+        stack = [view_id]
+        while stack:
+            for child_id in self._children.get(stack.pop(), ()):
+                if child_id not in found:
+                    found.add(child_id)
+                    stack.append(child_id)
+        return found
+
+    def chain(self, exclude_id=None):
+        """Extensions to apply, optionally without exclude_id and its descendants."""
+        if exclude_id is None:
+            return list(self.extensions)
+        excluded = self.descendants(exclude_id)
+        return [ext for ext in self.extensions if ext["id"] not in excluded]
+
+    def _prefix_keys(self, chain):
+        keys = []
+        key = self._base_key
+        for ext in chain:
+            key = hashlib.sha1(
+                key + f":{ext['id']}:{ext['write_date']}".encode()
+            ).digest()
+            keys.append(key)
+        return keys
+
+    def _load_specs(self, chain):
+        ids = [ext["id"] for ext in chain]
+        return {
+            row["id"]: row["arch_db"]
+            for row in self.View.browse(ids).read(["arch_db"])
+        }
+
+    def apply(self, arch, spec_arch):
+        """
+        Applies one extension to a copy of arch. Returns the new arch or raises,
+        leaving arch untouched: a spec failing halfway must not leave its partial
+        changes in the tree passed to the next extension.
+        """
+        # Odoo 16+ signature: apply_inheritance_specs(source, specs_tree)
+        return self.View.apply_inheritance_specs(copy.deepcopy(arch), parse_arch(spec_arch))
+
+    def resolve(self, chain):
+        """
+        Returns (arch, info) where arch is the root arch with every extension of
+        chain applied. Extensions that fail to apply are skipped, as Odoo would
+        refuse them at install time anyway.
+        """
+        keys = self._prefix_keys(chain)
+
+        start, arch = 0, None
+        for index in range(len(chain), 0, -1):
+            cached = _cache_get(keys[index - 1])
+            if cached is not None:
+                start, arch = index, etree.fromstring(cached)
+                break
+
+        if arch is None:
+            arch = self._root_arch()
+            if chain:
+                RESOLVED_ARCHS_STATS["misses"] += 1
+        else:
+            RESOLVED_ARCHS_STATS["hits"] += 1
+
+        failed = []
+        specs = self._load_specs(chain[start:])
+        for index in range(start, len(chain)):
+            ext = chain[index]
+            try:
+                arch = self.apply(arch, specs[ext["id"]])
+            except Exception as e:
+                failed.append({"id": ext["id"], "name": ext["name"], "error": str(e)})
+            if _is_checkpoint(index, len(chain)):
+                _cache_put(keys[index], etree.tostring(arch))
+
+        return arch, {
+            "steps": len(chain),
+            "reused_steps": start,
+            "applied_steps": len(chain) - start,
+            "failed": failed,
+        }
+
+    def contributions(self, max_diff_lines=200):
+        """
+        Applies the whole chain once, in order, and records what each extension
+        changed, whether it failed and how long it took. Every step is diffed
+        against the previous one, so the report is linear in the chain length
+        instead of rebuilding the arch once per extension.
+        """
+        chain = self.chain()
+        keys = self._prefix_keys(chain)
+        specs = self._load_specs(chain)
+
+        arch = self._root_arch()
+        before = arch_lines(arch)
+        steps = []
+        for index, ext in enumerate(chain):
+            error = None
+            started = time.perf_counter()
+            try:
+                arch = self.apply(arch, specs[ext["id"]])
+            except Exception as e:
+                error = str(e)
+            elapsed = (time.perf_counter() - started) * 1000
+            if _is_checkpoint(index, len(chain)):
+                _cache_put(keys[index], etree.tostring(arch))
+
+            after = arch_lines(arch) if error is None else before
+            diff = list(
+                difflib.unified_diff(before, after, fromfile="before", tofile="after")
+            )
+            steps.append(
+                {
+                    "id": ext["id"],
+                    "name": ext["name"],
+                    "parent_id": ext["inherit_id"] and ext["inherit_id"][0],
+                    "time_ms": elapsed,
+                    "failed": error is not None,
+                    "error": error,
+                    "added": sum(
+                        1 for l in diff if l.startswith("+") and not l.startswith("+++")
+                    ),
+                    "removed": sum(
+                        1 for l in diff if l.startswith("-") and not l.startswith("---")
+                    ),
+                    "diff": diff[:max_diff_lines],
+                    "truncated": len(diff) > max_diff_lines,
+                }
+            )
+            before = after
+
+        return {
+            "root": {"id": self.root.id, "name": self.root.name, "type": self.root.type},
+            "steps": steps,
+            "total_ms": sum(step["time_ms"] for step in steps),
+            "failed": sum(1 for step in steps if step["failed"]),
+        }
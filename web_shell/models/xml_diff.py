@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+# Part of Web Shell. See LICENSE file for full copyright and licensing details.
+# Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+
+"""
+Structural diff of two XML trees (typically a view arch before/after inheritance).
+
+Every element is hashed bottom-up from its tag, sorted attributes, stripped
+text and children hashes, so attribute reordering and re-indentation never
+show up as changes. Unchanged subtrees are then matched by hash in a single
+top-down pass; what remains is reported as inserted, removed, moved or
+attribute/text-changed nodes, each with its XPath.
+"""
+
+import bisect
+from collections import defaultdict, deque
+
+from lxml import etree
+
+# Attributes identifying "the same node" when its content changed
+IDENTITY_ATTRS = ("name", "id", "string")
+
+# Maximum length of the XML snippet attached to inserted/removed nodes
+SNIPPET_MAX_LENGTH = 300
+
+
+def _children(el):
+    # Skip comments and processing instructions
+    return [child for child in el if isinstance(child.tag, str)]
+
+
+def _text(value):
+    return (value or "").strip()
+
+
+def _identity(el):
+    return (el.tag,) + tuple(el.get(attr) for attr in IDENTITY_ATTRS)
+
+
+def _snippet(el):
+    xml = etree.tostring(el, encoding="unicode", with_tail=False)
+    if len(xml) > SNIPPET_MAX_LENGTH:
+        xml = xml[:SNIPPET_MAX_LENGTH] + "..."
+    return xml
+
+
+def _longest_increasing(sequence):
+    """Indexes (in sequence) of one longest strictly increasing subsequence."""
+    tails, tails_idx, previous = [], [], [None] * len(sequence)
+    for i, value in enumerate(sequence):
+        pos = bisect.bisect_left(tails, value)
+        if pos == len(tails):
+            tails.append(value)
+            tails_idx.append(i)
+        else:
+            tails[pos] = value
+            tails_idx[pos] = i
+        previous[i] = tails_idx[pos - 1] if pos else None
+    result = set()
+    i = tails_idx[-1] if tails_idx else None
+    while i is not None:
+        result.add(i)
+        i = previous[i]
+    return result
+
+
+class _HashedTree:
+    def __init__(self, root):
+        self.tree = root.getroottree()
+        self.hashes = {}
+        self._hash(root)
+
+    def _hash(self, el):
+        value = hash(
+            (
+                el.tag,
+                tuple(sorted(el.attrib.items())),
+                _text(el.text),
+                _text(el.tail),
+                tuple(self._hash(child) for child in _children(el)),
+            )
+        )
+        self.hashes[el] = value
+        return value
+
+    def xpath(self, el):
+        return self.tree.getpath(el)
+
+
+class XmlTreeDiff:
+    """Computes the structural changes turning `old` into `new`."""
+
+    def __init__(self, old, new):
+        self.old = _HashedTree(old)
+        self.new = _HashedTree(new)
+        self.changes = []
+        self._inserted = []
+        self._removed = []
+
+        if old.tag == new.tag:
+            self._match(old, new)
+        else:
+            self._removed.append(old)
+            self._inserted.append(new)
+        self._resolve_moves()
+
+    def _match(self, old, new):
+        if self.old.hashes[old] == self.new.hashes[new]:
+            return
+
+        if dict(old.attrib) != dict(new.attrib):
+            keys = set(old.attrib) | set(new.attrib)
+            self.changes.append(
+                {
+                    "op": "attributes",
+                    "xpath": self.new.xpath(new),
+                    "tag": new.tag,
+                    "attributes": {
+                        key: [old.get(key), new.get(key)]
+                        for key in sorted(keys)
+                        if old.get(key) != new.get(key)
+                    },
+                }
+            )
+        if _text(old.text) != _text(new.text):
+            self.changes.append(
+                {
+                    "op": "text",
+                    "xpath": self.new.xpath(new),
+                    "tag": new.tag,
+                    "text": [_text(old.text), _text(new.text)],
+                }
+            )
+
+        old_children, new_children = _children(old), _children(new)
+
+        # 1. Identical subtrees, matched by hash
+        by_hash = defaultdict(deque)
+        for i, child in enumerate(old_children):
+            by_hash[self.old.hashes[child]].append(i)
+        pairs, pending = [], []
+        for j, child in enumerate(new_children):
+            candidates = by_hash.get(self.new.hashes[child])
+            if candidates:
+                pairs.append((candidates.popleft(), j))
+            else:
+                pending.append(j)
+        matched = {i for i, _ in pairs}
+
+        # 2. Same node with a changed content, matched by tag + identifying attributes
+        by_identity = defaultdict(deque)
+        for i, child in enumerate(old_children):
+            if i not in matched:
+                by_identity[_identity(child)].append(i)
+        for j in pending:
+            candidates = by_identity.get(_identity(new_children[j]))
+            if candidates:
+                i = candidates.popleft()
+                pairs.append((i, j))
+                matched.add(i)
+                self._match(old_children[i], new_children[j])
+            else:
+                self._inserted.append(new_children[j])
+        self._removed.extend(
+            child for i, child in enumerate(old_children) if i not in matched
+        )
+
+        # 3. Siblings whose relative order changed
+        pairs.sort(key=lambda pair: pair[1])
+        in_order = _longest_increasing([i for i, _ in pairs])
+        for index, (i, j) in enumerate(pairs):
+            if index not in in_order:
+                self.changes.append(
+                    {
+                        "op": "move",
+                        "xpath": self.new.xpath(new_children[j]),
+                        "old_xpath": self.old.xpath(old_children[i]),
+                        "tag": new_children[j].tag,
+                    }
+                )
+
+    def _resolve_moves(self):
+        # An inserted subtree identical to a removed one elsewhere is a move
+        removed_by_hash = defaultdict(list)
+        for el in self._removed:
+            removed_by_hash[self.old.hashes[el]].append(el)
+
+        for el in self._inserted:
+            sources = removed_by_hash.get(self.new.hashes[el])
+            if sources:
+                source = sources.pop()
+                self.changes.append(
+                    {
+                        "op": "move",
+                        "xpath": self.new.xpath(el),
+                        "old_xpath": self.old.xpath(source),
+                        "tag": el.tag,
+                    }
+                )
+            else:
+                self.changes.append(
+                    {
+                        "op": "insert",
+                        "xpath": self.new.xpath(el),
+                        "tag": el.tag,
+                        "xml": _snippet(el),
+                    }
+                )
+
+        for sources in removed_by_hash.values():
+            for el in sources:
+                self.changes.append(
+                    {
+                        "op": "remove",
+                        "xpath": self.old.xpath(el),
+                        "tag": el.tag,
+                        "xml": _snippet(el),
+                    }
+                )
+
+    def stats(self):
+        counts = defaultdict(int)
+        for change in self.changes:
+            counts[change["op"]] += 1
+        return dict(counts)
+
+
+def diff_xml_trees(old, new):
+    """
+    Returns {"changes": [...], "stats": {op: count}} describing how `new` differs
+    from `old`. `old` may be None (everything in `new` is inserted).
+    """
+    if old is None:
+        old = etree.Element(new.tag)
+    diff = XmlTreeDiff(old, new)
+    return {"changes": diff.changes, "stats": diff.stats()}
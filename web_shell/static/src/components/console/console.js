@@ -6,10 +6,15 @@
 
 import { registry } from "@web/core/registry";
 import { useService } from "@web/core/utils/hooks";
+import { loadBundle } from "@web/core/assets";
 import { Component, useState, onWillStart, useRef, onMounted, onWillDestroy, onWillUnmount, markup } from "@odoo/owl";
-import { highlightPython } from "./highlighter";
+import { highlightPython, HighlightWorker, WORKER_THRESHOLD } from "./highlighter";
 import { DebugTools } from "../debug_tools/debug_tools";
 
+// Ace itself is web's (loaded once, shared with Odoo's code editor); ours adds the
+// SQL mode and the completion popup on top of it
+export const ACE_BUNDLES = ["web.ace_lib", "web_shell.ace_lib"];
+
 export class WebShellConsole extends Component {
     static template = "web_shell.Console";
     static props = ["*"];
@@ -24,6 +29,12 @@ export class WebShellConsole extends Component {
         this.logRef = useRef("logRef");
         this.editorRef = useRef("editorRef");
         this.editor = null;
+        this.highlighter = new HighlightWorker();
+        // Huge outputs (e.g. a big repr) are truncated until expanded
+        this.outputPreviewSize = 50000;
+        this.sqlPageSize = 200;
+        // Last completion response, reused while only the completed word changes
+        this.completionCache = { key: null, prefix: "", drop: 0, result: null };
 
         this.state = useState({
             input: "",
@@ -33,13 +44,20 @@ export class WebShellConsole extends Component {
             commandHistory: [],
             historyIndex: -1,
             safeMode: true,
+            cacheDiff: false,
+            traceComputes: false,
+            // "python" or "sql" (read-only SELECT console with server-side paging)
+            mode: "python",
             activeRightTab: 'logs',
             maxHistory: 200,
             maxLogs: 300,
         });
 
-        onWillStart(() => {
+        onWillStart(async () => {
             this.busService.addChannel("web_shell_logs");
+            for (const bundle of ACE_BUNDLES) {
+                await loadBundle(bundle);
+            }
         });
 
         onMounted(() => {
@@ -55,6 +73,7 @@ export class WebShellConsole extends Component {
             if (this.editor) {
                 this.editor.destroy();
             }
+            this.highlighter.destroy();
 
             // Cleanup session on server side to prevent memory leaks
             // We don't need to pass user_id as it will use current user from context
@@ -92,6 +111,32 @@ export class WebShellConsole extends Component {
             useSoftTabs: true,
         });
 
+        let languageTools = null;
+        try {
+            languageTools = window.ace.require("ace/ext/language_tools");
+        } catch (error) {
+            // Our extension does not fit the Ace build shipped by web: edit without completion
+            console.warn("Ace language tools unavailable:", error);
+        }
+        if (languageTools) {
+            this.editor.setOptions({
+                enableBasicAutocompletion: true,
+                enableLiveAutocompletion: true,
+            });
+        }
+
+        // Completions come from the server (session variables + registry), nothing is executed
+        this.editor.completers = [{
+            identifierRegexps: [/[a-zA-Z_0-9]/],
+            triggerCharacters: [".", "'", '"'],
+            getCompletions: (editor, session, pos, prefix, callback) => {
+                this.getCompletions(session, pos, prefix).then(
+                    (completions) => callback(null, completions),
+                    () => callback(null, [])
+                );
+            },
+        }];
+
         // Set initial value
         this.editor.setValue(this.state.input, -1); // -1 moves cursor to start
 
@@ -129,6 +174,30 @@ export class WebShellConsole extends Component {
         this.editor.focus();
     }
 
+    async getCompletions(session, pos, prefix) {
+        if (this.state.mode !== "python") {
+            return [];
+        }
+        const code = session.getValue().slice(0, session.doc.positionToIndex(pos));
+        const key = code.slice(0, code.length - prefix.length);
+        const cache = this.completionCache;
+        // Items filtered by a shorter word are still valid while typing: Ace filters them further
+        if (cache.key !== key || !prefix.startsWith(cache.prefix)) {
+            const result = await this.orm.call("web.shell.console", "complete_rpc", [code]);
+            // The server may complete more than Ace's word (e.g. 'sale.or' in a string): keep only its tail
+            const drop = result.prefix.length - prefix.length;
+            this.completionCache = { key, prefix, drop, result };
+        }
+        const { drop, result } = this.completionCache;
+        return result.items.map((item, index) => ({
+            caption: item.name.slice(drop),
+            value: item.name.slice(drop),
+            meta: item.detail || item.kind,
+            docText: item.doc || item.name,
+            score: 1000 - index,
+        }));
+    }
+
         onNotification({ detail: notifications }) {
         for (const { payload, type } of notifications) {
             if (type === "web_shell_log") {
@@ -175,11 +244,11 @@ export class WebShellConsole extends Component {
         const cmd = this.state.input;
         if (!cmd || !cmd.trim()) return;
 
-        // Highlight the input code for history display
-        const highlighted = markup(highlightPython(cmd));
-
-        // Add to UI history
-        this.state.history.push({ type: 'input', text: cmd, highlighted: highlighted });
+        // Add to UI history, with the input code highlighted for display
+        this.state.history.push({ type: 'input', text: cmd, highlighted: "", highlightedUpTo: 0 });
+        if (this.state.mode === "python") {
+            this.highlightInput(this.state.history[this.state.history.length - 1]);
+        }
 
         // Enforce history limit to prevent memory leaks
         if (this.state.history.length > this.state.maxHistory) {
@@ -202,9 +271,20 @@ export class WebShellConsole extends Component {
             this.editor.setValue("", -1);
         }
 
+        if (this.state.mode === "sql") {
+            await this.executeSql(cmd);
+            this.scrollToBottom(this.outputRef);
+            if (this.editor) {
+                this.editor.focus();
+            }
+            return;
+        }
+
         try {
             const result = await this.orm.call("web.shell.console", "execute_command", [cmd], {
                 safe_mode: this.state.safeMode,
+                cache_diff: this.state.cacheDiff,
+                trace_computes: this.state.traceComputes,
             });
 
             if (result && typeof result === 'object' && result.output !== undefined) {
@@ -229,6 +309,66 @@ export class WebShellConsole extends Component {
         }
     }
 
+    toggleMode() {
+        this.state.mode = this.state.mode === "sql" ? "python" : "sql";
+        if (this.editor) {
+            this.editor.session.setMode(`ace/mode/${this.state.mode}`);
+            this.editor.focus();
+        }
+    }
+
+    async executeSql(query) {
+        const line = { type: 'sql', query, page: null };
+        await this.sqlFetchPage(line, 0);
+        if (line.error) {
+            this.state.history.push({ type: 'error', text: line.error });
+        } else {
+            this.state.history.push(line);
+        }
+    }
+
+    async sqlFetchPage(line, offset) {
+        // Paging is stateless: the query is re-run for every page
+        try {
+            const page = await this.orm.call("web.shell.console", "sql_query_rpc", [line.query], {
+                offset,
+                page_size: this.sqlPageSize,
+            });
+            if (page.error) {
+                line.error = page.error;
+            } else {
+                // Only the current page is kept in the browser
+                line.error = null;
+                line.page = page;
+            }
+        } catch (error) {
+            line.error = error.data?.message || error.message || String(error);
+        }
+    }
+
+    sqlNextPage(line) {
+        return this.sqlFetchPage(line, line.page.offset + line.page.rows.length);
+    }
+
+    sqlPreviousPage(line) {
+        return this.sqlFetchPage(line, Math.max(0, line.page.offset - this.sqlPageSize));
+    }
+
+    highlightInput(line) {
+        if (line.text.length < WORKER_THRESHOLD) {
+            line.highlighted = markup(highlightPython(line.text));
+            line.highlightedUpTo = line.text.length;
+            return;
+        }
+        // Large inputs: highlighted in a worker, shown as plain text until each chunk arrives
+        let html = "";
+        this.highlighter.highlight(line.text, (chunk, consumed) => {
+            html += chunk;
+            line.highlighted = markup(html);
+            line.highlightedUpTo = consumed;
+        });
+    }
+
     scrollToBottom(ref) {
         setTimeout(() => {
             if (ref.el) {
@@ -264,4 +404,5 @@ export class WebShellConsole extends Component {
     }
 }
 
-registry.category("actions").add("web_shell.main", WebShellConsole);
+// Rendered by the web_shell.main action stub once the DevTools bundle is loaded
+registry.category("lazy_components").add("web_shell.Console", WebShellConsole);
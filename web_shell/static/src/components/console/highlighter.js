@@ -23,92 +23,25 @@ const ESCAPE_HTML = (str) => {
 
 export function highlightPython(code) {
     if (!code) return "";
-
-    // 1. Escape HTML first to prevent XSS and ensure layout safety
-    // BUT we need to process tokens before escaping for complex regex...
-    // ACTUALLY, usually better to tokenise, then escape content, then wrap.
-    // Given our simple regex approach, we'll replace into placeholders or handle carefully.
-
-    // Simplest approach: "Tokenize" execution by matching regexes and building the string.
-    // But regex replacements on strings are easier if we are careful.
-
-    // Let's go with a sequential token replacement approach using a master regex?
-    // Or just simple replacements. The order matters (Strings usage first!).
-
-    // NOTE: This is a "good enough" highlighter for a simple shell.
-
-    let html = code;
-
-    // We will use a placeholder temporary replacement strategy to avoid re-matching html
-    // However, JS regex replace with a function is cleaner.
-
-    // Order:
-    // 1. Strings (Docstrings first, then single/double)
-    // 2. Comments
-    // 3. Keywords / Builtins
-    // 4. Numbers
-    // 5. Decorators
-
-    // We cannot easily modify 'html' in place efficiently without breaking ranges.
-    // So we'll iterate through the string and tokenize.
-
-    // Actually, `Prism` does this well. Since we are custom, let's use a "Split and Map" strategy?
-    // No, that's complex for a simple request.
-
-    // Let's use the replacement approach but escape *during* replacement.
-    // Wait, if we escape first: `print("a < b")` -> `print("a &lt; b")`
-    // Then string regex `".*?"` might fail if it expects `<`.
-    // Correct way: Match raw code, wrap match in span (with content escaped).
-
-    // Master Regex for Python tokens (simplified)
-    // 1. Triple-quoted strings:  /("""[\s\S]*?"""|'''[\s\S]*?''')/
-    // 2. Comments:  /(#.*)$/m
-    // 3. Strings:   /("|')((?:\\\1|(?:(?!\1).))*)\1/
-    // 4. Numbers:   /\b\d+(\.\d+)?\b/
-    // 5. Keywords:  /\b(def|class|...)\b/
-    // 6. Decorators: /@\w+/
-
-    // We must Combine them or run sequentially? 
-    // Sequentially is dangerous (matching inside strings).
-    // Combined regex is best.
-
-    const tokenRegex = /("""[\s\S]*?"""|'''[\s\S]*?''')|(#.*$)|("|'|`)(?:\\\3|(?:(?!\3).))*\3|(\b\d+(?:\.\d+)?\b)|(\b[a-zA-Z_]\w*\b)/gm;
-
-    html = code.replace(tokenRegex, (match, tripleString, comment, string, number, word) => {
-        if (tripleString) {
-            return `<span class="s">${ESCAPE_HTML(tripleString)}</span>`;
-        }
-        if (comment) {
-            return `<span class="c">${ESCAPE_HTML(comment)}</span>`;
-        }
-        if (string) {
-            return `<span class="s">${ESCAPE_HTML(match)}</span>`; // match includes quotes
-        }
-        if (number) {
-            return `<span class="n">${match}</span>`;
-        }
-        if (word) {
-            if (KEYWORDS.includes(word)) {
-                return `<span class="k">${word}</span>`;
-            }
-            if (BUILTINS.includes(word)) {
-                return `<span class="nb">${word}</span>`;
-            }
-            if (word === 'self') {
-                return `<span class="o">${word}</span>`;
-            }
-            return word; // Just a variable/identifier
-        }
-        return ESCAPE_HTML(match); // Fallback
+    let html = "";
+    highlightPythonChunks(code, 0, (chunk) => {
+        html += chunk;
     });
+    return html;
+}
 
-    // Decorators (special case, usually starts with @)
-    // The main regex doesn't catch @word well as a block.
-    // Let's run a separate pass for things NOT inside spans? 
-    // Hard.
-
-    // Better: Add decorator to main regex.
-    // New Regex:
+/**
+ * Tokenizes `code` and calls emit(html, consumed, done) every time roughly
+ * `chunkSize` characters of html are ready (0: once, at the end). `consumed`
+ * is the offset in `code` the emitted html covers up to, so callers can show
+ * the highlighted prefix followed by the still plain suffix.
+ *
+ * Self-contained apart from KEYWORDS, BUILTINS and ESCAPE_HTML: its source is
+ * also shipped to the highlighting worker.
+ */
+export function highlightPythonChunks(code, chunkSize, emit) {
+    // Tokenize -> map -> join: text between matches (spaces, operators) must be escaped too.
+    // Regex order is priority:
     // Group 1: Triple Strings
     // Group 2: Comments
     // Group 3: Strings
@@ -116,14 +49,6 @@ export function highlightPython(code) {
     // Group 5: Numbers
     // Group 6: Words
 
-    // Note: Regex order is priority.
-
-    // We'll perform one master replace.
-    // If it doesn't match a token (e.g. spaces, operators), it remains as is (but we must escape it!).
-    // Wait, string.replace(regex) only replaces matches. The non-matches need escaping too!
-
-    // So we need to: tokenize -> map -> join.
-
     const styles = {
         triple: 's',
         comment: 'c',
@@ -174,6 +99,12 @@ export function highlightPython(code) {
         }
 
         lastIndex = re.lastIndex;
+
+        // Flush on a token boundary
+        if (chunkSize && result.length >= chunkSize) {
+            emit(result, lastIndex, false);
+            result = "";
+        }
     }
 
     // Remaining text
@@ -181,5 +112,68 @@ export function highlightPython(code) {
         result += ESCAPE_HTML(code.slice(lastIndex));
     }
 
-    return result;
+    emit(result, code.length, true);
+}
+
+// Inputs shorter than this are highlighted synchronously, the worker round trip isn't worth it
+export const WORKER_THRESHOLD = 5000;
+
+/**
+ * Highlights large inputs off the main thread, streaming the html back in chunks.
+ * The worker is built from this module's own functions, so both threads share one tokenizer.
+ */
+export class HighlightWorker {
+    constructor(chunkSize = 20000) {
+        this.chunkSize = chunkSize;
+        this.worker = null;
+        this.url = null;
+        this.nextId = 1;
+        this.callbacks = new Map();
+    }
+
+    start() {
+        const source = [
+            `const KEYWORDS = ${JSON.stringify(KEYWORDS)};`,
+            `const BUILTINS = ${JSON.stringify(BUILTINS)};`,
+            `const ESCAPE_HTML = ${ESCAPE_HTML.toString()};`,
+            highlightPythonChunks.toString(),
+            `self.onmessage = ({ data }) => {
+                highlightPythonChunks(data.code, data.chunkSize, (html, consumed, done) => {
+                    self.postMessage({ id: data.id, html, consumed, done });
+                });
+            };`,
+        ].join("\n");
+        this.url = URL.createObjectURL(new Blob([source], { type: "text/javascript" }));
+        this.worker = new Worker(this.url);
+        this.worker.onmessage = ({ data }) => {
+            const callback = this.callbacks.get(data.id);
+            if (callback) {
+                if (data.done) {
+                    this.callbacks.delete(data.id);
+                }
+                callback(data.html, data.consumed, data.done);
+            }
+        };
+    }
+
+    /**
+     * Calls onChunk(html, consumed, done) as the highlighted html of `code` comes in.
+     */
+    highlight(code, onChunk) {
+        if (!this.worker) {
+            this.start();
+        }
+        const id = this.nextId++;
+        this.callbacks.set(id, onChunk);
+        this.worker.postMessage({ id, code, chunkSize: this.chunkSize });
+    }
+
+    destroy() {
+        if (this.worker) {
+            this.worker.terminate();
+            URL.revokeObjectURL(this.url);
+            this.worker = null;
+        }
+        this.callbacks.clear();
+    }
 }
@@ -0,0 +1,115 @@
+/** @odoo-module **/
+
+import { Component, useState, onMounted, onWillUnmount } from "@odoo/owl";
+import { useService } from "@web/core/utils/hooks";
+
+export class BulkRunner extends Component {
+    static template = "web_shell.BulkRunner";
+
+    setup() {
+        this.orm = useService("orm");
+        this.state = useState({
+            model: "",
+            domain: "[]",
+            code: "# `records` is the current chunk\nrecords.write({})",
+            chunkSize: 1000,
+            rateLimit: 0,
+            runs: [],
+            runningId: null, // Run being driven by this tab
+            error: null,
+        });
+        this.stopped = false;
+
+        onMounted(() => {
+            this.loadRuns();
+        });
+
+        onWillUnmount(() => {
+            // The run stays paused and can be resumed later
+            this.stopped = true;
+        });
+    }
+
+    async loadRuns() {
+        this.state.runs = await this.orm.call("web.shell.console", "get_bulk_runs_rpc", [], { limit: 20 });
+    }
+
+    async createRun() {
+        this.state.error = null;
+        try {
+            const run = await this.orm.call("web.shell.console", "create_bulk_run_rpc", [], {
+                model: this.state.model.trim(),
+                domain: this.state.domain,
+                code: this.state.code,
+                chunk_size: Number(this.state.chunkSize),
+                rate_limit: Number(this.state.rateLimit),
+            });
+            if (run.error) {
+                this.state.error = run.error;
+                return;
+            }
+            await this.loadRuns();
+            await this.drive(run.id);
+        } catch (e) {
+            this.state.error = e.data?.message || e.message || "Error creating the run";
+        }
+    }
+
+    /**
+     * Calls run_bulk_rpc repeatedly: each call runs chunks for a bounded time on the
+     * server and returns the progress, so no single request holds the run.
+     */
+    async drive(runId) {
+        this.state.runningId = runId;
+        this.stopped = false;
+        try {
+            while (!this.stopped) {
+                const progress = await this.orm.call("web.shell.console", "run_bulk_rpc", [runId], { max_seconds: 20 });
+                if (progress.error) {
+                    this.state.error = progress.error;
+                    break;
+                }
+                this.updateRun(progress);
+                if (progress.state !== "paused" && progress.state !== "running") {
+                    break;
+                }
+            }
+        } catch (e) {
+            this.state.error = e.data?.message || e.message || "Error running the bulk operation";
+        } finally {
+            this.state.runningId = null;
+        }
+    }
+
+    pause() {
+        this.stopped = true;
+    }
+
+    async cancel(runId) {
+        this.stopped = true;
+        this.updateRun(await this.orm.call("web.shell.console", "cancel_bulk_run_rpc", [runId]));
+    }
+
+    updateRun(progress) {
+        const index = this.state.runs.findIndex((run) => run.id === progress.id);
+        if (index === -1) {
+            this.state.runs.unshift(progress);
+        } else {
+            this.state.runs[index] = progress;
+        }
+    }
+
+    percent(run) {
+        return run.total ? Math.min(100, Math.round((run.processed / run.total) * 100)) : 0;
+    }
+
+    stateClass(state) {
+        return {
+            done: "bg-success",
+            failed: "bg-danger",
+            cancelled: "bg-secondary",
+            running: "bg-primary",
+            paused: "bg-warning text-dark",
+        }[state] || "bg-light text-dark";
+    }
+}
@@ -13,6 +13,7 @@ export class CacheViewer extends Component {
             error: null,
             searched: false,
             history: [], // Stack of {model, recordId}
+            envStats: null, // Aggregated env.cache statistics
         });
 
         this.orm = useService("orm");
@@ -57,6 +58,39 @@ export class CacheViewer extends Component {
         }
     }
 
+    async loadEnvStats() {
+        this.state.loading = true;
+        this.state.error = null;
+
+        try {
+            const result = await this.orm.call("web.shell.console", "get_env_cache_stats_rpc", []);
+            if (result.error) {
+                this.state.error = result.error;
+            } else {
+                this.state.envStats = {
+                    totals: result.totals,
+                    models: Object.entries(result.models)
+                        .map(([model, stats]) => ({ model, ...stats }))
+                        .sort((a, b) => b.bytes - a.bytes),
+                };
+            }
+        } catch (e) {
+            this.state.error = "Error fetching cache statistics: " + e.message;
+        } finally {
+            this.state.loading = false;
+        }
+    }
+
+    closeEnvStats() {
+        this.state.envStats = null;
+    }
+
+    formatBytes(bytes) {
+        if (bytes < 1024) return `${bytes} B`;
+        if (bytes < 1024 * 1024) return `${(bytes / 1024).toFixed(1)} KB`;
+        return `${(bytes / 1024 / 1024).toFixed(1)} MB`;
+    }
+
     async navigateToRelation(model, id) {
         this.state.model = model;
         this.state.recordId = id;
@@ -0,0 +1,65 @@
+/** @odoo-module **/
+
+import { Component, useState, onMounted } from "@odoo/owl";
+import { useService } from "@web/core/utils/hooks";
+
+const FLAG_LABELS = {
+    seq_scans: "Seq scans",
+    dead_tuples: "Dead tuples",
+    bloat: "Bloat",
+};
+
+export class DbHealth extends Component {
+    static template = "web_shell.DbHealth";
+
+    setup() {
+        this.orm = useService("orm");
+        this.flagLabels = FLAG_LABELS;
+        this.state = useState({
+            loading: false,
+            data: null,
+            error: null,
+            section: 'tables', // 'tables', 'indexes' or 'candidates'
+            sortBy: 'size',
+            filter: "",
+            flaggedOnly: false,
+        });
+
+        onMounted(() => {
+            this.load();
+        });
+    }
+
+    async load() {
+        this.state.loading = true;
+        try {
+            this.state.data = await this.orm.call("web.shell.console", "get_db_health_rpc", [], { limit: 200 });
+            this.state.error = null;
+        } catch (e) {
+            this.state.error = e.message || "Error loading database health";
+        } finally {
+            this.state.loading = false;
+        }
+    }
+
+    get tables() {
+        const filter = this.state.filter.toLowerCase();
+        const sortBy = this.state.sortBy;
+        return this.state.data.tables
+            .filter((t) => !this.state.flaggedOnly || t.flags.length)
+            .filter((t) => !filter || t.table.includes(filter) || t.models.some((m) => m.toLowerCase().includes(filter)))
+            .sort((a, b) => (b[sortBy] || 0) - (a[sortBy] || 0));
+    }
+
+    formatBytes(bytes) {
+        if (bytes === null || bytes === undefined) return "-";
+        if (bytes < 1024) return `${bytes} B`;
+        if (bytes < 1024 * 1024) return `${(bytes / 1024).toFixed(1)} KB`;
+        if (bytes < 1024 * 1024 * 1024) return `${(bytes / 1024 / 1024).toFixed(1)} MB`;
+        return `${(bytes / 1024 / 1024 / 1024).toFixed(2)} GB`;
+    }
+
+    formatRatio(ratio) {
+        return ratio === null || ratio === undefined ? "-" : `${Math.round(ratio * 100)}%`;
+    }
+}
@@ -6,14 +6,17 @@ import { ViewGraph } from "./view_graph";
 import { ModelGraph } from "./model_graph";
 import { ORMProfiler } from "./orm_profiler";
 import { EnvExplorer } from "./env_explorer";
+import { SlowQueries } from "./slow_queries";
+import { BulkRunner } from "./bulk_runner";
+import { DbHealth } from "./db_health";
 
 export class DebugTools extends Component {
     static template = "web_shell.DebugTools";
-    static components = { CacheViewer, ViewGraph, ModelGraph, ORMProfiler, EnvExplorer };
+    static components = { CacheViewer, ViewGraph, ModelGraph, ORMProfiler, EnvExplorer, SlowQueries, BulkRunner, DbHealth };
 
     setup() {
         this.state = useState({
-            activeTab: 'env', // 'env', 'inspector', 'graph', 'models', or 'profiler'
+            activeTab: 'env', // 'env', 'inspector', 'graph', 'models', 'profiler', 'queries', 'bulk' or 'db'
             targetViewId: undefined,
         });
     }
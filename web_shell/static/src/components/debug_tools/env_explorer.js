@@ -12,10 +12,13 @@ export class EnvExplorer extends Component {
             data: null,
             loading: true,
             error: null,
+            ormcache: null,
+            ormcacheWindow: false, // Show deltas since the last reset
         });
 
         onMounted(() => {
             this.loadEnvInfo();
+            this.loadOrmcacheStats();
         });
     }
 
@@ -32,6 +35,40 @@ export class EnvExplorer extends Component {
         }
     }
 
+    async loadOrmcacheStats() {
+        try {
+            this.state.ormcache = await this.orm.call(
+                "web.shell.console",
+                "get_ormcache_stats_rpc",
+                [],
+                { window: this.state.ormcacheWindow, top_keys: 10 }
+            );
+        } catch (e) {
+            this.state.error = e.message || "Error loading ormcache statistics";
+        }
+    }
+
+    async resetOrmcacheWindow() {
+        await this.orm.call("web.shell.console", "reset_ormcache_stats_rpc", [], { track_keys: true });
+        this.state.ormcacheWindow = true;
+        await this.loadOrmcacheStats();
+    }
+
+    async stopOrmcacheWindow() {
+        await this.orm.call("web.shell.console", "stop_ormcache_stats_rpc", []);
+        this.state.ormcacheWindow = false;
+        await this.loadOrmcacheStats();
+    }
+
+    async toggleOrmcacheWindow() {
+        this.state.ormcacheWindow = !this.state.ormcacheWindow;
+        await this.loadOrmcacheStats();
+    }
+
+    formatRatio(ratio) {
+        return ratio === null ? "-" : `${(ratio * 100).toFixed(1)}%`;
+    }
+
     formatContext() {
         if (!this.state.data || !this.state.data.context) {
             return "{}";
@@ -2,6 +2,7 @@
 
 import { Component, useState, onMounted, useRef } from "@odoo/owl";
 import { useService } from "@web/core/utils/hooks";
+import { debounce } from "@web/core/utils/timing";
 
 export class ModelGraph extends Component {
     static template = "web_shell.ModelGraph";
@@ -14,10 +15,19 @@ export class ModelGraph extends Component {
             searchResults: [],
             activeModel: null, // Current central model info
             history: [],       // History of navigated models
+            pathTarget: '',
+            path: null,        // Shortest relation path from the active model
+            pathError: null,
+            deps: null,        // Compute dependencies of the selected field
+            depsLoading: false,
         });
 
+        // Model metadata is static for a given registry, keep what we already fetched
+        this.modelCache = new Map();
+
         this.orm = useService("orm");
         this.searchInputRef = useRef("searchInput");
+        this.onSearchInput = debounce(() => this.searchModels(false), 150);
 
         onMounted(() => {
             if (this.searchInputRef.el) {
@@ -32,21 +42,24 @@ export class ModelGraph extends Component {
         }
     }
 
-    async searchModels() {
+    async searchModels(showLoading = true) {
         const query = this.state.searchQuery.trim().toLowerCase();
-        if (!query) return;
+        if (!query) {
+            this.state.searchResults = [];
+            return;
+        }
 
-        this.state.loading = true;
+        this.state.loading = showLoading;
         this.state.error = null;
 
         try {
-            // Internal Odoo search for models
-            const results = await this.orm.searchRead(
-                "ir.model",
-                [["model", "ilike", query]],
-                ["model", "name"]
+            const { results } = await this.orm.call(
+                "web.shell.console",
+                "omni_search_rpc",
+                [query],
+                { kinds: ["model"], limit: 30 }
             );
-            this.state.searchResults = results;
+            this.state.searchResults = results.map((r) => ({ id: r.model, model: r.model, name: r.name }));
         } catch (e) {
             this.state.error = e.message || "Error searching models";
         } finally {
@@ -54,16 +67,27 @@ export class ModelGraph extends Component {
         }
     }
 
-    async selectModel(modelName) {
-        this.state.loading = true;
-        this.state.error = null;
-
-        try {
+    async fetchModel(modelName) {
+        if (!this.modelCache.has(modelName)) {
             const data = await this.orm.call(
                 "web.shell.console",
                 "get_model_relations_rpc",
                 [modelName]
             );
+            if (data.error) {
+                return data;
+            }
+            this.modelCache.set(modelName, data);
+        }
+        return this.modelCache.get(modelName);
+    }
+
+    async selectModel(modelName) {
+        this.state.loading = true;
+        this.state.error = null;
+
+        try {
+            const data = await this.fetchModel(modelName);
 
             if (data.error) {
                 this.state.error = data.error;
@@ -74,6 +98,9 @@ export class ModelGraph extends Component {
                 this.state.activeModel = data;
                 this.state.searchResults = [];
                 this.state.searchQuery = '';
+                this.state.path = null;
+                this.state.pathError = null;
+                this.state.deps = null;
             }
         } catch (e) {
             this.state.error = e.message || "Error loading model relations";
@@ -95,14 +122,62 @@ export class ModelGraph extends Component {
     async loadModelWithoutHistory(modelName) {
         this.state.loading = true;
         try {
-            const data = await this.orm.call(
+            this.state.activeModel = await this.fetchModel(modelName);
+            this.state.path = null;
+            this.state.pathError = null;
+            this.state.deps = null;
+        } finally {
+            this.state.loading = false;
+        }
+    }
+
+    async showDependencies(fieldName) {
+        if (!this.state.activeModel) return;
+
+        this.state.depsLoading = true;
+        this.state.deps = null;
+        try {
+            this.state.deps = await this.orm.call(
                 "web.shell.console",
-                "get_model_relations_rpc",
-                [modelName]
+                "get_compute_dependencies_rpc",
+                [this.state.activeModel.model, fieldName]
             );
-            this.state.activeModel = data;
+        } catch (e) {
+            this.state.deps = { error: e.message || "Error loading dependencies" };
         } finally {
-            this.state.loading = false;
+            this.state.depsLoading = false;
+        }
+    }
+
+    closeDependencies() {
+        this.state.deps = null;
+    }
+
+    async onPathKeydown(ev) {
+        if (ev.key === "Enter") {
+            await this.findPath();
+        }
+    }
+
+    async findPath() {
+        const target = this.state.pathTarget.trim();
+        if (!target || !this.state.activeModel) return;
+
+        this.state.path = null;
+        this.state.pathError = null;
+        try {
+            const result = await this.orm.call(
+                "web.shell.console",
+                "get_model_path_rpc",
+                [this.state.activeModel.model, target]
+            );
+            if (result.error) {
+                this.state.pathError = result.error;
+            } else {
+                this.state.path = result.path;
+            }
+        } catch (e) {
+            this.state.pathError = e.message || "Error finding relation path";
         }
     }
 
@@ -0,0 +1,64 @@
+/** @odoo-module **/
+
+import { Component, useState, onMounted } from "@odoo/owl";
+import { useService } from "@web/core/utils/hooks";
+
+export class SlowQueries extends Component {
+    static template = "web_shell.SlowQueries";
+
+    setup() {
+        this.orm = useService("orm");
+        this.state = useState({
+            loading: false,
+            data: null,
+            error: null,
+            expanded: null, // Fingerprint of the group showing its example and stack
+            thresholdMs: 500,
+            sampleRate: 0,
+        });
+
+        onMounted(() => {
+            this.load();
+        });
+    }
+
+    async load() {
+        this.state.loading = true;
+        try {
+            const data = await this.orm.call("web.shell.console", "get_query_samples_rpc", [], { group: true, limit: 100 });
+            this.state.data = data;
+            this.state.thresholdMs = data.settings.threshold_ms;
+            this.state.sampleRate = data.settings.sample_rate;
+            this.state.error = null;
+        } catch (e) {
+            this.state.error = e.message || "Error loading query samples";
+        } finally {
+            this.state.loading = false;
+        }
+    }
+
+    async saveSettings() {
+        await this.orm.call("web.shell.console", "set_query_sampler_rpc", [], {
+            threshold_ms: Number(this.state.thresholdMs),
+            sample_rate: Number(this.state.sampleRate),
+        });
+        await this.load();
+    }
+
+    async clear() {
+        await this.orm.call("web.shell.console", "clear_query_samples_rpc", []);
+        this.state.expanded = null;
+        await this.load();
+    }
+
+    toggle(fingerprint) {
+        this.state.expanded = this.state.expanded === fingerprint ? null : fingerprint;
+    }
+
+    formatAge(timestamp) {
+        const seconds = Math.round(Date.now() / 1000 - timestamp);
+        if (seconds < 60) return `${seconds}s ago`;
+        if (seconds < 3600) return `${Math.round(seconds / 60)}m ago`;
+        return `${Math.round(seconds / 3600)}h ago`;
+    }
+}
@@ -2,6 +2,7 @@
 
 import { Component, useState, onMounted, useRef } from "@odoo/owl";
 import { useService } from "@web/core/utils/hooks";
+import { debounce } from "@web/core/utils/timing";
 
 export class ViewGraph extends Component {
     static template = "web_shell.ViewGraph";
@@ -22,11 +23,24 @@ export class ViewGraph extends Component {
             diff: null,
             diffLoading: false,
             showDiffModal: false,
+            modalTab: 'diff', // 'diff', 'tree' or 'arch'
+            arch: null,
+            archLoading: false,
+            treeDiff: null, // Structural diff: { changes, stats }
+            treeDiffLoading: false,
             collapsedNodes: {}, // Track collapsed nodes by ID
+            report: null, // Contribution report of the root's extensions
+            reportLoading: false,
+            showReport: false,
         });
 
+        // Archs are not part of the graph payload, they are fetched per node on demand
+        this.archCache = new Map();
+
         this.orm = useService("orm");
         this.searchInputRef = useRef("searchInput");
+        // Served from the server-side search index, cheap enough to run while typing
+        this.onSearchInput = debounce(() => this.searchViews(false), 150);
 
         onMounted(() => {
             if (this.props.initialViewId) {
@@ -45,13 +59,15 @@ export class ViewGraph extends Component {
         }
     }
 
-    async searchViews() {
+    async searchViews(showLoading = true) {
         const query = this.state.searchQuery.trim();
-        if (!query) return;
+        if (!query) {
+            this.state.searchResults = [];
+            return;
+        }
 
-        this.state.loading = true;
+        this.state.loading = showLoading;
         this.state.error = null;
-        this.state.searchResults = [];
 
         try {
             const results = await this.orm.call(
@@ -76,6 +92,8 @@ export class ViewGraph extends Component {
         this.state.loading = true;
         this.state.error = null;
         this.state.mode = 'tree';
+        this.state.report = null;
+        this.state.showReport = false;
         this.state.selectedNode = null;
         this.state.diff = null;
         this.state.showDiffModal = false;
@@ -113,6 +131,110 @@ export class ViewGraph extends Component {
         }
     }
 
+    async loadArch(viewId) {
+        if (this.archCache.has(viewId)) {
+            this.state.arch = this.archCache.get(viewId);
+            return;
+        }
+
+        this.state.archLoading = true;
+        this.state.arch = null;
+
+        try {
+            const result = await this.orm.call(
+                "web.shell.console",
+                "get_view_arch_rpc",
+                [viewId]
+            );
+            const arch = result.error ? result.error : result.arch;
+            if (!result.error) {
+                this.archCache.set(viewId, arch);
+            }
+            this.state.arch = arch;
+        } catch (e) {
+            this.state.arch = "Error loading arch: " + e.message;
+        } finally {
+            this.state.archLoading = false;
+        }
+    }
+
+    async loadTreeDiff(viewId) {
+        this.state.treeDiffLoading = true;
+        this.state.treeDiff = null;
+
+        try {
+            const result = await this.orm.call(
+                "web.shell.console",
+                "get_view_diff_rpc",
+                [viewId],
+                { mode: "tree" }
+            );
+            this.state.treeDiff = result;
+        } catch (e) {
+            this.state.treeDiff = { error: "Error loading structural diff: " + e.message };
+        } finally {
+            this.state.treeDiffLoading = false;
+        }
+    }
+
+    switchModalTab(tab) {
+        this.state.modalTab = tab;
+        if (!this.state.selectedNode) return;
+        if (tab === 'arch') {
+            this.loadArch(this.state.selectedNode.id);
+        } else if (tab === 'tree' && !this.state.treeDiff) {
+            this.loadTreeDiff(this.state.selectedNode.id);
+        }
+    }
+
+    getChangeClass(op) {
+        switch (op) {
+            case 'insert': return 'bg-success';
+            case 'remove': return 'bg-danger';
+            case 'move': return 'bg-info';
+            default: return 'bg-warning text-dark';
+        }
+    }
+
+    async toggleReport() {
+        this.state.showReport = !this.state.showReport;
+        if (this.state.showReport && !this.state.report && this.state.root) {
+            await this.loadReport(this.state.root.id);
+        }
+    }
+
+    async loadReport(viewId) {
+        this.state.reportLoading = true;
+        try {
+            const result = await this.orm.call(
+                "web.shell.console",
+                "get_view_contributions_rpc",
+                [],
+                { view_id: viewId }
+            );
+            if (result.error) {
+                this.state.error = result.error;
+            } else {
+                this.state.report = result.reports[0];
+            }
+        } catch (e) {
+            this.state.error = e.message || "Error loading contribution report";
+        } finally {
+            this.state.reportLoading = false;
+        }
+    }
+
+    onStepClick(step) {
+        this.state.selectedNode = step;
+        this.state.showDiffModal = true;
+        this.state.modalTab = 'diff';
+        this.state.arch = null;
+        this.state.treeDiff = null;
+        this.state.diff = step.failed
+            ? ["Failed to apply: " + step.error]
+            : step.diff.length ? step.diff : ["No changes contributed by this view"];
+    }
+
     backToSearch() {
         this.state.mode = 'search';
         this.state.root = null;
@@ -125,6 +247,9 @@ export class ViewGraph extends Component {
     onNodeClick(node) {
         this.state.selectedNode = node;
         this.state.showDiffModal = true;
+        this.state.modalTab = 'diff';
+        this.state.arch = null;
+        this.state.treeDiff = null;
         this.loadDiff(node.id);
     }
 
@@ -132,6 +257,8 @@ export class ViewGraph extends Component {
         this.state.showDiffModal = false;
         this.state.selectedNode = null;
         this.state.diff = null;
+        this.state.arch = null;
+        this.state.treeDiff = null;
     }
 
     toggleNode(nodeId, ev) {
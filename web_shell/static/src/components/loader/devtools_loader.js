@@ -0,0 +1,53 @@
+/** @odoo-module **/
+/*
+    Part of Web Shell. See LICENSE file for full copyright and licensing details.
+    Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+*/
+
+import { Component, useState, onMounted, onWillUnmount } from "@odoo/owl";
+import { registry } from "@web/core/registry";
+import { LazyComponent } from "@web/core/assets";
+
+// Everything but these stubs and the systray button lives in this bundle
+export const DEVTOOLS_BUNDLE = "web_shell.assets_devtools";
+
+export class WebShellConsoleLoader extends Component {
+    static template = "web_shell.ConsoleLoader";
+    static components = { LazyComponent };
+    static props = ["*"];
+
+    setup() {
+        this.bundle = DEVTOOLS_BUNDLE;
+    }
+}
+
+export class LogPanelLoader extends Component {
+    static template = "web_shell.LogPanelLoader";
+    static components = { LazyComponent };
+    static props = ["*"];
+
+    setup() {
+        this.bundle = DEVTOOLS_BUNDLE;
+        this.state = useState({ loaded: false });
+        this.onToggle = this.onToggle.bind(this);
+
+        onMounted(() => {
+            window.addEventListener('toggle_log_panel', this.onToggle);
+        });
+
+        onWillUnmount(() => {
+            window.removeEventListener('toggle_log_panel', this.onToggle);
+        });
+    }
+
+    onToggle() {
+        // Once loaded, the panel listens to the toggle event itself
+        window.removeEventListener('toggle_log_panel', this.onToggle);
+        this.state.loaded = true;
+    }
+}
+
+registry.category("actions").add("web_shell.main", WebShellConsoleLoader);
+registry.category("main_components").add("web_shell.LogPanel", {
+    Component: LogPanelLoader,
+});
@@ -12,7 +12,5 @@ export class WebClientRoot extends Component {
     static components = { LogPanel };
 }
 
-// Register as a main component in the web client
-registry.category("main_components").add("web_shell.LogPanel", {
-    Component: LogPanel,
-});
+// Mounted on demand by the LogPanelLoader main component (see loader/)
+registry.category("lazy_components").add("web_shell.LogPanel", LogPanel);
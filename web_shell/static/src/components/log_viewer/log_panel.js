@@ -6,6 +6,12 @@
 
 import { Component, useState, onMounted, onWillUnmount, useRef } from "@odoo/owl";
 import { useService } from "@web/core/utils/hooks";
+import { LogRingBuffer } from "./log_store";
+
+// Rows have a fixed height so the visible window is computed from scrollTop alone
+export const ROW_HEIGHT = 18;
+const OVERSCAN = 20;
+const MAX_LOGS = 100000;
 
 export class LogPanel extends Component {
     static template = "web_shell.LogPanel";
@@ -13,11 +19,18 @@ export class LogPanel extends Component {
 
     setup() {
         this.panelRef = useRef("panelRef");
+        this.contentRef = useRef("contentRef");
+        this.rowHeight = ROW_HEIGHT;
+        this.store = new LogRingBuffer(MAX_LOGS);
         this.orm = useService("orm");
 
         this.state = useState({
-            visible: false,
-            logs: [],
+            visible: Boolean(this.props.startVisible),
+            count: 0, // Mirrors store.size, the store itself is not reactive
+            // Mirrors store.seq: keeps changing once the buffer is full and size no longer does
+            revision: 0,
+            firstRow: 0,
+            followTail: true,
             position: this.loadPosition(),
             width: this.loadWidth(),
             dragging: false,
@@ -33,17 +46,20 @@ export class LogPanel extends Component {
         this.onResizeMove = this.onResizeMove.bind(this);
         this.lastPosition = 0;
         this.pollInterval = null;
+        this.scrollFrame = null;
+        this.togglePanel = this.togglePanel.bind(this);
 
         onMounted(() => {
-            window.addEventListener('toggle_log_panel', this.togglePanel.bind(this));
+            window.addEventListener('toggle_log_panel', this.togglePanel);
             this.updatePolling();
         });
 
         onWillUnmount(() => {
-            window.removeEventListener('toggle_log_panel', this.togglePanel.bind(this));
+            window.removeEventListener('toggle_log_panel', this.togglePanel);
             this.stopPolling();
             this.cleanupDragListeners();
             this.cleanupResizeListeners();
+            cancelAnimationFrame(this.scrollFrame);
         });
     }
 
@@ -67,7 +83,7 @@ export class LogPanel extends Component {
         try {
             const result = await this.orm.call("web.shell.console", "read_logs", [], {
                 last_position: this.lastPosition,
-                max_lines: 100
+                max_lines: 1000
             });
 
             if (result.error) {
@@ -81,16 +97,14 @@ export class LogPanel extends Component {
                 // Append new logs, filtering out read_logs requests
                 for (const log of result.lines) {
                     if (!log.message.includes('/web/dataset/call_kw/web.shell.console/read_logs')) {
-                        this.state.logs.push(log);
+                        this.store.push(log);
                     }
                 }
-                // Limit total logs
-                while (this.state.logs.length > 500) {
-                    this.state.logs.shift();
-                }
+                this.state.count = this.store.size;
+                this.state.revision = this.store.seq;
                 this.lastPosition = result.position;
 
-                if (this.state.visible) {
+                if (this.state.visible && this.state.followTail) {
                     this.scrollToBottom();
                 }
             }
@@ -144,21 +158,54 @@ export class LogPanel extends Component {
     }
 
     clearLogs() {
-        this.state.logs = [];
+        this.store.clear();
+        this.state.count = 0;
+        this.state.revision = 0;
+        this.state.firstRow = 0;
+        this.state.followTail = true;
     }
 
     scrollToBottom() {
         requestAnimationFrame(() => {
-            const panel = this.panelRef.el;
-            if (panel) {
-                const logContent = panel.querySelector('.o_log_panel_content');
-                if (logContent) {
-                    logContent.scrollTop = logContent.scrollHeight;
-                }
+            const logContent = this.contentRef.el;
+            if (logContent) {
+                logContent.scrollTop = logContent.scrollHeight;
+                this.updateWindow();
             }
         });
     }
 
+    // Windowed rendering: only the rows in (or near) the viewport are in the DOM
+    getVisibleRows() {
+        const el = this.contentRef.el;
+        const viewportRows = el ? Math.ceil(el.clientHeight / ROW_HEIGHT) : 40;
+        // Read so the rows re-render on every push, even when count and firstRow stay the same
+        this.state.revision;
+        return this.store.slice(this.state.firstRow, this.state.firstRow + viewportRows + 2 * OVERSCAN);
+    }
+
+    updateWindow() {
+        const el = this.contentRef.el;
+        if (!el) return;
+        const firstRow = Math.max(0, Math.floor(el.scrollTop / ROW_HEIGHT) - OVERSCAN);
+        if (firstRow !== this.state.firstRow) {
+            this.state.firstRow = firstRow;
+        }
+        // Stop following new lines while the user is reading older ones
+        const followTail = el.scrollTop + el.clientHeight >= el.scrollHeight - ROW_HEIGHT;
+        if (followTail !== this.state.followTail) {
+            this.state.followTail = followTail;
+        }
+    }
+
+    onScroll() {
+        if (this.scrollFrame) return;
+        this.scrollFrame = requestAnimationFrame(() => {
+            this.scrollFrame = null;
+            this.updateWindow();
+        });
+    }
+
     // Dragging Logic
     onDragStart(ev) {
         if (ev.target.closest('button')) return;
@@ -0,0 +1,51 @@
+/** @odoo-module **/
+/*
+    Part of Web Shell. See LICENSE file for full copyright and licensing details.
+    Created by MAIKOL AGUILAR (https://github.com/maikCyphlock)
+*/
+
+/**
+ * Fixed-capacity ring buffer for log lines.
+ *
+ * Pushing past the capacity overwrites the oldest line in O(1) instead of
+ * shifting the whole array. Lines get an increasing `seq` used as render key.
+ * The buffer is deliberately kept out of the reactive state: components track
+ * its `size` and read the visible slice on render.
+ */
+export class LogRingBuffer {
+    constructor(capacity = 100000) {
+        this.capacity = capacity;
+        this.clear();
+    }
+
+    clear() {
+        this.items = new Array(this.capacity);
+        this.head = 0;
+        this.size = 0;
+        this.seq = 0;
+    }
+
+    push(item) {
+        item.seq = this.seq++;
+        this.items[(this.head + this.size) % this.capacity] = item;
+        if (this.size < this.capacity) {
+            this.size++;
+        } else {
+            this.head = (this.head + 1) % this.capacity;
+        }
+    }
+
+    get(index) {
+        return this.items[(this.head + index) % this.capacity];
+    }
+
+    slice(start, end) {
+        start = Math.max(0, start);
+        end = Math.min(this.size, end);
+        const result = [];
+        for (let i = start; i < end; i++) {
+            result.push(this.get(i));
+        }
+        return result;
+    }
+}
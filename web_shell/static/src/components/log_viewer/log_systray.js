@@ -7,6 +7,7 @@
 import { Component } from "@odoo/owl";
 import { registry } from "@web/core/registry";
 import { useService } from "@web/core/utils/hooks";
+import { session } from "@web/session";
 
 export class LogViewerSystray extends Component {
     static template = "web_shell.LogViewerSystray";
@@ -25,8 +26,8 @@ export class LogViewerSystray extends Component {
 export const systrayItem = {
     Component: LogViewerSystray,
     isDisplayed: (env) => {
-        // Only show in debug mode
-        return Boolean(odoo.debug);
+        // Only show in debug mode, and only to the admins allowed to read the logs
+        return Boolean(odoo.debug) && Boolean(session.is_system);
     },
 };
 